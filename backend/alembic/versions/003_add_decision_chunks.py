@@ -0,0 +1,41 @@
+"""add decision_chunks for multi-vector embeddings
+
+Revision ID: 6dfcf3740f9d
+Revises: c3a9f2e81d4b
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects import postgresql
+
+revision = "6dfcf3740f9d"
+down_revision = "c3a9f2e81d4b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "decision_chunks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("decision_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("decisions.id"), nullable=False),
+        sa.Column("workspace_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("workspaces.id"), nullable=False),
+        sa.Column("chunk_index", sa.Integer, nullable=False),
+        sa.Column("chunk_type", sa.String, nullable=False),
+        sa.Column("content", sa.Text, nullable=False),
+        sa.Column("embedding", Vector(1024), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("decision_id", "chunk_index", name="uq_decision_chunks_decision_index"),
+    )
+    op.create_index("ix_decision_chunks_decision_id", "decision_chunks", ["decision_id"])
+    op.create_index("ix_decision_chunks_workspace_id", "decision_chunks", ["workspace_id"])
+    op.execute(
+        "CREATE INDEX ix_decision_chunks_embedding ON decision_chunks USING hnsw (embedding vector_cosine_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_decision_chunks_embedding")
+    op.drop_table("decision_chunks")
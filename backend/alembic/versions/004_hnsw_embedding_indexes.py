@@ -0,0 +1,50 @@
+"""replace ivfflat embedding index with tunable hnsw
+
+Revision ID: 72b7d17d1f57
+Revises: 6dfcf3740f9d
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+from app.config import settings
+
+revision = "72b7d17d1f57"
+down_revision = "6dfcf3740f9d"
+branch_labels = None
+depends_on = None
+
+
+def _hnsw_with() -> str:
+    return f"WITH (m = {int(settings.hnsw_m)}, ef_construction = {int(settings.hnsw_ef_construction)})"
+
+
+def _rebuild_index(name: str, table: str, using: str) -> None:
+    # CONCURRENTLY keeps writes flowing while the graph is built; it cannot
+    # run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        op.execute(f"CREATE INDEX CONCURRENTLY {name} ON {table} USING {using}")
+
+
+def upgrade() -> None:
+    # ivfflat centroids were trained on an empty table; hnsw needs no training
+    _rebuild_index(
+        "ix_decisions_embedding", "decisions", f"hnsw (embedding vector_cosine_ops) {_hnsw_with()}"
+    )
+    _rebuild_index(
+        "ix_decision_chunks_embedding",
+        "decision_chunks",
+        f"hnsw (embedding vector_cosine_ops) {_hnsw_with()}",
+    )
+
+
+def downgrade() -> None:
+    _rebuild_index(
+        "ix_decision_chunks_embedding", "decision_chunks", "hnsw (embedding vector_cosine_ops)"
+    )
+    _rebuild_index(
+        "ix_decisions_embedding",
+        "decisions",
+        "ivfflat (embedding vector_cosine_ops) WITH (lists = 100)",
+    )
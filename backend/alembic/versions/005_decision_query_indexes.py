@@ -0,0 +1,84 @@
+"""composite and partial indexes for decision query shapes
+
+Revision ID: c3619d7b1994
+Revises: 72b7d17d1f57
+Create Date: 2026-10-19
+
+- list_decisions: workspace_id + status filter, ORDER BY created_at DESC
+- analytics counts / daily detection count: workspace_id + status,
+  workspace_id + created_at range
+- HYBRID_SEARCH_SQL keyword leg: status = 'active' + search_vector @@ tsquery,
+  bitmap-ANDed with the workspace composite
+
+All indexes are built CONCURRENTLY so the migration does not block writes.
+"""
+
+from alembic import op
+
+revision = "c3619d7b1994"
+down_revision = "72b7d17d1f57"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_decisions_workspace_status_created",
+            "decisions",
+            ["workspace_id", "status", "created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_decisions_workspace_created",
+            "decisions",
+            ["workspace_id", "created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_decisions_active_search_vector",
+            "decisions",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_where="status = 'active'",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Superseded by the composites above, which lead with workspace_id
+        op.drop_index(
+            "ix_decisions_workspace_id",
+            table_name="decisions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_decisions_workspace_id",
+            "decisions",
+            ["workspace_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_decisions_active_search_vector",
+            table_name="decisions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_decisions_workspace_created",
+            table_name="decisions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_decisions_workspace_status_created",
+            table_name="decisions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
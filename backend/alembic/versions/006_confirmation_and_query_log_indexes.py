@@ -0,0 +1,64 @@
+"""indexes for expire_confirmations and query log counts
+
+Revision ID: 65c7b2172838
+Revises: c3619d7b1994
+Create Date: 2026-10-19
+
+- expire_confirmations: status = 'pending' AND expires_at < now()
+- analytics queries_this_week: workspace_id + created_at range
+"""
+
+from alembic import op
+
+revision = "65c7b2172838"
+down_revision = "c3619d7b1994"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_pending_confirmations_pending_expires_at",
+            "pending_confirmations",
+            ["expires_at"],
+            postgresql_where="status = 'pending'",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_query_logs_workspace_created",
+            "query_logs",
+            ["workspace_id", "created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_query_logs_workspace_id",
+            table_name="query_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_query_logs_workspace_id",
+            "query_logs",
+            ["workspace_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_query_logs_workspace_created",
+            table_name="query_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_pending_confirmations_pending_expires_at",
+            table_name="pending_confirmations",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,53 @@
+"""indexes for exact-lookup search routes
+
+Revision ID: 8e41b0c9d2a7
+Revises: 65c7b2172838
+Create Date: 2026-10-19
+
+- decisions by owner: workspace_id + owner_slack_id, newest first
+- decisions in a channel: workspace_id + source_channel_id, newest first
+- decisions linked to a Jira key or PR: link_type + link_title prefix
+"""
+
+from alembic import op
+
+revision = "8e41b0c9d2a7"
+down_revision = "65c7b2172838"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_decisions_workspace_owner_created",
+            "decisions",
+            ["workspace_id", "owner_slack_id", "created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_decisions_workspace_channel_created",
+            "decisions",
+            ["workspace_id", "source_channel_id", "created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_decision_links_type_title",
+            "decision_links",
+            ["link_type", "link_title"],
+            postgresql_ops={"link_title": "varchar_pattern_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in (
+            ("ix_decision_links_type_title", "decision_links"),
+            ("ix_decisions_workspace_channel_created", "decisions"),
+            ("ix_decisions_workspace_owner_created", "decisions"),
+        ):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,89 @@
+"""normalized artifact keys on decision links
+
+Revision ID: 1b7d5e2f90c4
+Revises: 8e41b0c9d2a7
+Create Date: 2026-10-19
+
+Adds workspace_id and artifact_key to decision_links, backfills both for
+existing rows, and replaces the link-title prefix index with a
+(workspace_id, artifact_key) index used to resolve an artifact to decisions.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "1b7d5e2f90c4"
+down_revision = "8e41b0c9d2a7"
+branch_labels = None
+depends_on = None
+
+BACKFILL_WORKSPACE_SQL = """\
+UPDATE decision_links l
+SET workspace_id = d.workspace_id
+FROM decisions d
+WHERE d.id = l.decision_id AND l.workspace_id IS NULL
+"""
+
+# Matches app.integrations.artifacts: Jira keys uppercased, PRs as owner/repo#n
+BACKFILL_JIRA_SQL = """\
+UPDATE decision_links
+SET artifact_key = upper(COALESCE(
+    substring(link_title FROM '^([A-Za-z][A-Za-z0-9]+-[0-9]+):'),
+    substring(link_url FROM '/browse/([A-Za-z][A-Za-z0-9]+-[0-9]+)')
+))
+WHERE link_type = 'jira' AND artifact_key IS NULL
+"""
+
+BACKFILL_GITHUB_SQL = """\
+UPDATE decision_links
+SET artifact_key = lower(substring(link_url FROM 'github\\.com/([^/]+/[^/]+)/pull/'))
+    || '#' || substring(link_url FROM '/pull/([0-9]+)')
+WHERE link_type = 'github_pr' AND artifact_key IS NULL
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "decision_links",
+        sa.Column("workspace_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("workspaces.id"), nullable=True),
+    )
+    op.add_column("decision_links", sa.Column("artifact_key", sa.String, nullable=True))
+    op.execute(BACKFILL_WORKSPACE_SQL)
+    op.execute(BACKFILL_JIRA_SQL)
+    op.execute(BACKFILL_GITHUB_SQL)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_decision_links_workspace_artifact",
+            "decision_links",
+            ["workspace_id", "artifact_key"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_decision_links_type_title",
+            table_name="decision_links",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_decision_links_type_title",
+            "decision_links",
+            ["link_type", "link_title"],
+            postgresql_ops={"link_title": "varchar_pattern_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_decision_links_workspace_artifact",
+            table_name="decision_links",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("decision_links", "artifact_key")
+    op.drop_column("decision_links", "workspace_id")
@@ -0,0 +1,52 @@
+"""thread-to-decision map for duplicate suppression
+
+Revision ID: 4c8a1f6e3b27
+Revises: 1b7d5e2f90c4
+Create Date: 2026-10-19
+
+Adds decision_threads, keyed by (workspace_id, channel_id, thread_ts), and
+fills it with the source thread of every existing decision so live
+processing and backfill skip threads that already produced one.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "4c8a1f6e3b27"
+down_revision = "1b7d5e2f90c4"
+branch_labels = None
+depends_on = None
+
+# The earliest decision wins when a thread already produced several
+BACKFILL_SQL = """\
+INSERT INTO decision_threads (id, workspace_id, channel_id, thread_ts, decision_id, created_at)
+SELECT DISTINCT ON (workspace_id, source_channel_id, source_thread_ts)
+    gen_random_uuid(), workspace_id, source_channel_id, source_thread_ts, id, created_at
+FROM decisions
+WHERE source_channel_id IS NOT NULL AND source_thread_ts IS NOT NULL
+ORDER BY workspace_id, source_channel_id, source_thread_ts, created_at
+ON CONFLICT DO NOTHING
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "decision_threads",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("workspace_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("workspaces.id"), nullable=False),
+        sa.Column("channel_id", sa.String, nullable=False),
+        sa.Column("thread_ts", sa.String, nullable=False),
+        sa.Column("decision_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("decisions.id"), nullable=False),
+        sa.Column("similarity", sa.Float),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint(
+            "workspace_id", "channel_id", "thread_ts", name="uq_decision_threads_workspace_thread"
+        ),
+    )
+    op.create_index("ix_decision_threads_decision_id", "decision_threads", ["decision_id"])
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    op.drop_table("decision_threads")
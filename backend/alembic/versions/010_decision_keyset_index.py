@@ -0,0 +1,52 @@
+"""keyset pagination index for the decision list
+
+Revision ID: 9a3e57d1c6f0
+Revises: 4c8a1f6e3b27
+Create Date: 2026-10-19
+
+Replaces the (workspace_id, created_at) index with (workspace_id,
+created_at, id). The list endpoint orders on (created_at, id) so cursors
+are stable across equal timestamps; the wider index still serves every
+query the old one did.
+"""
+
+from alembic import op
+
+revision = "9a3e57d1c6f0"
+down_revision = "4c8a1f6e3b27"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_decisions_workspace_created_id",
+            "decisions",
+            ["workspace_id", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_decisions_workspace_created",
+            table_name="decisions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_decisions_workspace_created",
+            "decisions",
+            ["workspace_id", "created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_decisions_workspace_created_id",
+            table_name="decisions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
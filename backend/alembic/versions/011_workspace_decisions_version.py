@@ -0,0 +1,28 @@
+"""per-workspace decision change counter
+
+Revision ID: 2f6d0b8a4e15
+Revises: 9a3e57d1c6f0
+Create Date: 2026-10-19
+
+Every decision write bumps workspaces.decisions_version; the decision list
+endpoint derives its ETag from it.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "2f6d0b8a4e15"
+down_revision = "9a3e57d1c6f0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workspaces",
+        sa.Column("decisions_version", sa.BigInteger, nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("workspaces", "decisions_version")
@@ -0,0 +1,42 @@
+"""import key for upserting decisions from other systems
+
+Revision ID: 7d2b9e40a1c8
+Revises: 2f6d0b8a4e15
+Create Date: 2026-10-19
+
+Imported decisions carry the key they had in the source system (an ADR
+path, a spreadsheet row id); re-running an import updates them in place.
+NULLs are distinct, so Slack-detected decisions are unaffected.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "7d2b9e40a1c8"
+down_revision = "2f6d0b8a4e15"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("decisions", sa.Column("import_key", sa.String, nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_decisions_workspace_import_key",
+            "decisions",
+            ["workspace_id", "import_key"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_decisions_workspace_import_key",
+            table_name="decisions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("decisions", "import_key")
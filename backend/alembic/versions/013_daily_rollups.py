@@ -0,0 +1,185 @@
+"""daily decision and query rollups
+
+Revision ID: 5b8c2d7f9e31
+Revises: 7d2b9e40a1c8
+Create Date: 2026-10-19
+
+Per-workspace daily counters (UTC days) for the analytics time series. They
+are kept current by statement-level triggers on decisions and query_logs, so
+every write path (ORM, bulk UPDATE, COPY imports, batched query log inserts)
+is covered with one rollup upsert per statement.
+
+Decisions count as created on their created_at day and as confirmed,
+ignored or expired on the day their status changes to active, ignored or
+expired. The backfill can only approximate the last two with updated_at.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = "5b8c2d7f9e31"
+down_revision = "7d2b9e40a1c8"
+branch_labels = None
+depends_on = None
+
+UTC_DAY = "(now() AT TIME ZONE 'UTC')::date"
+
+DECISIONS_INSERT_FUNCTION = """\
+CREATE FUNCTION decision_daily_stats_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO decision_daily_stats AS s (workspace_id, day, created, confirmed, ignored, expired)
+    SELECT workspace_id, (created_at AT TIME ZONE 'UTC')::date, count(*),
+           count(*) FILTER (WHERE status = 'active'),
+           count(*) FILTER (WHERE status = 'ignored'),
+           count(*) FILTER (WHERE status = 'expired')
+    FROM new_rows
+    GROUP BY 1, 2
+    ON CONFLICT (workspace_id, day) DO UPDATE SET
+        created = s.created + EXCLUDED.created,
+        confirmed = s.confirmed + EXCLUDED.confirmed,
+        ignored = s.ignored + EXCLUDED.ignored,
+        expired = s.expired + EXCLUDED.expired;
+    RETURN NULL;
+END
+$$"""
+
+# Transition tables cannot be combined with UPDATE OF status, so the function
+# compares old and new rows itself; statements that keep the status add nothing.
+DECISIONS_UPDATE_FUNCTION = f"""\
+CREATE FUNCTION decision_daily_stats_update() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO decision_daily_stats AS s (workspace_id, day, confirmed, ignored, expired)
+    SELECT n.workspace_id, {UTC_DAY},
+           count(*) FILTER (WHERE n.status = 'active'),
+           count(*) FILTER (WHERE n.status = 'ignored'),
+           count(*) FILTER (WHERE n.status = 'expired')
+    FROM new_rows n
+    JOIN old_rows o ON o.id = n.id
+    WHERE n.status IS DISTINCT FROM o.status AND n.status IN ('active', 'ignored', 'expired')
+    GROUP BY 1
+    ON CONFLICT (workspace_id, day) DO UPDATE SET
+        confirmed = s.confirmed + EXCLUDED.confirmed,
+        ignored = s.ignored + EXCLUDED.ignored,
+        expired = s.expired + EXCLUDED.expired;
+    RETURN NULL;
+END
+$$"""
+
+QUERY_BUCKETS = """\
+count(*),
+           count(*) FILTER (WHERE response_time_ms < 250),
+           count(*) FILTER (WHERE response_time_ms >= 250 AND response_time_ms < 1000),
+           count(*) FILTER (WHERE response_time_ms >= 1000 AND response_time_ms < 3000),
+           count(*) FILTER (WHERE response_time_ms >= 3000),
+           coalesce(sum(response_time_ms), 0)"""
+
+QUERY_COLUMNS = (
+    "queries, latency_lt_250ms, latency_lt_1s, latency_lt_3s, latency_ge_3s, total_response_ms"
+)
+
+QUERIES_INSERT_FUNCTION = f"""\
+CREATE FUNCTION query_daily_stats_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO query_daily_stats AS s (workspace_id, day, {QUERY_COLUMNS})
+    SELECT workspace_id, (created_at AT TIME ZONE 'UTC')::date, {QUERY_BUCKETS}
+    FROM new_rows
+    GROUP BY 1, 2
+    ON CONFLICT (workspace_id, day) DO UPDATE SET
+        queries = s.queries + EXCLUDED.queries,
+        latency_lt_250ms = s.latency_lt_250ms + EXCLUDED.latency_lt_250ms,
+        latency_lt_1s = s.latency_lt_1s + EXCLUDED.latency_lt_1s,
+        latency_lt_3s = s.latency_lt_3s + EXCLUDED.latency_lt_3s,
+        latency_ge_3s = s.latency_ge_3s + EXCLUDED.latency_ge_3s,
+        total_response_ms = s.total_response_ms + EXCLUDED.total_response_ms;
+    RETURN NULL;
+END
+$$"""
+
+TRIGGERS = [
+    """\
+CREATE TRIGGER decisions_daily_stats_insert AFTER INSERT ON decisions
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION decision_daily_stats_insert()""",
+    """\
+CREATE TRIGGER decisions_daily_stats_update AFTER UPDATE ON decisions
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION decision_daily_stats_update()""",
+    """\
+CREATE TRIGGER query_logs_daily_stats_insert AFTER INSERT ON query_logs
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION query_daily_stats_insert()""",
+]
+
+# Runs after the triggers exist and in the same transaction, which holds off
+# concurrent writes, so no row is counted twice or missed.
+BACKFILL_SQL = [
+    """\
+INSERT INTO decision_daily_stats (workspace_id, day, created, confirmed, ignored, expired)
+SELECT workspace_id, day, sum(created), sum(confirmed), sum(ignored), sum(expired)
+FROM (
+    SELECT workspace_id, (created_at AT TIME ZONE 'UTC')::date AS day,
+           1 AS created, 0 AS confirmed, 0 AS ignored, 0 AS expired
+    FROM decisions
+    UNION ALL
+    SELECT workspace_id, (coalesce(confirmed_at, updated_at) AT TIME ZONE 'UTC')::date,
+           0, 1, 0, 0
+    FROM decisions WHERE status = 'active'
+    UNION ALL
+    SELECT workspace_id, (updated_at AT TIME ZONE 'UTC')::date,
+           0, 0, (status = 'ignored')::int, (status = 'expired')::int
+    FROM decisions WHERE status IN ('ignored', 'expired')
+) events
+GROUP BY workspace_id, day""",
+    f"""\
+INSERT INTO query_daily_stats (workspace_id, day, {QUERY_COLUMNS})
+SELECT workspace_id, (created_at AT TIME ZONE 'UTC')::date, {QUERY_BUCKETS}
+FROM query_logs
+GROUP BY 1, 2""",
+]
+
+
+def _counter(name: str, type_=sa.Integer) -> sa.Column:
+    return sa.Column(name, type_, nullable=False, server_default="0")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "decision_daily_stats",
+        sa.Column("workspace_id", UUID(as_uuid=True), sa.ForeignKey("workspaces.id"), primary_key=True),
+        sa.Column("day", sa.Date, primary_key=True),
+        _counter("created"),
+        _counter("confirmed"),
+        _counter("ignored"),
+        _counter("expired"),
+    )
+    op.create_table(
+        "query_daily_stats",
+        sa.Column("workspace_id", UUID(as_uuid=True), sa.ForeignKey("workspaces.id"), primary_key=True),
+        sa.Column("day", sa.Date, primary_key=True),
+        _counter("queries"),
+        _counter("latency_lt_250ms"),
+        _counter("latency_lt_1s"),
+        _counter("latency_lt_3s"),
+        _counter("latency_ge_3s"),
+        _counter("total_response_ms", sa.BigInteger),
+    )
+    for statement in (
+        DECISIONS_INSERT_FUNCTION,
+        DECISIONS_UPDATE_FUNCTION,
+        QUERIES_INSERT_FUNCTION,
+        *TRIGGERS,
+        *BACKFILL_SQL,
+    ):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS query_logs_daily_stats_insert ON query_logs")
+    op.execute("DROP TRIGGER IF EXISTS decisions_daily_stats_update ON decisions")
+    op.execute("DROP TRIGGER IF EXISTS decisions_daily_stats_insert ON decisions")
+    op.execute("DROP FUNCTION IF EXISTS query_daily_stats_insert()")
+    op.execute("DROP FUNCTION IF EXISTS decision_daily_stats_update()")
+    op.execute("DROP FUNCTION IF EXISTS decision_daily_stats_insert()")
+    op.drop_table("query_daily_stats")
+    op.drop_table("decision_daily_stats")
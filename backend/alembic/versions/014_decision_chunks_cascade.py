@@ -0,0 +1,49 @@
+"""cascade decision chunk deletes
+
+Revision ID: 9e4a1f6c2b70
+Revises: 5b8c2d7f9e31
+Create Date: 2026-10-19
+
+Chunks go away with their decision: hard deletes cascade, and soft deletes
+remove them in the API (app.db.changes.delete_decision_chunks). Chunks that
+soft-deleted decisions already left behind are purged here.
+"""
+
+from alembic import op
+
+revision = "9e4a1f6c2b70"
+down_revision = "5b8c2d7f9e31"
+branch_labels = None
+depends_on = None
+
+FK_NAME = "decision_chunks_decision_id_fkey"
+
+
+def _replace_fk(ondelete: str | None) -> None:
+    # The swap holds an ACCESS EXCLUSIVE lock until commit, so it skips the
+    # scan of existing rows (NOT VALID); VALIDATE then runs in its own
+    # transaction under a lock that lets reads and writes continue.
+    op.drop_constraint(FK_NAME, "decision_chunks", type_="foreignkey")
+    op.create_foreign_key(
+        FK_NAME,
+        "decision_chunks",
+        "decisions",
+        ["decision_id"],
+        ["id"],
+        ondelete=ondelete,
+        postgresql_not_valid=True,
+    )
+    with op.get_context().autocommit_block():
+        op.execute(f"ALTER TABLE decision_chunks VALIDATE CONSTRAINT {FK_NAME}")
+
+
+def upgrade() -> None:
+    _replace_fk("CASCADE")
+    op.execute(
+        "DELETE FROM decision_chunks c USING decisions d "
+        "WHERE d.id = c.decision_id AND d.status = 'deleted'"
+    )
+
+
+def downgrade() -> None:
+    _replace_fk(None)
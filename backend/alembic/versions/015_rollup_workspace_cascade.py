@@ -0,0 +1,33 @@
+"""cascade rollup rows with their workspace
+
+Revision ID: 3c7f0a9d5e12
+Revises: 9e4a1f6c2b70
+Create Date: 2026-10-19
+
+The rollup triggers write a row for every workspace that gets a decision
+or query, so without a cascade those rows block deleting the workspace.
+"""
+
+from alembic import op
+
+revision = "3c7f0a9d5e12"
+down_revision = "9e4a1f6c2b70"
+branch_labels = None
+depends_on = None
+
+ROLLUP_TABLES = ("decision_daily_stats", "query_daily_stats")
+
+
+def _replace_fks(ondelete: str | None) -> None:
+    for table in ROLLUP_TABLES:
+        name = f"{table}_workspace_id_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(name, table, "workspaces", ["workspace_id"], ["id"], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    _replace_fks("CASCADE")
+
+
+def downgrade() -> None:
+    _replace_fks(None)
@@ -0,0 +1,94 @@
+import re
+
+from app.config import settings
+
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+
+
+def _split_long(text: str, max_chars: int) -> list[str]:
+    if len(text) <= max_chars:
+        return [text]
+
+    pieces: list[str] = []
+    current = ""
+    for sentence in re.split(r"(?<=[.!?])\s+", text):
+        while len(sentence) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _thread_windows(messages: list[str], max_chars: int) -> list[str]:
+    windows: list[str] = []
+    current = ""
+    for msg in messages:
+        msg = (msg or "").strip()
+        if not msg:
+            continue
+        for piece in _split_long(msg, max_chars):
+            if current and len(current) + 1 + len(piece) > max_chars:
+                windows.append(current)
+                current = piece
+            else:
+                current = f"{current}\n{piece}" if current else piece
+    if current:
+        windows.append(current)
+    return windows
+
+
+def build_decision_chunks(
+    title: str | None,
+    summary: str | None,
+    rationale: str | None,
+    raw_context: dict | None,
+    max_chunks: int | None = None,
+    max_chars: int | None = None,
+) -> list[dict]:
+    """Split a decision into the texts embedded as its ``decision_chunks``.
+
+    The title/summary chunk always comes first, then rationale paragraphs,
+    then the most substantial thread windows, capped at ``max_chunks``.
+    """
+    max_chunks = max_chunks or settings.max_chunks_per_decision
+    max_chars = max_chars or settings.chunk_max_chars
+
+    chunks: list[dict] = []
+
+    head = " ".join(filter(None, [title, summary])).strip()
+    if head:
+        for piece in _split_long(head, max_chars)[:1]:
+            chunks.append({"chunk_type": "title", "content": piece})
+
+    if rationale:
+        for para in _PARAGRAPH_SPLIT.split(rationale):
+            para = " ".join(para.split())
+            if not para:
+                continue
+            for piece in _split_long(para, max_chars):
+                chunks.append({"chunk_type": "rationale", "content": piece})
+
+    chunks = chunks[:max_chunks]
+
+    remaining = max_chunks - len(chunks)
+    if remaining > 0 and isinstance(raw_context, dict):
+        windows = _thread_windows(raw_context.get("messages") or [], max_chars)
+        # Keep the longest windows but preserve their order in the thread
+        keep = sorted(
+            sorted(range(len(windows)), key=lambda i: len(windows[i]), reverse=True)[:remaining]
+        )
+        for i in keep:
+            chunks.append({"chunk_type": "thread", "content": windows[i]})
+
+    for index, chunk in enumerate(chunks):
+        chunk["chunk_index"] = index
+    return chunks
@@ -8,7 +8,7 @@ log = structlog.get_logger()
 VOYAGE_API_URL = "https://api.voyageai.com/v1/embeddings"
 
 
-async def _call_voyage(text: str, input_type: str) -> list[float]:
+async def _call_voyage(texts: list[str], input_type: str) -> list[list[float]]:
     try:
         async with httpx.AsyncClient(timeout=30) as client:
             resp = await client.post(
@@ -19,21 +19,30 @@ async def _call_voyage(text: str, input_type: str) -> list[float]:
                 },
                 json={
                     "model": "voyage-3",
-                    "input": [text],
+                    "input": texts,
                     "input_type": input_type,
                 },
             )
             resp.raise_for_status()
             data = resp.json()
-            return data["data"][0]["embedding"]
+            items = sorted(data["data"], key=lambda d: d.get("index", 0))
+            return [item["embedding"] for item in items]
     except Exception as exc:
         log.error("voyage_embedding_error", error=str(exc), input_type=input_type)
         return []
 
 
 async def generate_embedding(text: str) -> list[float]:
-    return await _call_voyage(text, input_type="document")
+    embeddings = await _call_voyage([text], input_type="document")
+    return embeddings[0] if embeddings else []
+
+
+async def generate_embeddings(texts: list[str]) -> list[list[float]]:
+    if not texts:
+        return []
+    return await _call_voyage(texts, input_type="document")
 
 
 async def generate_query_embedding(query: str) -> list[float]:
-    return await _call_voyage(query, input_type="query")
+    embeddings = await _call_voyage([query], input_type="query")
+    return embeddings[0] if embeddings else []
@@ -1,12 +1,19 @@
 from fastapi import APIRouter
 
 from app.api.analytics import router as analytics_router
+from app.api.artifacts import router as artifacts_router
 from app.api.decisions import router as decisions_router
+from app.api.export import router as export_router
+from app.api.imports import router as imports_router
 from app.api.search import router as search_router
 from app.api.workspace import router as workspace_router
 
 router = APIRouter(prefix="/api", tags=["api"])
+# Before decisions: /decisions/export must not be captured by /decisions/{decision_id}
+router.include_router(export_router)
+router.include_router(imports_router)
 router.include_router(decisions_router)
 router.include_router(search_router)
 router.include_router(workspace_router)
 router.include_router(analytics_router)
+router.include_router(artifacts_router)
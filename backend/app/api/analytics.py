@@ -1,17 +1,91 @@
+import time
 import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import case, func, select
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.schemas import AnalyticsOverview, CategoryCount, TopOwner
+from app.api.schemas import (
+    AnalyticsOverview,
+    CategoryCount,
+    DecisionDailyPoint,
+    QueryDailyPoint,
+    TopOwner,
+)
 from app.auth.middleware import get_current_user
-from app.db.models import Decision, QueryLog
+from app.config import settings
+from app.db.models import Decision, DecisionDailyStats, QueryDailyStats, QueryLog, Workspace
 from app.db.session import get_db
 
 router = APIRouter()
 
+TOP_OWNERS = 5
+DECISION_COUNTS = ("created", "confirmed", "ignored", "expired")
+
+# workspace_id -> (expires_at, decisions_version, overview). Every status
+# change bumps decisions_version, so a stale entry is never served after one;
+# the TTL only bounds query counts and the sliding seven-day window.
+_overview_cache: dict[uuid.UUID, tuple[float, int, AnalyticsOverview]] = {}
+
+
+def overview_counts_query(workspace_id: uuid.UUID, week_ago: datetime):
+    """Every scalar metric in one pass over the workspace's decisions."""
+    queries_this_week = (
+        select(func.count())
+        .where(QueryLog.workspace_id == workspace_id, QueryLog.created_at >= week_ago)
+        .scalar_subquery()
+    )
+    return select(
+        func.count().filter(Decision.status == "active").label("active"),
+        func.count().filter(Decision.status == "ignored").label("ignored"),
+        func.count().filter(Decision.created_at >= week_ago).label("this_week"),
+        queries_this_week.label("queries_this_week"),
+    ).where(Decision.workspace_id == workspace_id)
+
+
+def breakdowns_query(workspace_id: uuid.UUID):
+    """Owner and category counts of active decisions as two grouping sets."""
+    return (
+        select(
+            Decision.owner_name,
+            Decision.owner_slack_id,
+            Decision.category,
+            func.grouping(Decision.category).label("by_owner"),
+            func.count().label("count"),
+        )
+        .where(Decision.workspace_id == workspace_id, Decision.status == "active")
+        .group_by(
+            func.grouping_sets(
+                tuple_(Decision.owner_name, Decision.owner_slack_id),
+                tuple_(Decision.category),
+            )
+        )
+        .order_by(func.count().desc(), Decision.category, Decision.owner_name)
+    )
+
+
+async def _compute_overview(db: AsyncSession, workspace_id: uuid.UUID) -> AnalyticsOverview:
+    week_ago = datetime.now(timezone.utc) - timedelta(days=7)
+    counts = (await db.execute(overview_counts_query(workspace_id, week_ago))).one()
+    rows = (await db.execute(breakdowns_query(workspace_id))).all()
+
+    reviewed = counts.active + counts.ignored
+    return AnalyticsOverview(
+        total_decisions=counts.active,
+        decisions_this_week=counts.this_week,
+        queries_this_week=counts.queries_this_week,
+        confirmation_rate=round(counts.active / reviewed, 3) if reviewed else 0.0,
+        top_owners=[
+            TopOwner(owner_name=r.owner_name, owner_slack_id=r.owner_slack_id, count=r.count)
+            for r in rows
+            if r.by_owner
+        ][:TOP_OWNERS],
+        decisions_by_category=[
+            CategoryCount(category=r.category, count=r.count) for r in rows if not r.by_owner
+        ],
+    )
+
 
 @router.get("/analytics/overview", response_model=AnalyticsOverview)
 async def analytics_overview(
@@ -19,108 +93,90 @@ async def analytics_overview(
     db: AsyncSession = Depends(get_db),
 ):
     workspace_id = uuid.UUID(user["workspace_id"])
-    week_ago = datetime.now(timezone.utc) - timedelta(days=7)
-
-    # Total active decisions
-    total_decisions = (
+    version = (
         await db.execute(
-            select(func.count(Decision.id)).where(
-                Decision.workspace_id == workspace_id,
-                Decision.status == "active",
-            )
+            select(Workspace.decisions_version).where(Workspace.id == workspace_id)
         )
-    ).scalar_one()
+    ).scalar_one_or_none() or 0
 
-    # Decisions this week
-    decisions_this_week = (
-        await db.execute(
-            select(func.count(Decision.id)).where(
-                Decision.workspace_id == workspace_id,
-                Decision.created_at >= week_ago,
-            )
-        )
-    ).scalar_one()
+    cached = _overview_cache.get(workspace_id)
+    if cached and cached[0] > time.monotonic() and cached[1] == version:
+        return cached[2]
 
-    # Queries this week
-    queries_this_week = (
-        await db.execute(
-            select(func.count(QueryLog.id)).where(
-                QueryLog.workspace_id == workspace_id,
-                QueryLog.created_at >= week_ago,
-            )
-        )
-    ).scalar_one()
+    overview = await _compute_overview(db, workspace_id)
+    _overview_cache[workspace_id] = (
+        time.monotonic() + settings.analytics_cache_ttl_s, version, overview,
+    )
+    return overview
 
-    # Confirmation rate
-    confirmed_count = (
-        await db.execute(
-            select(func.count(Decision.id)).where(
-                Decision.workspace_id == workspace_id,
-                Decision.status == "active",
-            )
-        )
-    ).scalar_one()
 
-    ignored_count = (
-        await db.execute(
-            select(func.count(Decision.id)).where(
-                Decision.workspace_id == workspace_id,
-                Decision.status == "ignored",
-            )
-        )
-    ).scalar_one()
+def _days_since(days: int) -> list[date]:
+    today = datetime.now(timezone.utc).date()
+    return [today - timedelta(days=n) for n in range(days - 1, -1, -1)]
 
-    total_reviewed = confirmed_count + ignored_count
-    confirmation_rate = confirmed_count / total_reviewed if total_reviewed > 0 else 0.0
 
-    # Top owners
-    top_owners_rows = (
+@router.get("/analytics/decisions/daily", response_model=list[DecisionDailyPoint])
+async def decisions_daily(
+    days: int = Query(90, ge=1, le=730),
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Decisions created, confirmed, ignored and expired per UTC day, oldest first.
+
+    Reads only the trigger-maintained rollup; days without activity are zero.
+    """
+    workspace_id = uuid.UUID(user["workspace_id"])
+    series = _days_since(days)
+    rows = (
         await db.execute(
-            select(
-                Decision.owner_name,
-                Decision.owner_slack_id,
-                func.count(Decision.id).label("count"),
-            )
-            .where(
-                Decision.workspace_id == workspace_id,
-                Decision.status == "active",
+            select(DecisionDailyStats).where(
+                DecisionDailyStats.workspace_id == workspace_id,
+                DecisionDailyStats.day >= series[0],
             )
-            .group_by(Decision.owner_name, Decision.owner_slack_id)
-            .order_by(func.count(Decision.id).desc())
-            .limit(5)
         )
-    ).all()
-
-    top_owners = [
-        TopOwner(owner_name=r[0], owner_slack_id=r[1], count=r[2])
-        for r in top_owners_rows
+    ).scalars()
+    by_day = {r.day: r for r in rows}
+    return [
+        DecisionDailyPoint(
+            day=day,
+            **({c: getattr(r, c) for c in DECISION_COUNTS} if (r := by_day.get(day)) else {}),
+        )
+        for day in series
     ]
 
-    # Decisions by category
-    category_rows = (
+
+@router.get("/analytics/queries/daily", response_model=list[QueryDailyPoint])
+async def queries_daily(
+    days: int = Query(90, ge=1, le=730),
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Query volume and latency buckets per UTC day, oldest first."""
+    workspace_id = uuid.UUID(user["workspace_id"])
+    series = _days_since(days)
+    rows = (
         await db.execute(
-            select(
-                Decision.category,
-                func.count(Decision.id).label("count"),
-            )
-            .where(
-                Decision.workspace_id == workspace_id,
-                Decision.status == "active",
+            select(QueryDailyStats).where(
+                QueryDailyStats.workspace_id == workspace_id,
+                QueryDailyStats.day >= series[0],
             )
-            .group_by(Decision.category)
-            .order_by(func.count(Decision.id).desc())
         )
-    ).all()
-
-    decisions_by_category = [
-        CategoryCount(category=r[0], count=r[1]) for r in category_rows
-    ]
-
-    return AnalyticsOverview(
-        total_decisions=total_decisions,
-        decisions_this_week=decisions_this_week,
-        queries_this_week=queries_this_week,
-        confirmation_rate=round(confirmation_rate, 3),
-        top_owners=top_owners,
-        decisions_by_category=decisions_by_category,
+    ).scalars()
+    by_day = {r.day: r for r in rows}
+    return [_query_point(day, by_day.get(day)) for day in series]
+
+
+def _query_point(day: date, stats: QueryDailyStats | None) -> QueryDailyPoint:
+    if stats is None:
+        return QueryDailyPoint(day=day)
+    # total_response_ms only sums queries that recorded a latency
+    timed = stats.latency_lt_250ms + stats.latency_lt_1s + stats.latency_lt_3s + stats.latency_ge_3s
+    return QueryDailyPoint(
+        day=day,
+        queries=stats.queries,
+        latency_lt_250ms=stats.latency_lt_250ms,
+        latency_lt_1s=stats.latency_lt_1s,
+        latency_lt_3s=stats.latency_lt_3s,
+        latency_ge_3s=stats.latency_ge_3s,
+        mean_response_ms=round(stats.total_response_ms / timed, 1) if timed else None,
     )
@@ -0,0 +1,59 @@
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas import ArtifactDecisions, DecisionOut
+from app.api.serialization import ORJSONResponse, parse_fields, validate_rows
+from app.auth.middleware import get_current_user
+from app.db.models import Decision, DecisionLink, Workspace
+from app.db.session import get_db
+from app.integrations.artifacts import normalize_artifact_ref
+
+router = APIRouter()
+
+
+@router.get("/artifacts/decisions", response_model=ArtifactDecisions)
+async def decisions_for_artifact(
+    ref: str = Query(..., min_length=1, description="Jira key, PR reference or URL"),
+    fields: str | None = Query(None, description="Comma-separated DecisionOut fields"),
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    workspace_id = uuid.UUID(user["workspace_id"])
+    columns = parse_fields(fields, DecisionOut)
+
+    artifact_key = normalize_artifact_ref(ref)
+    if artifact_key is None and ref.strip().lstrip("#").isdigit():
+        repo = (
+            await db.execute(
+                select(Workspace.github_org, Workspace.github_repo).where(
+                    Workspace.id == workspace_id
+                )
+            )
+        ).one_or_none()
+        if repo is not None:
+            artifact_key = normalize_artifact_ref(ref, *repo)
+    if artifact_key is None:
+        raise HTTPException(status_code=422, detail="Unrecognized artifact reference")
+
+    rows = (
+        await db.execute(
+            select(*(getattr(Decision, column) for column in columns))
+            .where(
+                Decision.id.in_(
+                    select(DecisionLink.decision_id).where(
+                        DecisionLink.workspace_id == workspace_id,
+                        DecisionLink.artifact_key == artifact_key,
+                    )
+                ),
+                Decision.status != "deleted",
+            )
+            .order_by(Decision.created_at.desc())
+        )
+    ).all()
+
+    return ORJSONResponse(
+        {"artifact_key": artifact_key, "decisions": validate_rows(DecisionOut, columns, rows)}
+    )
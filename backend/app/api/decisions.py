@@ -1,40 +1,93 @@
+import base64
+import json
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from app.api.schemas import (
+    DecisionBulkIn,
+    DecisionBulkOut,
     DecisionDetailOut,
     DecisionOut,
     DecisionUpdateIn,
     PaginatedDecisions,
 )
+from app.api.serialization import ORJSONResponse, parse_fields, validate_rows
 from app.auth.middleware import get_current_user
-from app.db.models import Decision, DecisionLink
+from app.config import settings
+from app.db.changes import bump_decisions_version, delete_decision_chunks
+from app.db.models import Decision, DecisionLink, Workspace
 from app.db.session import get_db
+from app.jobs.queue import enqueue_jobs
+from app.search.index_sync import publish_decision_change, publish_decision_changes
 
 router = APIRouter()
 
+# (workspace_id, *filters) -> (expires_at, decisions_version, total), least
+# recently used first. Only total=cached reads and writes it.
+_count_cache: OrderedDict[tuple, tuple[float, int, int]] = OrderedDict()
 
-@router.get("/decisions", response_model=PaginatedDecisions)
-async def list_decisions(
-    page: int = Query(1, ge=1),
-    per_page: int = Query(20, ge=1, le=100),
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _not_modified(request: Request, response: Response, etag: str) -> bool:
+    response.headers["ETag"] = etag
+    # Browsers revalidate on every fetch and get a 304 while nothing changed
+    response.headers["Cache-Control"] = "private, no-cache"
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def _encode_cursor(decision) -> str:
+    payload = json.dumps([decision.created_at.isoformat(), str(decision.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, decision_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), uuid.UUID(decision_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def decision_list_query(
+    workspace_id: uuid.UUID,
+    columns: tuple[str, ...],
     status: str | None = None,
     category: str | None = None,
     owner_slack_id: str | None = None,
     tag: str | None = None,
     channel_id: str | None = None,
-    date_from: str | None = None,
-    date_to: str | None = None,
-    user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
 ):
-    workspace_id = uuid.UUID(user["workspace_id"])
-    q = select(Decision).where(
+    """The workspace's undeleted decisions matching the list filters, unordered."""
+    # Plain columns, not entities: only the projected fields leave the database
+    q = select(*(getattr(Decision, column) for column in columns)).where(
         Decision.workspace_id == workspace_id,
         Decision.status != "deleted",
     )
@@ -53,29 +106,212 @@ async def list_decisions(
         q = q.where(Decision.created_at >= date_from)
     if date_to:
         q = q.where(Decision.created_at <= date_to)
+    return q
 
-    count_q = select(func.count()).select_from(q.subquery())
-    total = (await db.execute(count_q)).scalar_one()
 
-    q = q.order_by(Decision.created_at.desc())
-    q = q.offset((page - 1) * per_page).limit(per_page)
-    rows = (await db.execute(q)).scalars().all()
+def decision_page_query(
+    q, per_page: int, after: tuple[datetime, uuid.UUID] | None = None, offset: int = 0
+):
+    """One page of ``q``, newest first, plus one row to tell whether more follow."""
+    # (created_at, id) is unique, so cursors stay stable across equal timestamps
+    q = q.order_by(Decision.created_at.desc(), Decision.id.desc())
+    if after:
+        q = q.where(tuple_(Decision.created_at, Decision.id) < after)
+    else:
+        q = q.offset(offset)
+    return q.limit(per_page + 1)
+
+
+def decision_count_query(q):
+    return select(func.count()).select_from(q.subquery())
+
+
+async def _count(db: AsyncSession, q, mode: str, cache_key: tuple, version: int) -> int | None:
+    if mode == "none":
+        return None
+    if mode == "estimate":
+        # Planner row estimate: no scan, but only as good as the table statistics
+        raw = (await db.execute(_Explain(q))).scalar_one()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+        return int(plan["Plan Rows"])
+    if mode == "cached":
+        cached = _count_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic() and cached[1] == version:
+            _count_cache.move_to_end(cache_key)
+            return cached[2]
+    total = (await db.execute(decision_count_query(q))).scalar_one()
+    if mode == "cached":
+        _store_count(cache_key, version, total)
+    return total
 
-    return PaginatedDecisions(
-        items=[DecisionOut.model_validate(r) for r in rows],
-        total=total,
-        page=page,
-        per_page=per_page,
+
+def _store_count(cache_key: tuple, version: int, total: int) -> None:
+    workspace_id = cache_key[0]
+    # Counts from before the workspace's last write can never be served again
+    for key in [k for k, v in _count_cache.items() if k[0] == workspace_id and v[1] != version]:
+        del _count_cache[key]
+    _count_cache[cache_key] = (time.monotonic() + settings.decision_count_cache_ttl_s, version, total)
+    _count_cache.move_to_end(cache_key)
+    while len(_count_cache) > settings.decision_count_cache_size:
+        _count_cache.popitem(last=False)
+
+
+@router.get("/decisions", response_model=PaginatedDecisions)
+async def list_decisions(
+    request: Request,
+    response: Response,
+    page: int = Query(1, ge=1),
+    per_page: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    total: Literal["exact", "cached", "estimate", "none"] | None = None,
+    status: str | None = None,
+    category: str | None = None,
+    owner_slack_id: str | None = None,
+    tag: str | None = None,
+    channel_id: str | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    fields: str | None = Query(None, description="Comma-separated DecisionOut fields"),
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    workspace_id = uuid.UUID(user["workspace_id"])
+    after = _decode_cursor(cursor) if cursor else None
+    # id and created_at are always returned: cursors are built from them
+    columns = parse_fields(fields, DecisionOut, always=("id", "created_at"))
+    version = (
+        await db.execute(
+            select(Workspace.decisions_version).where(Workspace.id == workspace_id)
+        )
+    ).scalar_one_or_none() or 0
+    # Scoped to the workspace so a shared browser cache never crosses tenants
+    etag = f'W/"{workspace_id.hex}-{version}"'
+    if _not_modified(request, response, etag):
+        return Response(status_code=304, headers=dict(response.headers))
+
+    q = decision_list_query(
+        workspace_id,
+        columns,
+        status=status,
+        category=category,
+        owner_slack_id=owner_slack_id,
+        tag=tag,
+        channel_id=channel_id,
+        date_from=date_from,
+        date_to=date_to,
+    )
+
+    # Cursor requests skip the count unless asked; page requests keep the
+    # exact total old clients rely on.
+    cache_key = (workspace_id, status, category, owner_slack_id, tag, channel_id, date_from, date_to)
+    total_count = await _count(db, q, total or ("none" if cursor else "exact"), cache_key, version)
+
+    q = decision_page_query(q, per_page, after=after, offset=(page - 1) * per_page)
+    rows = (await db.execute(q)).all()
+
+    return ORJSONResponse(
+        {
+            "items": validate_rows(DecisionOut, columns, rows[:per_page]),
+            "total": total_count,
+            "page": None if cursor else page,
+            "per_page": per_page,
+            "next_cursor": _encode_cursor(rows[per_page - 1]) if len(rows) > per_page else None,
+        },
+        headers=dict(response.headers),
     )
 
 
+@router.post("/decisions/bulk", response_model=DecisionBulkOut)
+async def bulk_update_decisions(
+    body: DecisionBulkIn,
+    request: Request,
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    workspace_id = uuid.UUID(user["workspace_id"])
+    ids = list(dict.fromkeys(body.ids))
+
+    if body.action == "confirm":
+        values = {
+            "status": "active",
+            "confirmed_at": func.now(),
+            "confirmed_by": user["slack_user_id"],
+        }
+    elif body.action == "ignore":
+        values = {"status": "ignored"}
+    elif body.action == "delete":
+        values = {"status": "deleted"}
+    else:
+        values = {
+            field: getattr(body, field)
+            for field in ("tags", "category")
+            if getattr(body, field) is not None
+        }
+
+    # One set-based UPDATE; ids outside the workspace simply do not match
+    rows = (
+        await db.execute(
+            update(Decision)
+            .where(Decision.id.in_(ids), Decision.workspace_id == workspace_id)
+            .values(**values)
+            .returning(Decision.id, Decision.status)
+            .execution_options(synchronize_session=False)
+        )
+    ).all()
+    statuses = {row.id: row.status for row in rows}
+    if statuses:
+        await bump_decisions_version(db, workspace_id)
+    if body.action == "delete":
+        await delete_decision_chunks(db, list(statuses))
+    await db.commit()
+
+    arq_pool = request.app.state.arq_pool
+    if body.action == "confirm" and statuses:
+        await enqueue_jobs(
+            arq_pool,
+            [
+                (function, (str(decision_id),))
+                for decision_id in statuses
+                for function in ("enrich_decision", "generate_embedding_task")
+            ],
+        )
+    await publish_decision_changes(arq_pool, workspace_id, list(statuses))
+
+    return {
+        "action": body.action,
+        "updated": len(statuses),
+        "results": [
+            {"id": decision_id, "result": "updated", "status": statuses[decision_id]}
+            if decision_id in statuses
+            else {"id": decision_id, "result": "not_found"}
+            for decision_id in ids
+        ],
+    }
+
+
 @router.get("/decisions/{decision_id}", response_model=DecisionDetailOut)
 async def get_decision(
     decision_id: uuid.UUID,
+    request: Request,
+    response: Response,
     user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     workspace_id = uuid.UUID(user["workspace_id"])
+    updated_at = (
+        await db.execute(
+            select(Decision.updated_at).where(
+                Decision.id == decision_id, Decision.workspace_id == workspace_id
+            )
+        )
+    ).scalar_one_or_none()
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail="Decision not found")
+    if _not_modified(
+        request, response, f'W/"{decision_id.hex}-{int(updated_at.timestamp() * 1_000_000)}"'
+    ):
+        return Response(status_code=304, headers=dict(response.headers))
+
     decision = (
         await db.execute(
             select(Decision)
@@ -93,6 +329,7 @@ async def get_decision(
 async def update_decision(
     decision_id: uuid.UUID,
     body: DecisionUpdateIn,
+    request: Request,
     user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -111,15 +348,20 @@ async def update_decision(
     updates = body.model_dump(exclude_unset=True)
     for field, value in updates.items():
         setattr(decision, field, value)
+    if updates.get("status") == "deleted":
+        await delete_decision_chunks(db, [decision.id])
 
+    await bump_decisions_version(db, workspace_id)
     await db.commit()
     await db.refresh(decision)
+    await publish_decision_change(request.app.state.arq_pool, workspace_id, decision.id)
     return DecisionOut.model_validate(decision)
 
 
 @router.delete("/decisions/{decision_id}", status_code=204)
 async def delete_decision(
     decision_id: uuid.UUID,
+    request: Request,
     user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -136,7 +378,10 @@ async def delete_decision(
         raise HTTPException(status_code=404, detail="Decision not found")
 
     decision.status = "deleted"
+    await delete_decision_chunks(db, [decision.id])
+    await bump_decisions_version(db, workspace_id)
     await db.commit()
+    await publish_decision_change(request.app.state.arq_pool, workspace_id, decision.id)
 
 
 @router.post("/decisions/{decision_id}/confirm", response_model=DecisionOut)
@@ -161,12 +406,14 @@ async def confirm_decision(
     decision.status = "active"
     decision.confirmed_at = datetime.now(timezone.utc)
     decision.confirmed_by = user["slack_user_id"]
+    await bump_decisions_version(db, workspace_id)
     await db.commit()
     await db.refresh(decision)
 
     arq_pool = request.app.state.arq_pool
     await arq_pool.enqueue_job("enrich_decision", str(decision.id))
     await arq_pool.enqueue_job("generate_embedding_task", str(decision.id))
+    await publish_decision_change(arq_pool, workspace_id, decision.id)
 
     return DecisionOut.model_validate(decision)
 
@@ -174,6 +421,7 @@ async def confirm_decision(
 @router.post("/decisions/{decision_id}/ignore", response_model=DecisionOut)
 async def ignore_decision(
     decision_id: uuid.UUID,
+    request: Request,
     user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -190,6 +438,8 @@ async def ignore_decision(
         raise HTTPException(status_code=404, detail="Decision not found")
 
     decision.status = "ignored"
+    await bump_decisions_version(db, workspace_id)
     await db.commit()
     await db.refresh(decision)
+    await publish_decision_change(request.app.state.arq_pool, workspace_id, decision.id)
     return DecisionOut.model_validate(decision)
@@ -0,0 +1,260 @@
+import csv
+import io
+import uuid
+from datetime import date, datetime
+from typing import Literal
+
+import orjson
+import structlog
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import REAL, cast, func, literal_column, select, true
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+
+from app.api.schemas import DecisionOut
+from app.auth.middleware import get_current_user
+from app.config import settings
+from app.db.models import Decision, DecisionLink
+from app.db.session import async_session_factory
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: pip install "decision-ledger[export]"
+    pa = pq = None
+
+log = structlog.get_logger()
+
+router = APIRouter()
+
+EXPORT_COLUMNS = tuple(DecisionOut.model_fields)
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _export_query(
+    workspace_id: uuid.UUID,
+    include_embeddings: bool,
+    include_links: bool,
+    status: str | None,
+    date_from: datetime | None,
+    date_to: datetime | None,
+):
+    columns = [getattr(Decision, column) for column in EXPORT_COLUMNS]
+    if include_embeddings:
+        # real[] comes back from asyncpg as a plain list of floats
+        columns.append(cast(Decision.embedding, ARRAY(REAL)).label("embedding"))
+
+    q = select(*columns).where(Decision.workspace_id == workspace_id)
+    q = q.where(Decision.status == status) if status else q.where(Decision.status != "deleted")
+    if date_from:
+        q = q.where(Decision.created_at >= date_from)
+    if date_to:
+        q = q.where(Decision.created_at <= date_to)
+
+    if include_links:
+        # One lateral join aggregates each decision's links; no per-row queries
+        link = func.json_build_object(
+            "link_type", DecisionLink.link_type,
+            "link_url", DecisionLink.link_url,
+            "link_title", DecisionLink.link_title,
+            "artifact_key", DecisionLink.artifact_key,
+            "link_metadata", DecisionLink.link_metadata,
+        )
+        links = (
+            select(
+                func.coalesce(
+                    func.json_agg(aggregate_order_by(link, DecisionLink.created_at)),
+                    literal_column("'[]'::json"),
+                ).label("links")
+            )
+            .where(DecisionLink.decision_id == Decision.id)
+            .lateral("decision_links_agg")
+        )
+        q = q.add_columns(links.c.links).outerjoin(links, true())
+
+    return q.order_by(Decision.created_at, Decision.id)
+
+
+async def _stream_rows(q):
+    """Yield batches of row mappings from a server-side cursor."""
+    async with async_session_factory() as session:
+        result = await session.stream(
+            q.execution_options(yield_per=settings.export_batch_size)
+        )
+        async for batch in result.mappings().partitions():
+            yield batch
+
+
+async def _ndjson(q):
+    option = orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+    async for batch in _stream_rows(q):
+        yield b"".join(orjson.dumps(dict(row), default=str, option=option) for row in batch)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return orjson.dumps(value, default=str).decode()
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+async def _csv(q, header: list[str]):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    async for batch in _stream_rows(q):
+        writer.writerows([_csv_value(row[c]) for c in header] for row in batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands finished bytes back to the response.
+
+    Tracks its own position because the parquet footer records absolute
+    row-group offsets, while the buffer is emptied after every batch.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def _parquet_schema(header: list[str]):
+    timestamp = pa.timestamp("us", tz="UTC")
+    types = {
+        "participants": pa.list_(pa.string()),
+        "tags": pa.list_(pa.string()),
+        "impact_area": pa.list_(pa.string()),
+        "confidence": pa.float64(),
+        "confirmed_at": timestamp,
+        "decision_made_at": timestamp,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "embedding": pa.list_(pa.float32()),
+        "links": pa.list_(
+            pa.struct(
+                [
+                    ("link_type", pa.string()),
+                    ("link_url", pa.string()),
+                    ("link_title", pa.string()),
+                    ("artifact_key", pa.string()),
+                    ("link_metadata", pa.string()),
+                ]
+            )
+        ),
+    }
+    return pa.schema([(column, types.get(column, pa.string())) for column in header])
+
+
+def _parquet_column(column: str, batch) -> list:
+    if column == "id":
+        return [str(row["id"]) for row in batch]
+    if column == "links":
+        # Metadata is free-form JSON, kept as a string so the schema stays fixed
+        return [
+            [
+                {
+                    **link,
+                    "link_metadata": orjson.dumps(link["link_metadata"]).decode()
+                    if link["link_metadata"] is not None
+                    else None,
+                }
+                for link in row["links"]
+            ]
+            for row in batch
+        ]
+    return [row[column] for row in batch]
+
+
+async def _parquet(q, header: list[str]):
+    schema = _parquet_schema(header)
+    sink = _ChunkSink()
+    # One row group per cursor batch: memory is bounded by export_batch_size
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        async for batch in _stream_rows(q):
+            writer.write_table(
+                pa.Table.from_pydict(
+                    {column: _parquet_column(column, batch) for column in header}, schema=schema
+                )
+            )
+            yield sink.drain()
+    yield sink.drain()
+
+
+async def _logged(chunks, workspace_id: uuid.UUID, export_format: str):
+    size = 0
+    try:
+        async for chunk in chunks:
+            size += len(chunk)
+            yield chunk
+    except Exception as exc:
+        # Headers are already sent; the client sees a truncated body
+        log.error("decision_export_failed", workspace_id=str(workspace_id), error=str(exc))
+        raise
+    log.info(
+        "decision_export", workspace_id=str(workspace_id), format=export_format, bytes=size
+    )
+
+
+@router.get("/decisions/export")
+async def export_decisions(
+    export_format: Literal["ndjson", "csv", "parquet"] = Query("ndjson", alias="format"),
+    include_embeddings: bool = False,
+    include_links: bool = False,
+    status: str | None = None,
+    # Parsed before the response starts, so a bad value is a 422 rather than a
+    # database error midway through an already-successful stream
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    user: dict = Depends(get_current_user),
+):
+    if export_format == "parquet" and pa is None:
+        raise HTTPException(
+            status_code=400, detail='Parquet export requires "decision-ledger[export]"'
+        )
+    workspace_id = uuid.UUID(user["workspace_id"])
+    q = _export_query(
+        workspace_id, include_embeddings, include_links, status, date_from, date_to
+    )
+    header = [column.name for column in q.selected_columns]
+
+    if export_format == "ndjson":
+        chunks = _ndjson(q)
+    elif export_format == "csv":
+        chunks = _csv(q, header)
+    else:
+        chunks = _parquet(q, header)
+
+    filename = f"decisions-{date.today().isoformat()}.{export_format}"
+    return StreamingResponse(
+        _logged(chunks, workspace_id, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
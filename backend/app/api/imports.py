@@ -0,0 +1,36 @@
+import io
+import uuid
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from app.api.schemas import DecisionImportOut
+from app.auth.middleware import get_current_user
+from app.db.session import async_session_factory
+from app.jobs.importer import import_decisions, read_records
+
+router = APIRouter()
+
+
+@router.post("/decisions/import", response_model=DecisionImportOut)
+async def import_decisions_endpoint(
+    request: Request,
+    import_format: Literal["ndjson", "csv"] | None = Query(None, alias="format"),
+    user: dict = Depends(get_current_user),
+):
+    # The raw body is the file; ?format= wins over the Content-Type
+    if import_format is None:
+        content_type = request.headers.get("content-type", "")
+        import_format = "csv" if "csv" in content_type else "ndjson"
+    try:
+        # utf-8-sig drops the BOM spreadsheet exports start with
+        body = (await request.body()).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Import body must be UTF-8")
+
+    return await import_decisions(
+        async_session_factory,
+        request.app.state.arq_pool,
+        uuid.UUID(user["workspace_id"]),
+        read_records(io.StringIO(body, newline=""), import_format),
+    )
@@ -1,7 +1,8 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 # --- Decisions ---
@@ -37,6 +38,7 @@ class DecisionLinkOut(BaseModel):
     link_type: str | None = None
     link_url: str
     link_title: str | None = None
+    artifact_key: str | None = None
     link_metadata: dict | None = None
     created_at: datetime
 
@@ -59,16 +61,66 @@ class DecisionUpdateIn(BaseModel):
 
 class PaginatedDecisions(BaseModel):
     items: list[DecisionOut]
-    total: int
-    page: int
+    # None when the request asked for no total (the cursor-mode default)
+    total: int | None
+    page: int | None
     per_page: int
+    next_cursor: str | None = None
+
+
+class DecisionBulkIn(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=500)
+    action: Literal["confirm", "ignore", "delete", "patch"]
+    # Only used by "patch"; at least one must be given
+    tags: list[str] | None = None
+    category: str | None = None
+
+    @model_validator(mode="after")
+    def validate_patch(self) -> "DecisionBulkIn":
+        if self.action == "patch" and self.tags is None and self.category is None:
+            raise ValueError("patch requires tags or category")
+        return self
+
+
+class DecisionBulkResult(BaseModel):
+    id: UUID
+    result: Literal["updated", "not_found"]
+    status: str | None = None
+
+
+class DecisionBulkOut(BaseModel):
+    action: str
+    updated: int
+    results: list[DecisionBulkResult]
+
+
+class ImportRowError(BaseModel):
+    line: int
+    error: str
+
+
+class DecisionImportOut(BaseModel):
+    rows: int
+    inserted: int
+    updated: int
+    failed: int
+    links: int
+    embedding_jobs: int
+    elapsed_s: float
+    rows_per_s: float
+    errors: list[ImportRowError]
+
+
+class ArtifactDecisions(BaseModel):
+    artifact_key: str
+    decisions: list[DecisionOut]
 
 
 # --- Search ---
 
 class SearchFilters(BaseModel):
-    date_from: str | None = None
-    date_to: str | None = None
+    date_from: datetime | None = None
+    date_to: datetime | None = None
     owner_slack_id: str | None = None
     categories: list[str] | None = None
     tags: list[str] | None = None
@@ -80,6 +132,10 @@ class SearchRequest(BaseModel):
     filters: SearchFilters | None = None
     limit: int = Field(default=5, ge=1, le=20)
     offset: int = Field(default=0, ge=0)
+    # HNSW candidate list size: higher trades latency for recall
+    ef_search: int | None = Field(default=None, ge=10, le=1000)
+    # Projection of SearchResultDecision fields; id and combined_score always included
+    fields: list[str] | None = None
 
 
 class SearchResultDecision(BaseModel):
@@ -91,14 +147,34 @@ class SearchResultDecision(BaseModel):
     tags: list[str] | None = None
     source_url: str | None = None
     created_at: str | None = None
+    decision_made_at: str | None = None
     combined_score: float
 
 
+class SearchTimings(BaseModel):
+    lookup_ms: float | None = None
+    keyword_ms: float | None = None
+    embedding_wait_ms: float | None = None
+    vector_ms: float | None = None
+    fusion_ms: float | None = None
+    hydration_ms: float | None = None
+    links_ms: float | None = None
+    synthesis_ms: float | None = None
+
+
 class SearchResponse(BaseModel):
     answer: str
     decisions: list[SearchResultDecision]
+    # Results available to page through. Hybrid search ranks at most
+    # 2 x SEARCH_CANDIDATE_LIMIT, so this is not a count of every match.
     total_count: int
+    # True when the vector leg was skipped because the query embedding missed
+    # its deadline or failed; results then come from keyword and tag matches.
+    degraded: bool = False
+    # "lookup" for structured queries answered without embeddings or the LLM
+    route: str = "hybrid"
     response_time_ms: int
+    timings: SearchTimings
 
 
 # --- Workspace ---
@@ -113,15 +189,40 @@ class WorkspaceOut(BaseModel):
     jira_domain: str | None = None
     github_org: str | None = None
     github_repo: str | None = None
+    settings: dict | None = None
     created_at: datetime
     updated_at: datetime
 
     model_config = {"from_attributes": True}
 
 
+class FusionWeights(BaseModel):
+    vector: float | None = Field(default=None, ge=0)
+    keyword: float | None = Field(default=None, ge=0)
+    tag: float | None = Field(default=None, ge=0)
+
+    model_config = {"extra": "forbid"}
+
+
+class SearchSettings(BaseModel):
+    ef_search: int | None = Field(default=None, ge=10, le=1000)
+    fusion_mode: Literal["rrf", "minmax", "weighted"] | None = None
+    fusion_weights: FusionWeights | None = None
+
+    model_config = {"extra": "forbid"}
+
+
 class WorkspaceSettingsUpdate(BaseModel):
     settings: dict
 
+    @field_validator("settings")
+    @classmethod
+    def validate_search_settings(cls, value: dict) -> dict:
+        if "search" in value:
+            search = SearchSettings.model_validate(value["search"] or {})
+            value = {**value, "search": search.model_dump(exclude_none=True)}
+        return value
+
 
 class ChannelOut(BaseModel):
     id: UUID
@@ -170,3 +271,22 @@ class AnalyticsOverview(BaseModel):
     confirmation_rate: float
     top_owners: list[TopOwner]
     decisions_by_category: list[CategoryCount]
+
+
+class DecisionDailyPoint(BaseModel):
+    day: date
+    created: int = 0
+    confirmed: int = 0
+    ignored: int = 0
+    expired: int = 0
+
+
+class QueryDailyPoint(BaseModel):
+    day: date
+    queries: int = 0
+    latency_lt_250ms: int = 0
+    latency_lt_1s: int = 0
+    latency_lt_3s: int = 0
+    latency_ge_3s: int = 0
+    mean_response_ms: float | None = None
+
@@ -1,11 +1,19 @@
 import uuid
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.schemas import SearchRequest, SearchResponse, SearchResultDecision
+from app.api.schemas import (
+    SearchRequest,
+    SearchResponse,
+    SearchResultDecision,
+    SearchTimings,
+)
+from app.api.serialization import ORJSONResponse, parse_fields, validate_rows
 from app.auth.middleware import get_current_user
 from app.db.session import get_db
+from app.search.engine import max_ranked_results
+from app.search.hydration import HYDRATE_COLUMNS
 from app.search.query_handler import handle_decision_query
 
 router = APIRouter()
@@ -17,21 +25,40 @@ async def search_decisions(
     user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    # Hybrid search only ranks this many results, so deeper pages are always empty
+    if body.offset >= max_ranked_results():
+        raise HTTPException(
+            status_code=422, detail=f"offset must be below {max_ranked_results()}"
+        )
+
     workspace_id = user["workspace_id"]
+    fields = parse_fields(body.fields, SearchResultDecision, always=("id", "combined_score"))
 
     filters = {}
     if body.filters:
         filters = body.filters.model_dump(exclude_none=True)
 
     result = await handle_decision_query(
-        db, workspace_id, body.query, user["slack_user_id"], source="api"
+        db,
+        workspace_id,
+        body.query,
+        user["slack_user_id"],
+        source="api",
+        filters=filters,
+        limit=body.limit,
+        offset=body.offset,
+        ef_search=body.ef_search,
+        columns=tuple(c for c in HYDRATE_COLUMNS if c in fields),
     )
 
-    decisions = [SearchResultDecision(**d) for d in result["decisions"]]
-
-    return SearchResponse(
-        answer=result["answer"],
-        decisions=decisions,
-        total_count=len(decisions),
-        response_time_ms=result["response_time_ms"],
+    return ORJSONResponse(
+        {
+            "answer": result["answer"],
+            "decisions": validate_rows(SearchResultDecision, fields, result["decisions"]),
+            "total_count": result["total_count"],
+            "degraded": result["degraded"],
+            "route": result["route"],
+            "response_time_ms": result["response_time_ms"],
+            "timings": SearchTimings(**result["timings"]).model_dump(),
+        }
     )
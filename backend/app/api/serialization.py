@@ -0,0 +1,62 @@
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from fastapi import HTTPException
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import JSONResponse
+from typing_extensions import TypedDict
+
+
+class ORJSONResponse(JSONResponse):
+    """Renders already-validated rows with orjson.
+
+    Only returned explicitly by the row-heavy endpoints. It is not the app's
+    default_response_class, because FastAPI's own response_model path already
+    serializes straight to bytes and a custom default would bypass that.
+    """
+
+    def render(self, content: Any) -> bytes:
+        # OPT_UTC_Z keeps timestamps identical to pydantic's ("...Z"); str
+        # covers asyncpg's UUID subclass, which orjson does not recognise
+        return orjson.dumps(content, default=str, option=orjson.OPT_UTC_Z)
+
+
+def parse_fields(
+    fields: str | list[str] | None, model: type[BaseModel], always: tuple[str, ...] = ("id",)
+) -> tuple[str, ...]:
+    """Resolve a ``fields=`` projection to a tuple of model field names.
+
+    ``None`` means every field. Names in ``always`` are included regardless,
+    and the result keeps the model's field order so it works as a cache key.
+    """
+    if fields is None:
+        return tuple(model.model_fields)
+    requested = {f.strip() for f in (fields.split(",") if isinstance(fields, str) else fields)}
+    requested.discard("")
+    unknown = requested - model.model_fields.keys()
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    requested.update(always)
+    return tuple(f for f in model.model_fields if f in requested)
+
+
+@lru_cache(maxsize=128)
+def rows_adapter(model: type[BaseModel], fields: tuple[str, ...]) -> TypeAdapter:
+    """Cached list validator for a projection of ``model``.
+
+    Validating into a TypedDict yields plain dicts that orjson can write
+    directly, so each page is one pydantic call instead of one per row.
+    """
+    row = TypedDict(
+        f"{model.__name__}Row",
+        {f: model.model_fields[f].annotation for f in fields},
+        total=False,
+    )
+    return TypeAdapter(list[row])
+
+
+def validate_rows(model: type[BaseModel], fields: tuple[str, ...], rows) -> list[dict]:
+    return rows_adapter(model, fields).validate_python(
+        [row if isinstance(row, dict) else dict(row._mapping) for row in rows]
+    )
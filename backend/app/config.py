@@ -15,6 +15,31 @@ class Settings(BaseSettings):
     api_url: str = "http://localhost:8000"
     jwt_secret: str = "change-me"
     encryption_key: str = "change-me-32-bytes-long-key-here"
+    max_chunks_per_decision: int = 8
+    chunk_max_chars: int = 1200
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 64
+    hnsw_ef_search: int = 40
+    search_candidate_limit: int = 50
+    search_fusion_mode: str = "weighted"
+    search_rrf_k: int = 60
+    search_embedding_deadline_ms: int = 800
+    vector_index_enabled: bool = False
+    vector_index_snapshot_dir: str = ""
+    search_keyword_engine: str = "postgres"
+    bm25_k1: float = 1.2
+    bm25_b: float = 0.75
+    search_index_check_interval_s: int = 300
+    tag_dictionary_ttl_s: int = 300
+    duplicate_similarity_threshold: float = 0.92
+    decision_count_cache_ttl_s: int = 60
+    decision_count_cache_size: int = 1024
+    export_batch_size: int = 1000
+    import_batch_size: int = 1000
+    analytics_cache_ttl_s: int = 60
+    query_log_buffer_size: int = 10000
+    query_log_batch_size: int = 200
+    query_log_flush_interval_s: float = 2.0
 
 
 settings = Settings()
@@ -0,0 +1,33 @@
+import uuid
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Plain SQL so the bump does not touch workspaces.updated_at
+BUMP_DECISIONS_VERSION_SQL = text(
+    "UPDATE workspaces SET decisions_version = decisions_version + 1 WHERE id = :workspace_id"
+)
+
+
+async def bump_decisions_version(session: AsyncSession, workspace_id: uuid.UUID) -> None:
+    """Invalidate the workspace's decision list ETags.
+
+    Call inside the transaction that writes the decision, so readers never
+    see the new counter with the old rows.
+    """
+    await session.execute(BUMP_DECISIONS_VERSION_SQL, {"workspace_id": workspace_id})
+
+
+DELETE_DECISION_CHUNKS_SQL = text(
+    "DELETE FROM decision_chunks WHERE decision_id = ANY(:decision_ids)"
+)
+
+
+async def delete_decision_chunks(session: AsyncSession, decision_ids: list[uuid.UUID]) -> None:
+    """Drop the chunk embeddings of soft-deleted decisions.
+
+    Deletion only flips the status, so the rows would otherwise stay in the
+    chunk HNSW index for good.
+    """
+    if decision_ids:
+        await session.execute(DELETE_DECISION_CHUNKS_SQL, {"decision_ids": decision_ids})
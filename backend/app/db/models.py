@@ -1,11 +1,13 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     Computed,
+    Date,
     DateTime,
     Float,
     ForeignKey,
@@ -15,6 +17,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import ARRAY, JSON, JSONB, UUID
@@ -43,6 +46,8 @@ class Workspace(Base):
     github_org: Mapped[str | None] = mapped_column(String)
     github_repo: Mapped[str | None] = mapped_column(String)
     github_token: Mapped[str | None] = mapped_column(Text)
+    # Bumped by every decision write; the decision list ETag is derived from it
+    decisions_version: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0", default=0)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -94,8 +99,18 @@ class Decision(Base):
         Index("ix_decisions_tags", "tags", postgresql_using="gin"),
         Index("ix_decisions_impact_area", "impact_area", postgresql_using="gin"),
         Index("ix_decisions_search_vector", "search_vector", postgresql_using="gin"),
-        Index("ix_decisions_workspace_id", "workspace_id"),
         Index("ix_decisions_participants", "participants", postgresql_using="gin"),
+        Index("ix_decisions_workspace_status_created", "workspace_id", "status", "created_at"),
+        Index("ix_decisions_workspace_created_id", "workspace_id", "created_at", "id"),
+        Index("ix_decisions_workspace_owner_created", "workspace_id", "owner_slack_id", "created_at"),
+        Index("ix_decisions_workspace_channel_created", "workspace_id", "source_channel_id", "created_at"),
+        Index("ix_decisions_workspace_import_key", "workspace_id", "import_key", unique=True),
+        Index(
+            "ix_decisions_active_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=text("status = 'active'"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -110,16 +125,21 @@ class Decision(Base):
     source_channel_id: Mapped[str | None] = mapped_column(String)
     source_channel_name: Mapped[str | None] = mapped_column(String)
     source_thread_ts: Mapped[str | None] = mapped_column(String)
+    # Key in the system a decision was imported from; see app.jobs.importer
+    import_key: Mapped[str | None] = mapped_column(String)
     tags = mapped_column(ARRAY(String), nullable=True)
     impact_area = mapped_column(ARRAY(String), nullable=True)
     category: Mapped[str | None] = mapped_column(String)
     confidence: Mapped[float | None] = mapped_column(Float)
-    embedding = mapped_column(Vector(1024), nullable=True)
+    # The embedding, thread context and tsvector are never part of an API
+    # response; ORM reads skip them and the jobs that need them undefer them.
+    # Column-level selects (search, vector index) are unaffected.
+    embedding = mapped_column(Vector(1024), nullable=True, deferred=True, deferred_raiseload=True)
     status: Mapped[str] = mapped_column(String, default="pending")
     confirmed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     confirmed_by: Mapped[str | None] = mapped_column(String)
     participants = mapped_column(ARRAY(String), nullable=True)
-    raw_context = mapped_column(JSON, nullable=True)
+    raw_context = mapped_column(JSON, nullable=True, deferred=True, deferred_raiseload=True)
     decision_made_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -127,28 +147,77 @@ class Decision(Base):
         TSVECTOR,
         Computed("to_tsvector('english', coalesce(title, '') || ' ' || coalesce(summary, '') || ' ' || coalesce(rationale, ''))"),
         nullable=True,
+        deferred=True,
+        deferred_raiseload=True,
     )
 
     workspace: Mapped["Workspace"] = relationship(back_populates="decisions")
     links: Mapped[list["DecisionLink"]] = relationship(back_populates="decision")
     raw_messages: Mapped[list["RawMessage"]] = relationship(back_populates="decision")
     pending_confirmations: Mapped[list["PendingConfirmation"]] = relationship(back_populates="decision")
+    chunks: Mapped[list["DecisionChunk"]] = relationship(back_populates="decision")
+
+
+class DecisionChunk(Base):
+    __tablename__ = "decision_chunks"
+    __table_args__ = (
+        UniqueConstraint("decision_id", "chunk_index", name="uq_decision_chunks_decision_index"),
+        Index("ix_decision_chunks_workspace_id", "workspace_id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    decision_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("decisions.id", ondelete="CASCADE"), nullable=False, index=True)
+    workspace_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False)
+    chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    chunk_type: Mapped[str] = mapped_column(String, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    embedding = mapped_column(Vector(1024), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    decision: Mapped["Decision"] = relationship(back_populates="chunks")
 
 
 class DecisionLink(Base):
     __tablename__ = "decision_links"
+    __table_args__ = (
+        Index("ix_decision_links_workspace_artifact", "workspace_id", "artifact_key"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     decision_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("decisions.id"), nullable=False, index=True)
+    workspace_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("workspaces.id"))
     link_type: Mapped[str | None] = mapped_column(String)
     link_url: Mapped[str] = mapped_column(Text, nullable=False)
     link_title: Mapped[str | None] = mapped_column(String)
+    # Normalized reference ("PROJ-1234", "owner/repo#812"); see app.integrations.artifacts
+    artifact_key: Mapped[str | None] = mapped_column(String)
     link_metadata = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     decision: Mapped["Decision"] = relationship(back_populates="links")
 
 
+class DecisionThread(Base):
+    """Slack threads already resolved to a decision, checked before detection."""
+
+    __tablename__ = "decision_threads"
+    __table_args__ = (
+        UniqueConstraint(
+            "workspace_id", "channel_id", "thread_ts", name="uq_decision_threads_workspace_thread"
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    workspace_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False)
+    channel_id: Mapped[str] = mapped_column(String, nullable=False)
+    thread_ts: Mapped[str] = mapped_column(String, nullable=False)
+    decision_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("decisions.id"), nullable=False, index=True)
+    # Set when the thread was matched to an existing decision by embedding
+    # similarity instead of producing the decision itself
+    similarity: Mapped[float | None] = mapped_column(Float)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
 class RawMessage(Base):
     __tablename__ = "raw_messages"
 
@@ -171,9 +240,12 @@ class RawMessage(Base):
 
 class QueryLog(Base):
     __tablename__ = "query_logs"
+    __table_args__ = (
+        Index("ix_query_logs_workspace_created", "workspace_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    workspace_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False, index=True)
+    workspace_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False)
     user_slack_id: Mapped[str | None] = mapped_column(String)
     query_text: Mapped[str | None] = mapped_column(Text)
     results_count: Mapped[int | None] = mapped_column(Integer)
@@ -185,8 +257,41 @@ class QueryLog(Base):
     workspace: Mapped["Workspace"] = relationship(back_populates="query_logs")
 
 
+# Daily rollups maintained by triggers on decisions and query_logs (migration
+# 013); the application only reads them.
+class DecisionDailyStats(Base):
+    __tablename__ = "decision_daily_stats"
+
+    workspace_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    created: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    confirmed: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    ignored: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    expired: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+
+
+class QueryDailyStats(Base):
+    __tablename__ = "query_daily_stats"
+
+    workspace_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    queries: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    latency_lt_250ms: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    latency_lt_1s: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    latency_lt_3s: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    latency_ge_3s: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    total_response_ms: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+
+
 class PendingConfirmation(Base):
     __tablename__ = "pending_confirmations"
+    __table_args__ = (
+        Index(
+            "ix_pending_confirmations_pending_expires_at",
+            "expires_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     workspace_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False, index=True)
@@ -0,0 +1,40 @@
+import re
+
+# Normalized artifact keys stored on decision_links.artifact_key:
+#   Jira issue   -> "PROJ-1234"
+#   GitHub PR    -> "owner/repo#812" (owner and repo lowercased)
+
+_JIRA_KEY = re.compile(r"^([A-Za-z][A-Za-z0-9]+-\d+)$")
+_JIRA_BROWSE_URL = re.compile(r"/browse/([A-Za-z][A-Za-z0-9]+-\d+)")
+_PR_REF = re.compile(r"^([\w.\-]+)/([\w.\-]+)#(\d+)$")
+_PR_URL = re.compile(r"github\.com/([^/\s]+)/([^/\s]+)/pull/(\d+)")
+_SHORT_PR = re.compile(r"^#?(\d+)$")
+
+
+def jira_artifact_key(issue_key: str) -> str:
+    return issue_key.upper()
+
+
+def github_artifact_key(owner: str, repo: str, number: int | str) -> str:
+    return f"{owner.lower()}/{repo.lower()}#{int(number)}"
+
+
+def normalize_artifact_ref(
+    ref: str, default_owner: str | None = None, default_repo: str | None = None
+) -> str | None:
+    """Turn a user-supplied Jira key, PR reference or URL into an artifact key.
+
+    Bare PR numbers ("812", "#812") resolve against the workspace's default
+    GitHub repository and return None when it is not configured.
+    """
+    ref = ref.strip()
+    if match := _JIRA_KEY.match(ref):
+        return jira_artifact_key(match.group(1))
+    if match := _JIRA_BROWSE_URL.search(ref):
+        return jira_artifact_key(match.group(1))
+    if match := _PR_URL.search(ref) or _PR_REF.match(ref):
+        return github_artifact_key(*match.groups())
+    if match := _SHORT_PR.match(ref):
+        if default_owner and default_repo:
+            return github_artifact_key(default_owner, default_repo, match.group(1))
+    return None
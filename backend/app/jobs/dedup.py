@@ -0,0 +1,103 @@
+import uuid
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ai.embeddings import generate_embedding
+from app.config import settings
+from app.db.models import DecisionThread
+
+# Nearest existing decision by the HNSW index; pending decisions have no
+# embedding until confirmed, so only embedded ones can be matched.
+SIMILAR_DECISION_SQL = text("""\
+SELECT id, 1 - (embedding <=> CAST(:embedding AS vector)) AS similarity
+FROM decisions
+WHERE workspace_id = CAST(:workspace_id AS uuid)
+  AND status = 'active'
+  AND embedding IS NOT NULL
+ORDER BY embedding <=> CAST(:embedding AS vector)
+LIMIT 1
+""")
+
+
+async def thread_decision(
+    session: AsyncSession, workspace_id: uuid.UUID, channel_id: str, thread_ts: str
+) -> uuid.UUID | None:
+    return (
+        await session.execute(
+            select(DecisionThread.decision_id).where(
+                DecisionThread.workspace_id == workspace_id,
+                DecisionThread.channel_id == channel_id,
+                DecisionThread.thread_ts == thread_ts,
+            )
+        )
+    ).scalar_one_or_none()
+
+
+async def handled_threads(
+    session: AsyncSession, workspace_id: uuid.UUID, channel_id: str, thread_ts: list[str]
+) -> set[str]:
+    if not thread_ts:
+        return set()
+    return set(
+        (
+            await session.execute(
+                select(DecisionThread.thread_ts).where(
+                    DecisionThread.workspace_id == workspace_id,
+                    DecisionThread.channel_id == channel_id,
+                    DecisionThread.thread_ts.in_(thread_ts),
+                )
+            )
+        ).scalars()
+    )
+
+
+async def record_thread(
+    session: AsyncSession,
+    workspace_id: uuid.UUID,
+    channel_id: str,
+    thread_ts: str,
+    decision_id: uuid.UUID,
+    similarity: float | None = None,
+) -> None:
+    await session.execute(
+        insert(DecisionThread)
+        .values(
+            id=uuid.uuid4(),
+            workspace_id=workspace_id,
+            channel_id=channel_id,
+            thread_ts=thread_ts,
+            decision_id=decision_id,
+            similarity=similarity,
+        )
+        .on_conflict_do_nothing(constraint="uq_decision_threads_workspace_thread")
+    )
+
+
+async def find_duplicate_decision(
+    session: AsyncSession, workspace_id: uuid.UUID, messages: list[dict]
+) -> tuple[uuid.UUID, float] | None:
+    """Existing decision this thread most likely restates, if any.
+
+    One embedding call stands in for a full extraction when a new thread
+    rehashes something already in the ledger.
+    """
+    if settings.duplicate_similarity_threshold > 1:
+        return None
+    thread_text = "\n".join(m["text"] for m in messages if m.get("text"))
+    if not thread_text.strip():
+        return None
+    embedding = await generate_embedding(thread_text)
+    if not embedding:
+        return None
+
+    row = (
+        await session.execute(
+            SIMILAR_DECISION_SQL,
+            {"workspace_id": str(workspace_id), "embedding": str(embedding)},
+        )
+    ).first()
+    if row is None or row.similarity < settings.duplicate_similarity_threshold:
+        return None
+    return row.id, float(row.similarity)
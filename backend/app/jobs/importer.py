@@ -0,0 +1,329 @@
+"""Bulk import of decisions from other systems (ADR repos, spreadsheets).
+
+Rows are validated in batches, COPY'd into a temporary staging table and
+upserted into ``decisions`` and ``decision_links`` by one statement per
+batch. Each batch commits on its own, so a bad row never costs the rows
+around it; it is reported with its line number instead.
+"""
+
+import csv
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import Literal
+
+import orjson
+import structlog
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.db.changes import bump_decisions_version
+from app.integrations.artifacts import normalize_artifact_ref
+from app.jobs.queue import enqueue_jobs
+from app.search import tag_dictionary
+from app.search.index_sync import publish_decision_changes
+
+log = structlog.get_logger()
+
+
+class DecisionImportLink(BaseModel):
+    link_url: str = Field(min_length=1)
+    link_type: str | None = None
+    link_title: str | None = None
+
+
+class DecisionImportRow(BaseModel):
+    # Key in the source system; re-importing the same key updates the decision
+    external_id: str | None = None
+    title: str = Field(min_length=1)
+    summary: str | None = None
+    rationale: str | None = None
+    owner_slack_id: str | None = None
+    owner_name: str | None = None
+    source_type: str = "import"
+    source_url: str | None = None
+    tags: list[str] | None = None
+    impact_area: list[str] | None = None
+    category: str | None = None
+    status: Literal["active", "pending"] = "active"
+    decision_made_at: datetime | None = None
+    created_at: datetime | None = None
+    links: list[DecisionImportLink] = []
+
+    @field_validator("tags", "impact_area", mode="before")
+    @classmethod
+    def split_list(cls, value):
+        # CSV cells hold a JSON array or a comma-separated list
+        if isinstance(value, str):
+            if value.lstrip().startswith("["):
+                return json.loads(value)
+            return [item.strip() for item in value.split(",") if item.strip()]
+        return value
+
+    @field_validator("links", mode="before")
+    @classmethod
+    def split_links(cls, value):
+        # CSV cells hold a JSON array or whitespace-separated URLs
+        if isinstance(value, str):
+            if value.lstrip().startswith("["):
+                return json.loads(value)
+            return [{"link_url": url} for url in value.split()]
+        return value
+
+
+_rows_adapter = TypeAdapter(list[DecisionImportRow])
+
+STAGING_TABLE = "decision_import_staging"
+
+CREATE_STAGING_SQL = text(f"""\
+CREATE TEMP TABLE {STAGING_TABLE} (
+    line integer NOT NULL,
+    import_key text NOT NULL,
+    title text NOT NULL,
+    summary text,
+    rationale text,
+    owner_slack_id text,
+    owner_name text,
+    source_type text,
+    source_url text,
+    tags text[],
+    impact_area text[],
+    category text,
+    status text NOT NULL,
+    decision_made_at timestamptz,
+    created_at timestamptz,
+    links jsonb NOT NULL
+) ON COMMIT DROP""")
+
+DROP_STAGING_SQL = text(f"DROP TABLE {STAGING_TABLE}")
+
+STAGING_COLUMNS = (
+    "line", "import_key", "title", "summary", "rationale", "owner_slack_id", "owner_name",
+    "source_type", "source_url", "tags", "impact_area", "category", "status",
+    "decision_made_at", "created_at", "links",
+)
+
+# Re-imports update content but never status: a decision someone ignored stays
+# ignored, and deleted decisions are left alone (their rows come back as errors).
+UPSERT_SQL = text(f"""\
+WITH upserted AS (
+    INSERT INTO decisions AS d (
+        id, workspace_id, import_key, title, summary, rationale, owner_slack_id, owner_name,
+        source_type, source_url, tags, impact_area, category, status, confirmed_at,
+        decision_made_at, created_at, updated_at
+    )
+    SELECT gen_random_uuid(), CAST(:workspace_id AS uuid), s.import_key, s.title, s.summary,
+           s.rationale, s.owner_slack_id, s.owner_name, s.source_type, s.source_url, s.tags,
+           s.impact_area, s.category, s.status,
+           CASE WHEN s.status = 'active' THEN now() END,
+           s.decision_made_at, coalesce(s.created_at, s.decision_made_at, now()), now()
+    FROM {STAGING_TABLE} s
+    ON CONFLICT (workspace_id, import_key) DO UPDATE SET
+        title = EXCLUDED.title,
+        summary = EXCLUDED.summary,
+        rationale = EXCLUDED.rationale,
+        owner_slack_id = EXCLUDED.owner_slack_id,
+        owner_name = EXCLUDED.owner_name,
+        source_type = EXCLUDED.source_type,
+        source_url = EXCLUDED.source_url,
+        tags = EXCLUDED.tags,
+        impact_area = EXCLUDED.impact_area,
+        category = EXCLUDED.category,
+        decision_made_at = EXCLUDED.decision_made_at,
+        updated_at = now()
+    WHERE d.status <> 'deleted'
+    RETURNING d.id, d.import_key, d.status, (d.xmax = 0) AS inserted
+),
+linked AS (
+    INSERT INTO decision_links (
+        id, decision_id, workspace_id, link_type, link_url, link_title, artifact_key
+    )
+    SELECT gen_random_uuid(), u.id, CAST(:workspace_id AS uuid), l.link_type, l.link_url,
+           l.link_title, l.artifact_key
+    FROM upserted u
+    JOIN {STAGING_TABLE} s ON s.import_key = u.import_key
+    CROSS JOIN LATERAL jsonb_to_recordset(s.links)
+        AS l(link_type text, link_url text, link_title text, artifact_key text)
+    WHERE NOT EXISTS (
+        SELECT 1 FROM decision_links e WHERE e.decision_id = u.id AND e.link_url = l.link_url
+    )
+    RETURNING decision_id
+)
+SELECT u.id, u.import_key, u.status, u.inserted, coalesce(k.links, 0) AS links
+FROM upserted u
+LEFT JOIN (SELECT decision_id, count(*) AS links FROM linked GROUP BY decision_id) k
+    ON k.decision_id = u.id
+""")
+
+
+def read_records(
+    lines: Iterable[str], fmt: Literal["ndjson", "csv"]
+) -> Iterator[tuple[int, dict | None, str | None]]:
+    """Yield ``(line, record, error)`` for every row of an NDJSON or CSV source."""
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            # Empty cells mean "not set"; cells past the header land under None
+            yield reader.line_num, {k: v for k, v in row.items() if k and v != ""}, None
+        return
+    for line, raw in enumerate(lines, start=1):
+        if not raw.strip():
+            continue
+        try:
+            record = orjson.loads(raw)
+        except orjson.JSONDecodeError as exc:
+            yield line, None, f"invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield line, None, "expected a JSON object"
+            continue
+        yield line, record, None
+
+
+def _import_key(row: DecisionImportRow) -> str:
+    if row.external_id:
+        return row.external_id
+    # Without a source key the title identifies the decision across re-imports
+    title = " ".join(row.title.lower().split())
+    return "title:" + hashlib.sha1(title.encode()).hexdigest()
+
+
+def _describe(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in e['loc']) or 'row'}: {e['msg']}" for e in exc.errors()
+    )
+
+
+def _validate(batch: list[tuple[int, dict]]) -> tuple[list, list[dict]]:
+    """Validate a batch in one call, falling back to per-row to locate errors."""
+    try:
+        rows = _rows_adapter.validate_python([record for _, record in batch])
+        return [(line, row) for (line, _), row in zip(batch, rows)], []
+    except ValidationError:
+        pass
+    rows, errors = [], []
+    for line, record in batch:
+        try:
+            rows.append((line, DecisionImportRow.model_validate(record)))
+        except ValidationError as exc:
+            errors.append({"line": line, "error": _describe(exc)})
+    return rows, errors
+
+
+def _staging_record(line: int, key: str, row: DecisionImportRow) -> tuple:
+    links, seen = [], set()
+    for link in row.links:
+        if link.link_url in seen:
+            continue
+        seen.add(link.link_url)
+        links.append({**link.model_dump(), "artifact_key": normalize_artifact_ref(link.link_url)})
+    return (
+        line, key, row.title, row.summary, row.rationale, row.owner_slack_id, row.owner_name,
+        row.source_type, row.source_url, row.tags, row.impact_area, row.category, row.status,
+        row.decision_made_at, row.created_at, orjson.dumps(links).decode(),
+    )
+
+
+async def _load(
+    session_factory: async_sessionmaker, workspace_id: uuid.UUID, records: list[tuple]
+) -> list:
+    async with session_factory() as session:
+        # Through the session so the asyncpg transaction is open before the
+        # COPY; a raw CREATE would autocommit and ON COMMIT DROP it at once
+        await session.execute(CREATE_STAGING_SQL)
+        conn = await session.connection()
+        raw = (await conn.get_raw_connection()).driver_connection
+        await raw.copy_records_to_table(STAGING_TABLE, records=records, columns=STAGING_COLUMNS)
+        rows = (await session.execute(UPSERT_SQL, {"workspace_id": workspace_id})).all()
+        # Also frees the name when the caller's transaction outlives this batch
+        await session.execute(DROP_STAGING_SQL)
+        if rows:
+            await bump_decisions_version(session, workspace_id)
+        await session.commit()
+    return rows
+
+
+async def import_decisions(
+    session_factory: async_sessionmaker,
+    redis,
+    workspace_id: uuid.UUID,
+    records: Iterable[tuple[int, dict | None, str | None]],
+    batch_size: int | None = None,
+) -> dict:
+    """Import ``read_records`` output into a workspace.
+
+    Active decisions get an embedding job, enqueued one pipeline per batch;
+    pass ``redis=None`` to skip embedding and index notifications.
+    """
+    batch_size = batch_size or settings.import_batch_size
+    start = time.perf_counter()
+    stats = {"rows": 0, "inserted": 0, "updated": 0, "links": 0, "embedding_jobs": 0}
+    errors: list[dict] = []
+    seen: dict[str, int] = {}
+
+    async def flush(batch: list[tuple[int, dict]]) -> None:
+        rows, invalid = _validate(batch)
+        errors.extend(invalid)
+        staged, lines = [], {}
+        for line, row in rows:
+            key = _import_key(row)
+            if key in seen:
+                errors.append({"line": line, "error": f"duplicate of line {seen[key]}"})
+                continue
+            seen[key] = lines[key] = line
+            staged.append(_staging_record(line, key, row))
+        if not staged:
+            return
+
+        loaded = await _load(session_factory, workspace_id, staged)
+        for key in lines.keys() - {row.import_key for row in loaded}:
+            errors.append({"line": lines[key], "error": "existing decision is deleted"})
+        stats["inserted"] += sum(row.inserted for row in loaded)
+        stats["updated"] += sum(not row.inserted for row in loaded)
+        stats["links"] += sum(row.links for row in loaded)
+
+        if redis is not None and loaded:
+            jobs = [
+                ("generate_embedding_task", (str(row.id),))
+                for row in loaded
+                if row.status == "active"
+            ]
+            if jobs:
+                await enqueue_jobs(redis, jobs)
+                stats["embedding_jobs"] += len(jobs)
+            await publish_decision_changes(redis, workspace_id, [row.id for row in loaded])
+
+    batch: list[tuple[int, dict]] = []
+    for line, record, error in records:
+        stats["rows"] += 1
+        if error:
+            errors.append({"line": line, "error": error})
+            continue
+        batch.append((line, record))
+        if len(batch) >= batch_size:
+            await flush(batch)
+            batch = []
+    if batch:
+        await flush(batch)
+
+    tag_dictionary.invalidate(str(workspace_id))
+    elapsed = time.perf_counter() - start
+    errors.sort(key=lambda e: e["line"])
+    result = {
+        **stats,
+        "failed": len(errors),
+        "elapsed_s": round(elapsed, 3),
+        "rows_per_s": round(stats["rows"] / elapsed, 1) if elapsed else 0.0,
+        "errors": errors,
+    }
+    log.info(
+        "decisions_imported",
+        workspace_id=str(workspace_id),
+        **{k: v for k, v in result.items() if k != "errors"},
+    )
+    return result
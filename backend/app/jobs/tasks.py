@@ -4,14 +4,19 @@ from datetime import datetime, timedelta, timezone
 
 import httpx
 import structlog
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import undefer
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.ai.chunker import build_decision_chunks
 from app.ai.detector import detect_decision
-from app.ai.embeddings import generate_embedding
+from app.ai.embeddings import generate_embeddings
 from app.ai.extractor import extract_decision
 from app.ai.prompts import HUDDLE_DECISION_DETECTION_SYSTEM_PROMPT, HUDDLE_DECISION_EXTRACTION_SYSTEM_PROMPT
+from app.db.changes import bump_decisions_version
 from app.db.models import (
     Decision,
+    DecisionChunk,
     DecisionLink,
     MonitoredChannel,
     PendingConfirmation,
@@ -19,10 +24,13 @@ from app.db.models import (
     Workspace,
 )
 from app.db.session import async_session_factory
+from app.integrations.artifacts import github_artifact_key, jira_artifact_key
 from app.integrations.github.client import GitHubClient
 from app.integrations.github.references import extract_github_references
 from app.integrations.jira.client import JiraClient
 from app.integrations.jira.references import extract_jira_references
+from app.jobs.dedup import find_duplicate_decision, handled_threads, record_thread, thread_decision
+from app.search.index_sync import publish_decision_change
 from app.search.query_handler import handle_decision_query
 from app.slack import client as slack_client
 from app.slack.messages import build_confirmation_blocks, build_search_result_blocks
@@ -69,8 +77,17 @@ async def process_message(ctx: dict, message_id: str) -> None:
             await session.commit()
             return
 
-        # Fetch thread context
+        # A thread that already produced or matched a decision is never re-detected
         thread_ts = raw_msg.thread_ts or raw_msg.message_ts
+        existing_id = await thread_decision(session, workspace.id, raw_msg.channel_id, thread_ts)
+        if existing_id is not None:
+            raw_msg.processed = True
+            raw_msg.decision_id = existing_id
+            await session.commit()
+            log.info("thread_already_handled", message_id=message_id, decision_id=str(existing_id))
+            return
+
+        # Fetch thread context
         thread_resp = await slack_client.conversations_replies(
             workspace.bot_access_token, raw_msg.channel_id, thread_ts, limit=50
         )
@@ -118,6 +135,23 @@ async def process_message(ctx: dict, message_id: str) -> None:
             log.warning("daily_detection_limit", workspace_id=str(workspace.id), count=daily_count)
             return
 
+        duplicate = await find_duplicate_decision(session, workspace.id, formatted)
+        if duplicate is not None:
+            duplicate_id, similarity = duplicate
+            await record_thread(
+                session, workspace.id, raw_msg.channel_id, thread_ts, duplicate_id, similarity
+            )
+            raw_msg.processed = True
+            raw_msg.decision_id = duplicate_id
+            await session.commit()
+            log.info(
+                "likely_duplicate_decision",
+                message_id=message_id,
+                decision_id=str(duplicate_id),
+                similarity=round(similarity, 3),
+            )
+            return
+
         extraction = await extract_decision(formatted, system_prompt=extract_prompt)
 
         decision = Decision(
@@ -143,6 +177,8 @@ async def process_message(ctx: dict, message_id: str) -> None:
         )
         session.add(decision)
         await session.flush()
+        await record_thread(session, workspace.id, raw_msg.channel_id, thread_ts, decision.id)
+        await bump_decisions_version(session, workspace.id)
 
         confirmation = PendingConfirmation(
             id=uuid.uuid4(),
@@ -207,7 +243,9 @@ async def enrich_decision(ctx: dict, decision_id: str) -> None:
     async with async_session_factory() as session:
         decision = (
             await session.execute(
-                select(Decision).where(Decision.id == uuid.UUID(decision_id))
+                select(Decision)
+                .options(undefer(Decision.raw_context))
+                .where(Decision.id == uuid.UUID(decision_id))
             )
         ).scalar_one_or_none()
 
@@ -237,6 +275,8 @@ async def enrich_decision(ctx: dict, decision_id: str) -> None:
                     link = DecisionLink(
                         id=uuid.uuid4(),
                         decision_id=decision.id,
+                        workspace_id=decision.workspace_id,
+                        artifact_key=jira_artifact_key(issue["key"] or ref),
                         link_type="jira",
                         link_url=issue["url"],
                         link_title=f"{issue['key']}: {issue['title']}",
@@ -260,6 +300,8 @@ async def enrich_decision(ctx: dict, decision_id: str) -> None:
                     link = DecisionLink(
                         id=uuid.uuid4(),
                         decision_id=decision.id,
+                        workspace_id=decision.workspace_id,
+                        artifact_key=github_artifact_key(ref_owner, ref_repo, ref["number"]),
                         link_type="github_pr",
                         link_url=pr["url"],
                         link_title=f"#{pr['number']}: {pr['title']}",
@@ -267,34 +309,74 @@ async def enrich_decision(ctx: dict, decision_id: str) -> None:
                     )
                     session.add(link)
 
+        # Links are part of the detail response, and updated_at feeds the list
+        decision.updated_at = func.now()
+        await bump_decisions_version(session, decision.workspace_id)
         await session.commit()
         log.info("decision_enriched", decision_id=decision_id)
 
 
+async def _embed_decision(session: AsyncSession, decision: Decision) -> bool:
+    text = " ".join(
+        filter(None, [decision.title, decision.summary, decision.rationale])
+    )
+    if not text.strip():
+        return False
+
+    chunks = build_decision_chunks(
+        decision.title, decision.summary, decision.rationale, decision.raw_context
+    )
+    # One Voyage call: the whole-decision text first, then its chunks
+    embeddings = await generate_embeddings([text] + [c["content"] for c in chunks])
+    if not embeddings or not embeddings[0]:
+        log.warning("empty_embedding", decision_id=str(decision.id))
+        return False
+    decision.embedding = embeddings[0]
+
+    chunk_embeddings = embeddings[1:]
+    if len(chunk_embeddings) != len(chunks):
+        log.warning("chunk_embedding_mismatch", decision_id=str(decision.id))
+        return True
+
+    await session.execute(
+        delete(DecisionChunk).where(DecisionChunk.decision_id == decision.id)
+    )
+    for chunk, chunk_embedding in zip(chunks, chunk_embeddings):
+        session.add(
+            DecisionChunk(
+                id=uuid.uuid4(),
+                decision_id=decision.id,
+                workspace_id=decision.workspace_id,
+                chunk_index=chunk["chunk_index"],
+                chunk_type=chunk["chunk_type"],
+                content=chunk["content"],
+                embedding=chunk_embedding,
+            )
+        )
+    return True
+
+
 async def generate_embedding_task(ctx: dict, decision_id: str) -> None:
     async with async_session_factory() as session:
         decision = (
             await session.execute(
-                select(Decision).where(Decision.id == uuid.UUID(decision_id))
+                select(Decision)
+                .options(undefer(Decision.raw_context))
+                .where(Decision.id == uuid.UUID(decision_id))
             )
         ).scalar_one_or_none()
 
-        if decision is None:
+        # A job queued before the decision was deleted must not recreate its chunks
+        if decision is None or decision.status == "deleted":
             return
 
-        text = " ".join(
-            filter(None, [decision.title, decision.summary, decision.rationale])
-        )
-        if not text.strip():
+        if not await _embed_decision(session, decision):
             return
 
-        embedding = await generate_embedding(text)
-        if not embedding:
-            log.warning("empty_embedding", decision_id=decision_id)
-            return
-
-        decision.embedding = embedding
+        # The embedding write bumps updated_at, which list responses carry
+        await bump_decisions_version(session, decision.workspace_id)
         await session.commit()
+        await publish_decision_change(ctx["redis"], decision.workspace_id, decision.id)
         log.info("embedding_generated", decision_id=decision_id)
 
 
@@ -310,6 +392,7 @@ async def expire_confirmations(ctx: dict) -> None:
             )
         ).scalars().all()
 
+        expired_workspaces = set()
         for conf in pending:
             conf.status = "expired"
             decision = (
@@ -319,7 +402,10 @@ async def expire_confirmations(ctx: dict) -> None:
             ).scalar_one_or_none()
             if decision and decision.status == "pending":
                 decision.status = "expired"
+                expired_workspaces.add(decision.workspace_id)
 
+        for workspace_id in expired_workspaces:
+            await bump_decisions_version(session, workspace_id)
         await session.commit()
         if pending:
             log.info("confirmations_expired", count=len(pending))
@@ -361,12 +447,21 @@ async def backfill_history(ctx: dict, workspace_id: str, days: int = 90) -> None
                     cursor=cursor,
                 )
                 messages = resp.get("messages", [])
+                # Threads live processing (or an earlier backfill) already handled
+                handled = await handled_threads(
+                    session,
+                    workspace.id,
+                    channel.channel_id,
+                    [m.get("thread_ts") or m.get("ts") for m in messages],
+                )
 
                 for msg in messages:
                     if msg.get("bot_id") or msg.get("subtype"):
                         continue
 
                     thread_ts = msg.get("thread_ts") or msg.get("ts")
+                    if thread_ts in handled:
+                        continue
                     thread_messages = [msg]
 
                     if msg.get("reply_count", 0) > 0:
@@ -393,6 +488,14 @@ async def backfill_history(ctx: dict, workspace_id: str, days: int = 90) -> None
                     if detection["confidence"] < 0.7:
                         continue
 
+                    duplicate = await find_duplicate_decision(session, workspace.id, formatted)
+                    if duplicate is not None:
+                        await record_thread(
+                            session, workspace.id, channel.channel_id, thread_ts, *duplicate
+                        )
+                        await session.commit()
+                        continue
+
                     extraction = await extract_decision(formatted)
 
                     decision = Decision(
@@ -417,15 +520,14 @@ async def backfill_history(ctx: dict, workspace_id: str, days: int = 90) -> None
                     )
                     session.add(decision)
                     await session.flush()
-
-                    embedding_text = " ".join(
-                        filter(None, [decision.title, decision.summary, decision.rationale])
+                    await record_thread(
+                        session, workspace.id, channel.channel_id, thread_ts, decision.id
                     )
-                    emb = await generate_embedding(embedding_text)
-                    if emb:
-                        decision.embedding = emb
+                    await bump_decisions_version(session, workspace.id)
 
+                    await _embed_decision(session, decision)
                     await session.commit()
+                    await publish_decision_change(ctx["redis"], workspace.id, decision.id)
                     await asyncio.sleep(1)
 
                 metadata = resp.get("response_metadata", {})
@@ -2,6 +2,7 @@ from arq import cron
 from arq.connections import RedisSettings
 
 from app.config import settings
+from app.db.session import async_session_factory
 from app.jobs.tasks import (
     backfill_history,
     enrich_decision,
@@ -10,6 +11,15 @@ from app.jobs.tasks import (
     process_message,
     process_query,
 )
+from app.search.query_log import query_log_buffer
+
+
+async def startup(ctx: dict) -> None:
+    query_log_buffer.start(async_session_factory)
+
+
+async def shutdown(ctx: dict) -> None:
+    await query_log_buffer.stop()
 
 
 class WorkerSettings:
@@ -23,6 +33,8 @@ class WorkerSettings:
     cron_jobs = [
         cron(expire_confirmations, hour=None, minute=0),  # every hour
     ]
+    on_startup = startup
+    on_shutdown = shutdown
     max_jobs = 10
     job_timeout = 60
     redis_settings = RedisSettings.from_dsn(settings.redis_url)
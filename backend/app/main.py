@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 import structlog
@@ -11,6 +12,9 @@ from app.db.session import async_session_factory, engine
 from app.slack import router as slack_router
 from app.auth import router as auth_router
 from app.api import router as api_router
+from app.search.index_sync import indexes_enabled, run_index_listener, warm_indexes
+from app.search.query_log import query_log_buffer
+from app.search.vector_index import vector_indexes
 
 structlog.configure(
     processors=[
@@ -36,7 +40,19 @@ async def lifespan(app: FastAPI):
     app.state.arq_pool = await create_pool(
         RedisSettings.from_dsn(settings.redis_url)
     )
+    query_log_buffer.start(async_session_factory)
+    index_listener = None
+    if indexes_enabled():
+        await warm_indexes(async_session_factory)
+        index_listener = asyncio.create_task(
+            run_index_listener(app.state.arq_pool, async_session_factory)
+        )
     yield
+    if index_listener:
+        index_listener.cancel()
+        await asyncio.gather(index_listener, return_exceptions=True)
+        vector_indexes.snapshot()
+    await query_log_buffer.stop()
     await app.state.arq_pool.close()
     await engine.dispose()
     log.info("shut down")
@@ -1,141 +1,342 @@
+import asyncio
+import time
 import uuid
+from datetime import datetime
 
 import structlog
-from sqlalchemy import text
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.ai.embeddings import generate_query_embedding
+from app.config import settings
+from app.db.models import Workspace
+from app.search.fusion import fuse
+from app.search.hydration import HYDRATE_COLUMNS, hydrate_results
+from app.search.lexical_index import lexical_indexes
+from app.search.tag_dictionary import TagMatcher, get_tag_matcher
+from app.search.vector_index import vector_indexes
 
 log = structlog.get_logger()
 
-HYBRID_SEARCH_SQL = text("""\
-WITH vector_results AS (
-    SELECT
-        id,
-        title,
-        summary,
-        rationale,
-        owner_name,
-        owner_slack_id,
-        tags,
-        impact_area,
-        category,
-        source_url,
-        source_channel_name,
-        created_at,
-        decision_made_at,
-        (1 - (embedding <=> CAST(:query_embedding AS vector))) AS vector_score
-    FROM decisions
-    WHERE workspace_id = CAST(:workspace_id AS uuid)
-      AND status = 'active'
-      AND embedding IS NOT NULL
-    ORDER BY embedding <=> CAST(:query_embedding AS vector)
-    LIMIT 20
-),
-keyword_results AS (
+# Applied inside every candidate CTE so filtered searches draw their
+# candidates from matching rows instead of filtering a fixed top-N afterwards.
+_FILTERS_SQL = """\
+      AND (CAST(:date_from AS timestamptz) IS NULL OR d.created_at >= CAST(:date_from AS timestamptz))
+      AND (CAST(:date_to AS timestamptz) IS NULL OR d.created_at <= CAST(:date_to AS timestamptz))
+      AND (CAST(:owner_filter AS varchar) IS NULL OR d.owner_slack_id = CAST(:owner_filter AS varchar))
+      AND (CAST(:categories AS varchar[]) IS NULL OR d.category = ANY(CAST(:categories AS varchar[])))
+      AND (CAST(:filter_tags AS varchar[]) IS NULL OR d.tags && CAST(:filter_tags AS varchar[]))"""
+
+# Candidate generation returns only (leg, id, score, tag_match) rows; display
+# columns are fetched for the final page by app.search.hydration. The keyword
+# and vector legs are separate statements so the keyword leg can run while
+# the query embedding is still in flight.
+KEYWORD_CANDIDATES_SQL = text(f"""\
+SELECT
+    'keyword' AS leg,
+    d.id,
+    ts_rank(d.search_vector, plainto_tsquery('english', :query)) AS score,
+    COALESCE(d.tags && CAST(:query_tags AS varchar[])
+        OR d.impact_area && CAST(:query_impact_areas AS varchar[]), false) AS tag_match
+FROM decisions d
+WHERE d.workspace_id = CAST(:workspace_id AS uuid)
+  AND d.status = 'active'
+  AND d.search_vector @@ plainto_tsquery('english', :query)
+{_FILTERS_SQL}
+ORDER BY ts_rank(d.search_vector, plainto_tsquery('english', :query)) DESC
+LIMIT :candidate_limit
+""")
+
+def _vector_candidates_sql(order_by: str) -> str:
+    return f"""\
+WITH vector_candidates AS (
     SELECT
-        id,
-        title,
-        summary,
-        rationale,
-        owner_name,
-        owner_slack_id,
-        tags,
-        impact_area,
-        category,
-        source_url,
-        source_channel_name,
-        created_at,
-        decision_made_at,
-        ts_rank(search_vector, plainto_tsquery('english', :query)) AS keyword_score
-    FROM decisions
-    WHERE workspace_id = CAST(:workspace_id AS uuid)
-      AND status = 'active'
-      AND search_vector @@ plainto_tsquery('english', :query)
-    ORDER BY ts_rank(search_vector, plainto_tsquery('english', :query)) DESC
-    LIMIT 20
+        d.id AS decision_id,
+        (1 - (d.embedding <=> CAST(:query_embedding AS vector))) AS score,
+        COALESCE(d.tags && CAST(:query_tags AS varchar[])
+            OR d.impact_area && CAST(:query_impact_areas AS varchar[]), false) AS tag_match
+    FROM decisions d
+    WHERE d.workspace_id = CAST(:workspace_id AS uuid)
+      AND d.status = 'active'
+      AND d.embedding IS NOT NULL
+{_FILTERS_SQL}
+    ORDER BY {order_by.format(table="d")}
+    LIMIT :candidate_limit
 ),
-combined AS (
+chunk_candidates AS (
     SELECT
-        COALESCE(v.id, k.id) AS id,
-        COALESCE(v.title, k.title) AS title,
-        COALESCE(v.summary, k.summary) AS summary,
-        COALESCE(v.rationale, k.rationale) AS rationale,
-        COALESCE(v.owner_name, k.owner_name) AS owner_name,
-        COALESCE(v.owner_slack_id, k.owner_slack_id) AS owner_slack_id,
-        COALESCE(v.tags, k.tags) AS tags,
-        COALESCE(v.impact_area, k.impact_area) AS impact_area,
-        COALESCE(v.category, k.category) AS category,
-        COALESCE(v.source_url, k.source_url) AS source_url,
-        COALESCE(v.source_channel_name, k.source_channel_name) AS source_channel_name,
-        COALESCE(v.created_at, k.created_at) AS created_at,
-        COALESCE(v.decision_made_at, k.decision_made_at) AS decision_made_at,
-        COALESCE(v.vector_score, 0.0) AS vector_score,
-        COALESCE(k.keyword_score, 0.0) AS keyword_score,
-        CASE WHEN v.tags && CAST(:query_tags AS varchar[]) THEN 1.0 ELSE 0.0 END AS tag_bonus
-    FROM vector_results v
-    FULL OUTER JOIN keyword_results k ON v.id = k.id
+        c.decision_id,
+        (1 - (c.embedding <=> CAST(:query_embedding AS vector))) AS score,
+        COALESCE(d.tags && CAST(:query_tags AS varchar[])
+            OR d.impact_area && CAST(:query_impact_areas AS varchar[]), false) AS tag_match
+    FROM decision_chunks c
+    JOIN decisions d ON d.id = c.decision_id
+    WHERE c.workspace_id = CAST(:workspace_id AS uuid)
+      AND d.status = 'active'
+{_FILTERS_SQL}
+    ORDER BY {order_by.format(table="c")}
+    LIMIT :chunk_limit
 )
-SELECT
-    id, title, summary, rationale, owner_name, owner_slack_id,
-    tags, impact_area, category, source_url, source_channel_name,
-    created_at, decision_made_at,
-    (0.6 * vector_score + 0.3 * keyword_score + 0.1 * tag_bonus) AS combined_score
-FROM combined
-WHERE 1=1
-  AND (CAST(:date_from AS timestamptz) IS NULL OR created_at >= CAST(:date_from AS timestamptz))
-  AND (CAST(:date_to AS timestamptz) IS NULL OR created_at <= CAST(:date_to AS timestamptz))
-  AND (CAST(:owner_filter AS varchar) IS NULL OR owner_slack_id = CAST(:owner_filter AS varchar))
-  AND (CAST(:categories AS varchar[]) IS NULL OR category = ANY(CAST(:categories AS varchar[])))
-  AND (CAST(:filter_tags AS varchar[]) IS NULL OR tags && CAST(:filter_tags AS varchar[]))
-ORDER BY combined_score DESC
-LIMIT :result_limit
+SELECT 'vector' AS leg, decision_id AS id, max(score) AS score, bool_or(tag_match) AS tag_match
+FROM (
+    SELECT decision_id, score, tag_match FROM vector_candidates
+    UNION ALL
+    SELECT decision_id, score, tag_match FROM chunk_candidates
+) c
+GROUP BY decision_id
+ORDER BY score DESC
+LIMIT :candidate_limit
+"""
+
+
+VECTOR_CANDIDATES_SQL = text(
+    _vector_candidates_sql("{table}.embedding <=> CAST(:query_embedding AS vector)")
+)
+
+# pgvector 0.6 applies the WHERE clause to the ef_search rows the HNSW scan
+# hands back, so a selective filter can leave the leg nearly empty. Ordering
+# on the score instead of the bare distance keeps the planner off the HNSW
+# index: matching rows come from the btree/GIN indexes and are ranked exactly.
+FILTERED_VECTOR_CANDIDATES_SQL = text(_vector_candidates_sql("score DESC"))
+
+# Only used when the vector leg is dropped: decisions whose tags match the
+# query stand in for the semantic candidates.
+TAG_CANDIDATES_SQL = text(f"""\
+SELECT 'tag' AS leg, d.id, 0.0 AS score, true AS tag_match
+FROM decisions d
+WHERE d.workspace_id = CAST(:workspace_id AS uuid)
+  AND d.status = 'active'
+  AND (d.tags && CAST(:query_tags AS varchar[])
+       OR d.impact_area && CAST(:query_impact_areas AS varchar[]))
+{_FILTERS_SQL}
+ORDER BY d.created_at DESC
+LIMIT :candidate_limit
 """)
 
+SET_EF_SEARCH_SQL = text("SELECT set_config('hnsw.ef_search', :ef_search, true)")
 
-async def hybrid_search(
-    db_session: AsyncSession,
-    workspace_id: str,
-    query: str,
-    filters: dict | None = None,
-    limit: int = 5,
-) -> list[dict]:
-    filters = filters or {}
+# pgvector rejects larger values
+MAX_EF_SEARCH = 1000
+
+
+async def load_search_settings(db_session: AsyncSession, workspace_id: str) -> dict:
+    workspace_settings = (
+        await db_session.execute(
+            select(Workspace.settings).where(Workspace.id == uuid.UUID(workspace_id))
+        )
+    ).scalar_one_or_none()
+    return (workspace_settings or {}).get("search") or {}
 
-    embedding = await generate_query_embedding(query)
-    if not embedding:
-        log.warning("empty_query_embedding", query=query[:50])
-        return []
 
-    query_tags = [t.strip().lower() for t in query.split() if len(t.strip()) > 2]
+def _parse_timestamp(value: str | datetime | None) -> datetime | None:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _candidate_params(
+    workspace_id: str, query: str, filters: dict | None, matcher: TagMatcher | None = None
+) -> dict:
+    filters = filters or {}
+    # Only values that exist in the workspace reach the && overlap, so the
+    # GIN lookups stay selective and noise words never earn the tag bonus.
+    matched = matcher.match(query) if matcher is not None else {}
+
+    # Candidate depth is independent of the requested page so that every
+    # page is cut from the same fused ranking.
+    candidate_limit = settings.search_candidate_limit
 
-    params = {
-        "query_embedding": str(embedding),
+    return {
         "workspace_id": workspace_id,
         "query": query,
-        "query_tags": query_tags or [],
-        "date_from": filters.get("date_from"),
-        "date_to": filters.get("date_to"),
+        "query_tags": matched.get("tags", []),
+        "query_impact_areas": matched.get("impact_areas", []),
+        "date_from": _parse_timestamp(filters.get("date_from")),
+        "date_to": _parse_timestamp(filters.get("date_to")),
         "owner_filter": filters.get("owner_slack_id"),
         "categories": filters.get("categories"),
         "filter_tags": filters.get("tags"),
-        "result_limit": limit,
+        "candidate_limit": candidate_limit,
+        "chunk_limit": candidate_limit * settings.max_chunks_per_decision,
     }
 
-    result = await db_session.execute(HYBRID_SEARCH_SQL, params)
-    rows = result.mappings().all()
-
-    return [
-        {
-            "id": str(row["id"]),
-            "title": row["title"],
-            "summary": row["summary"],
-            "rationale": row["rationale"],
-            "owner_name": row["owner_name"],
-            "tags": row["tags"],
-            "source_url": row["source_url"],
-            "created_at": row["created_at"].isoformat() if row["created_at"] else None,
-            "combined_score": float(row["combined_score"]),
-        }
-        for row in rows
-    ]
+
+def max_ranked_results() -> int:
+    # Fusion ranks the union of the keyword and vector candidate lists
+    return 2 * settings.search_candidate_limit
+
+
+def _ef_search(params: dict, ef_search: int | None) -> int:
+    # An HNSW scan returns at most ef_search rows, so anything below the
+    # LIMITs silently truncates the candidate lists
+    floor = max(params["candidate_limit"], params["chunk_limit"])
+    return min(max(ef_search or settings.hnsw_ef_search, floor), MAX_EF_SEARCH)
+
+
+def _query_tag_set(params: dict) -> set[str]:
+    return {t.lower() for t in params["query_tags"] + params["query_impact_areas"]}
+
+
+def _has_filters(params: dict) -> bool:
+    return any(
+        params[key] is not None
+        for key in ("date_from", "date_to", "owner_filter", "categories", "filter_tags")
+    )
+
+
+async def _run_leg(
+    db_session: AsyncSession, statement, params: dict
+) -> tuple[list[tuple[str, float]], set[str]]:
+    candidates: list[tuple[str, float]] = []
+    tag_matches: set[str] = set()
+    for _, decision_id, score, tag_match in (await db_session.execute(statement, params)).all():
+        decision_id = str(decision_id)
+        candidates.append((decision_id, float(score)))
+        if tag_match:
+            tag_matches.add(decision_id)
+    return candidates, tag_matches
+
+
+async def fetch_keyword_candidates(
+    db_session: AsyncSession, params: dict
+) -> tuple[list[tuple[str, float]], set[str]]:
+    index = lexical_indexes.get(params["workspace_id"])
+    if index is not None and not _has_filters(params):
+        query_tags = _query_tag_set(params)
+        # BM25 is unbounded; scale by the query's best possible score so the
+        # weighted fusion mode sees values in [0, 1] like the other legs.
+        bound = index.score_bound(params["query"]) or 1.0
+        candidates = [
+            (decision_id, score / bound)
+            for decision_id, score in index.search(params["query"], params["candidate_limit"])
+        ]
+        return candidates, {d for d, _ in candidates if index.tags(d) & query_tags}
+    return await _run_leg(db_session, KEYWORD_CANDIDATES_SQL, params)
+
+
+async def fetch_vector_candidates(
+    db_session: AsyncSession,
+    params: dict,
+    embedding: list[float],
+    ef_search: int | None = None,
+) -> tuple[list[tuple[str, float]], set[str]]:
+    # The in-process index holds every active embedded decision but no filter
+    # columns, so filtered searches stay on pgvector.
+    index = vector_indexes.get(params["workspace_id"])
+    if index is not None and not _has_filters(params):
+        query_tags = _query_tag_set(params)
+        candidates = index.search(embedding, params["candidate_limit"])
+        return candidates, {d for d, _ in candidates if index.tags(d) & query_tags}
+
+    params = {**params, "query_embedding": str(embedding)}
+    if _has_filters(params):
+        return await _run_leg(db_session, FILTERED_VECTOR_CANDIDATES_SQL, params)
+
+    # set_config(..., true) is the SET LOCAL equivalent, scoped to this transaction
+    await db_session.execute(SET_EF_SEARCH_SQL, {"ef_search": str(_ef_search(params, ef_search))})
+    return await _run_leg(db_session, VECTOR_CANDIDATES_SQL, params)
+
+
+async def fetch_candidates(
+    db_session: AsyncSession,
+    workspace_id: str,
+    query: str,
+    embedding: list[float],
+    filters: dict | None = None,
+    ef_search: int | None = None,
+) -> tuple[list[tuple[str, float]], list[tuple[str, float]], set[str]]:
+    matcher = await get_tag_matcher(db_session, workspace_id)
+    params = _candidate_params(workspace_id, query, filters, matcher)
+    keyword, keyword_tags = await fetch_keyword_candidates(db_session, params)
+    vector, vector_tags = await fetch_vector_candidates(db_session, params, embedding, ef_search)
+    return vector, keyword, keyword_tags | vector_tags
+
+
+async def _await_embedding(task: asyncio.Task, timeout: float) -> list[float] | None:
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), timeout=max(timeout, 0.0))
+    except asyncio.TimeoutError:
+        task.cancel()
+        return None
+
+
+async def hybrid_search(
+    db_session: AsyncSession,
+    workspace_id: str,
+    query: str,
+    filters: dict | None = None,
+    limit: int = 5,
+    offset: int = 0,
+    ef_search: int | None = None,
+    fusion_mode: str | None = None,
+    fusion_weights: dict | None = None,
+    query_embedding: list[float] | None = None,
+    columns: tuple[str, ...] = HYDRATE_COLUMNS,
+) -> dict:
+    timings: dict[str, float] = {}
+    start = time.monotonic()
+    mark = start
+
+    def lap(phase: str) -> None:
+        nonlocal mark
+        now = time.monotonic()
+        timings[phase] = round((now - mark) * 1000, 2)
+        mark = now
+
+    deadline = start + settings.search_embedding_deadline_ms / 1000
+
+    # The keyword leg only needs the query text, so it runs while Voyage works
+    # Callers that already hold the embedding (benchmarks, cached queries) skip Voyage
+    if query_embedding is not None:
+        embedding_task = asyncio.get_running_loop().create_future()
+        embedding_task.set_result(query_embedding)
+    else:
+        embedding_task = asyncio.create_task(generate_query_embedding(query))
+    try:
+        matcher = await get_tag_matcher(db_session, workspace_id)
+        params = _candidate_params(workspace_id, query, filters, matcher)
+        keyword, tag_matches = await fetch_keyword_candidates(db_session, params)
+    except BaseException:
+        embedding_task.cancel()
+        raise
+    lap("keyword_ms")
+
+    embedding = await _await_embedding(embedding_task, deadline - time.monotonic())
+    lap("embedding_wait_ms")
+
+    degraded = not embedding
+    if degraded:
+        log.warning("search_degraded", query=query[:50], timed_out=embedding is None)
+        # Tag-only rows join through the tag bonus, not the keyword ranking,
+        # so they do not push real keyword hits down a rank
+        tag_only, _ = await _run_leg(db_session, TAG_CANDIDATES_SQL, params)
+        tag_matches |= {decision_id for decision_id, _ in tag_only}
+        vector: list[tuple[str, float]] = []
+    else:
+        vector, vector_tags = await fetch_vector_candidates(
+            db_session, params, embedding, ef_search
+        )
+        tag_matches |= vector_tags
+    lap("vector_ms")
+
+    fused = fuse(
+        vector,
+        keyword,
+        tag_matches,
+        mode=fusion_mode or settings.search_fusion_mode,
+        weights=fusion_weights,
+        rrf_k=settings.search_rrf_k,
+    )
+    page = fused[offset:offset + limit]
+    lap("fusion_ms")
+
+    decisions = await hydrate_results(db_session, page, columns)
+    lap("hydration_ms")
+
+    return {
+        "decisions": decisions,
+        # Ranked results available to page through, at most max_ranked_results()
+        "total_count": len(fused),
+        "degraded": degraded,
+        "timings": timings,
+    }
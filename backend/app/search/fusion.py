@@ -0,0 +1,98 @@
+from collections.abc import Callable
+
+FUSION_MODES = ("rrf", "minmax", "weighted")
+
+DEFAULT_WEIGHTS = {"vector": 0.6, "keyword": 0.3, "tag": 0.1}
+DEFAULT_RRF_K = 60
+
+Candidates = list[tuple[str, float]]
+
+
+def _ranks(candidates: Candidates) -> dict[str, int]:
+    ordered = sorted(candidates, key=lambda c: (-c[1], c[0]))
+    return {decision_id: rank for rank, (decision_id, _) in enumerate(ordered, 1)}
+
+
+def _normalized(candidates: Candidates) -> dict[str, float]:
+    if not candidates:
+        return {}
+    scores = [score for _, score in candidates]
+    low, high = min(scores), max(scores)
+    if high == low:
+        return {decision_id: 1.0 for decision_id, _ in candidates}
+    return {decision_id: (score - low) / (high - low) for decision_id, score in candidates}
+
+
+def _weighted(
+    vector: Candidates, keyword: Candidates, tag_matches: set[str], weights: dict, rrf_k: int
+) -> dict[str, float]:
+    vector_scores = dict(vector)
+    keyword_scores = dict(keyword)
+    return {
+        decision_id: (
+            weights["vector"] * vector_scores.get(decision_id, 0.0)
+            + weights["keyword"] * keyword_scores.get(decision_id, 0.0)
+            + weights["tag"] * (1.0 if decision_id in tag_matches else 0.0)
+        )
+        for decision_id in vector_scores.keys() | keyword_scores.keys() | tag_matches
+    }
+
+
+def _minmax(
+    vector: Candidates, keyword: Candidates, tag_matches: set[str], weights: dict, rrf_k: int
+) -> dict[str, float]:
+    return _weighted(
+        list(_normalized(vector).items()),
+        list(_normalized(keyword).items()),
+        tag_matches,
+        weights,
+        rrf_k,
+    )
+
+
+def _rrf(
+    vector: Candidates, keyword: Candidates, tag_matches: set[str], weights: dict, rrf_k: int
+) -> dict[str, float]:
+    vector_ranks = _ranks(vector)
+    keyword_ranks = _ranks(keyword)
+    fused = {}
+    for decision_id in vector_ranks.keys() | keyword_ranks.keys() | tag_matches:
+        score = 0.0
+        if decision_id in vector_ranks:
+            score += weights["vector"] / (rrf_k + vector_ranks[decision_id])
+        if decision_id in keyword_ranks:
+            score += weights["keyword"] / (rrf_k + keyword_ranks[decision_id])
+        if decision_id in tag_matches:
+            # A tag match counts like a first-place hit in a third list
+            score += weights["tag"] / (rrf_k + 1)
+        fused[decision_id] = score
+    return fused
+
+
+_FUSERS: dict[str, Callable[..., dict[str, float]]] = {
+    "rrf": _rrf,
+    "minmax": _minmax,
+    "weighted": _weighted,
+}
+
+
+def fuse(
+    vector: Candidates,
+    keyword: Candidates,
+    tag_matches: set[str] | None = None,
+    mode: str = "weighted",
+    weights: dict | None = None,
+    rrf_k: int = DEFAULT_RRF_K,
+) -> Candidates:
+    """Fuse per-leg (decision_id, score) lists into one ranking, best first.
+
+    ``weighted`` sums raw scores, ``minmax`` sums scores normalized to [0, 1]
+    within each leg, and ``rrf`` sums reciprocal ranks. A tag match that
+    neither leg returned scores on the tag bonus alone.
+    """
+    if mode not in _FUSERS:
+        raise ValueError(f"Unknown fusion mode: {mode}")
+
+    weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+    fused = _FUSERS[mode](vector, keyword, tag_matches or set(), weights, rrf_k)
+    return sorted(fused.items(), key=lambda item: (-item[1], item[0]))
@@ -0,0 +1,104 @@
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+
+from sqlalchemy import any_, bindparam, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import DecisionLink
+
+# Every per-result lookup for search results lives here and loads all result
+# ids in one query, so Slack and API searches never issue a query per result.
+
+HYDRATE_COLUMNS = (
+    "title", "summary", "rationale", "owner_name", "tags", "source_url",
+    "created_at", "decision_made_at",
+)
+
+
+@lru_cache(maxsize=64)
+def hydrate_sql(columns: tuple[str, ...]):
+    """Display columns for a result page; callers may project a subset."""
+    unknown = set(columns) - set(HYDRATE_COLUMNS)
+    if unknown:
+        raise ValueError(f"not hydratable: {sorted(unknown)}")
+    return text(
+        f"SELECT {', '.join(('id',) + columns)}\n"
+        "FROM decisions\n"
+        "WHERE id = ANY(CAST(:ids AS uuid[]))"
+    )
+
+
+HYDRATE_SQL = hydrate_sql(HYDRATE_COLUMNS)
+
+
+async def hydrate_results(
+    db_session: AsyncSession,
+    page: list[tuple[str, float]],
+    columns: tuple[str, ...] = HYDRATE_COLUMNS,
+) -> list[dict]:
+    if not page:
+        return []
+
+    rows = (
+        await db_session.execute(
+            hydrate_sql(columns), {"ids": [uuid.UUID(decision_id) for decision_id, _ in page]}
+        )
+    ).mappings().all()
+    by_id = {str(row["id"]): row for row in rows}
+
+    decisions = []
+    for decision_id, score in page:
+        row = by_id.get(decision_id)
+        if row is None:
+            continue
+        result = {"id": decision_id}
+        for column in columns:
+            value = row[column]
+            result[column] = value.isoformat() if isinstance(value, datetime) else value
+        result["combined_score"] = score
+        decisions.append(result)
+    return decisions
+
+
+async def attach_links(db_session: AsyncSession, results: list[dict]) -> list[dict]:
+    for result in results:
+        result["referenced_tickets"] = []
+        result["referenced_prs"] = []
+        result["referenced_urls"] = []
+
+    if not results:
+        return results
+
+    ids = [uuid.UUID(result["id"]) for result in results]
+    links = (
+        await db_session.execute(
+            select(
+                DecisionLink.decision_id,
+                DecisionLink.link_type,
+                DecisionLink.link_url,
+                DecisionLink.link_title,
+            )
+            .where(
+                DecisionLink.decision_id
+                == any_(bindparam("ids", ids, type_=ARRAY(UUID(as_uuid=True))))
+            )
+            .order_by(DecisionLink.created_at)
+        )
+    ).all()
+
+    by_decision: dict[str, list] = defaultdict(list)
+    for link in links:
+        by_decision[str(link.decision_id)].append(link)
+
+    for result in results:
+        for link in by_decision.get(result["id"], []):
+            if link.link_type == "jira":
+                result["referenced_tickets"].append(link.link_title or link.link_url)
+            elif link.link_type == "github_pr":
+                result["referenced_prs"].append(link.link_title or link.link_url)
+            else:
+                result["referenced_urls"].append(link.link_url)
+    return results
@@ -0,0 +1,78 @@
+import asyncio
+import json
+
+import structlog
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.search.lexical_index import lexical_indexes
+from app.search.vector_index import vector_indexes
+
+log = structlog.get_logger()
+
+# In-process search indexes are kept current by broadcasting changed decision
+# ids over Redis pub/sub; every API process re-reads those rows itself.
+UPDATES_CHANNEL = "search_index:updates"
+
+REGISTRIES = (vector_indexes, lexical_indexes)
+
+
+def indexes_enabled() -> bool:
+    return any(registry.available for registry in REGISTRIES)
+
+
+async def warm_indexes(session_factory: async_sessionmaker) -> None:
+    for registry in REGISTRIES:
+        await registry.warm(session_factory)
+
+
+async def publish_decision_change(redis, workspace_id, decision_id) -> None:
+    if not indexes_enabled():
+        return
+    await redis.publish(
+        UPDATES_CHANNEL,
+        json.dumps({"workspace_id": str(workspace_id), "decision_id": str(decision_id)}),
+    )
+
+
+async def publish_decision_changes(redis, workspace_id, decision_ids) -> None:
+    """Broadcast many changed decisions of one workspace as a single message."""
+    if not indexes_enabled() or not decision_ids:
+        return
+    await redis.publish(
+        UPDATES_CHANNEL,
+        json.dumps(
+            {"workspace_id": str(workspace_id), "decision_ids": [str(d) for d in decision_ids]}
+        ),
+    )
+
+
+async def run_index_listener(redis, session_factory: async_sessionmaker) -> None:
+    """Apply published decision changes and periodically repair drift."""
+    pubsub = redis.pubsub()
+    await pubsub.subscribe(UPDATES_CHANNEL)
+    loop = asyncio.get_running_loop()
+    next_check = loop.time() + settings.search_index_check_interval_s
+    try:
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            try:
+                if message:
+                    change = json.loads(message["data"])
+                    decision_ids = change.get("decision_ids") or [change["decision_id"]]
+                    async with session_factory() as session:
+                        for registry in REGISTRIES:
+                            await registry.refresh_decisions(
+                                session, change["workspace_id"], decision_ids
+                            )
+                if loop.time() >= next_check:
+                    next_check = loop.time() + settings.search_index_check_interval_s
+                    async with session_factory() as session:
+                        for registry in REGISTRIES:
+                            for workspace_id in registry.workspace_ids():
+                                await registry.check_consistency(session, workspace_id)
+            except Exception as exc:
+                log.error("search_index_listener_error", error=str(exc))
+    finally:
+        await pubsub.unsubscribe(UPDATES_CHANNEL)
+        await pubsub.aclose()
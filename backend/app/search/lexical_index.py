@@ -0,0 +1,304 @@
+import asyncio
+import heapq
+import itertools
+import math
+import re
+import uuid
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.models import Decision
+
+log = structlog.get_logger()
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    """
+    a an and are as at be but by for from had has have he her his i if in into is it
+    its me my no not of on or our she so that the their them then there these they
+    this to too us was we were what when where which who why will with would you your
+    """.split()
+)
+
+# Crude suffix stripping; documents and queries share it, so it only has to
+# be consistent, not linguistically correct.
+_SUFFIXES = (
+    "ational", "ization", "fulness", "ousness", "ations", "ation",
+    "ings", "ing", "edly", "ies", "ed", "es", "ly", "s",
+)
+
+
+def _stem(token: str) -> str:
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[: -len(suffix)]
+            return token + "y" if suffix == "ies" else token
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        _stem(token)
+        for token in _TOKEN_RE.findall(text.lower())
+        if token not in STOPWORDS and len(token) > 1
+    ]
+
+
+class WorkspaceLexicalIndex:
+    """BM25 inverted index over one workspace's active decisions.
+
+    Documents get monotonically increasing integer ids, so appending keeps
+    every posting list sorted. Removals drop the document's term frequencies
+    and mark the affected posting lists for a lazy rebuild. Top-k retrieval
+    uses MaxScore: terms whose combined upper bound cannot beat the current
+    k-th score are only probed for documents surfaced by the other terms.
+    """
+
+    def __init__(self, k1: float | None = None, b: float | None = None):
+        self.k1 = settings.bm25_k1 if k1 is None else k1
+        self.b = settings.bm25_b if b is None else b
+        self._next_doc = 0
+        self._doc_ids: dict[str, int] = {}
+        self._decisions: dict[int, str] = {}
+        self._doc_terms: dict[int, dict[str, int]] = {}
+        self._doc_len: dict[int, int] = {}
+        self._total_len = 0
+        self._tfs: dict[str, dict[int, int]] = {}
+        self._postings: dict[str, list[int]] = {}
+        self._stale_terms: set[str] = set()
+        self._tags: dict[str, frozenset[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def decision_ids(self) -> set[str]:
+        return set(self._doc_ids)
+
+    def tags(self, decision_id: str) -> frozenset[str]:
+        return self._tags.get(decision_id, frozenset())
+
+    def upsert(self, decision_id: str, text: str, tags: list[str] | None = None) -> None:
+        self.remove(decision_id)
+        terms: dict[str, int] = {}
+        tokens = tokenize(text)
+        for token in tokens:
+            terms[token] = terms.get(token, 0) + 1
+
+        doc = self._next_doc
+        self._next_doc += 1
+        self._doc_ids[decision_id] = doc
+        self._decisions[doc] = decision_id
+        self._doc_terms[doc] = terms
+        self._doc_len[doc] = len(tokens)
+        self._total_len += len(tokens)
+        for term, tf in terms.items():
+            self._tfs.setdefault(term, {})[doc] = tf
+            self._postings.setdefault(term, []).append(doc)
+        self._tags[decision_id] = frozenset(t.lower() for t in tags or [])
+
+    def remove(self, decision_id: str) -> None:
+        doc = self._doc_ids.pop(decision_id, None)
+        self._tags.pop(decision_id, None)
+        if doc is None:
+            return
+        del self._decisions[doc]
+        self._total_len -= self._doc_len.pop(doc)
+        for term in self._doc_terms.pop(doc):
+            tfs = self._tfs[term]
+            del tfs[doc]
+            if tfs:
+                self._stale_terms.add(term)
+            else:
+                del self._tfs[term]
+                del self._postings[term]
+                self._stale_terms.discard(term)
+
+    def _posting_list(self, term: str) -> list[int]:
+        if term in self._stale_terms:
+            self._postings[term] = sorted(self._tfs[term])
+            self._stale_terms.discard(term)
+        return self._postings[term]
+
+    def _idf(self, term: str) -> float:
+        df = len(self._tfs[term])
+        return math.log(1 + (len(self._doc_ids) - df + 0.5) / (df + 0.5))
+
+    def score_bound(self, query: str) -> float:
+        """Highest score any document could reach for ``query``."""
+        return sum(
+            self._idf(term) * (self.k1 + 1) for term in set(tokenize(query)) if term in self._tfs
+        )
+
+    def search(self, query: str, k: int) -> list[tuple[str, float]]:
+        terms = [term for term in set(tokenize(query)) if term in self._tfs]
+        if not terms or k <= 0:
+            return []
+
+        avgdl = self._total_len / len(self._doc_ids) or 1.0
+        k1, b = self.k1, self.b
+        doc_len = self._doc_len
+        norms: dict[int, float] = {}
+
+        def contribution(idf: float, tf: int, doc: int) -> float:
+            norm = norms.get(doc)
+            if norm is None:
+                norm = norms[doc] = k1 * (1 - b + b * doc_len[doc] / avgdl)
+            return idf * tf * (k1 + 1) / (tf + norm)
+
+        # Ascending upper bound; prefix[i] bounds the total from terms[0..i]
+        idfs = {term: self._idf(term) for term in terms}
+        terms.sort(key=lambda term: idfs[term])
+        prefix = list(itertools.accumulate(idfs[term] * (k1 + 1) for term in terms))
+        postings = [self._posting_list(term) for term in terms]
+        tfs = [self._tfs[term] for term in terms]
+        cursors = [0] * len(terms)
+
+        heap: list[tuple[float, int]] = []
+        threshold = 0.0
+        first_essential = 0
+        while True:
+            while first_essential < len(terms) and prefix[first_essential] <= threshold:
+                first_essential += 1
+            if first_essential == len(terms):
+                break
+
+            doc = min(
+                (
+                    postings[i][cursors[i]]
+                    for i in range(first_essential, len(terms))
+                    if cursors[i] < len(postings[i])
+                ),
+                default=None,
+            )
+            if doc is None:
+                break
+
+            score = 0.0
+            for i in range(first_essential, len(terms)):
+                if cursors[i] < len(postings[i]) and postings[i][cursors[i]] == doc:
+                    score += contribution(idfs[terms[i]], tfs[i][doc], doc)
+                    cursors[i] += 1
+
+            for i in range(first_essential - 1, -1, -1):
+                if score + prefix[i] <= threshold:
+                    break
+                tf = tfs[i].get(doc)
+                if tf:
+                    score += contribution(idfs[terms[i]], tf, doc)
+
+            if len(heap) < k:
+                heapq.heappush(heap, (score, -doc))
+            elif score > threshold:
+                heapq.heapreplace(heap, (score, -doc))
+            if len(heap) == k:
+                threshold = heap[0][0]
+
+        return [
+            (self._decisions[-neg_doc], score)
+            for score, neg_doc in sorted(heap, key=lambda item: (-item[0], -item[1]))
+        ]
+
+
+def _document(title: str | None, summary: str | None, rationale: str | None) -> str:
+    return " ".join(part for part in (title, summary, rationale) if part)
+
+
+def _tags(row) -> list[str]:
+    return (row.tags or []) + (row.impact_area or [])
+
+
+class LexicalIndexRegistry:
+    def __init__(self):
+        self._indexes: dict[str, WorkspaceLexicalIndex] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> bool:
+        return settings.search_keyword_engine == "bm25"
+
+    def get(self, workspace_id: str) -> WorkspaceLexicalIndex | None:
+        return self._indexes.get(workspace_id) if self.available else None
+
+    def workspace_ids(self) -> list[str]:
+        return list(self._indexes)
+
+    async def _load(self, session: AsyncSession, workspace_id: str, decision_ids=None):
+        q = select(
+            Decision.id,
+            Decision.title,
+            Decision.summary,
+            Decision.rationale,
+            Decision.tags,
+            Decision.impact_area,
+        ).where(Decision.workspace_id == uuid.UUID(workspace_id), Decision.status == "active")
+        if decision_ids is not None:
+            q = q.where(Decision.id.in_([uuid.UUID(d) for d in decision_ids]))
+        return (await session.execute(q)).all()
+
+    async def warm(self, session_factory: async_sessionmaker) -> None:
+        if not self.available:
+            return
+        async with session_factory() as session:
+            workspace_ids = (
+                await session.execute(select(Decision.workspace_id).distinct())
+            ).scalars().all()
+            for ws in workspace_ids:
+                index = WorkspaceLexicalIndex()
+                for row in await self._load(session, str(ws)):
+                    index.upsert(
+                        str(row.id), _document(row.title, row.summary, row.rationale), _tags(row)
+                    )
+                async with self._lock:
+                    self._indexes[str(ws)] = index
+        log.info("lexical_index_warmed", workspaces=len(self._indexes))
+
+    async def refresh_decisions(
+        self, session: AsyncSession, workspace_id: str, decision_ids: list[str]
+    ) -> None:
+        if not self.available:
+            return
+        rows = {str(row.id): row for row in await self._load(session, workspace_id, decision_ids)}
+        async with self._lock:
+            index = self._indexes.setdefault(workspace_id, WorkspaceLexicalIndex())
+            for decision_id in decision_ids:
+                row = rows.get(decision_id)
+                if row is None:
+                    index.remove(decision_id)
+                else:
+                    index.upsert(
+                        decision_id, _document(row.title, row.summary, row.rationale), _tags(row)
+                    )
+
+    async def check_consistency(self, session: AsyncSession, workspace_id: str) -> dict:
+        index = self.get(workspace_id)
+        if index is None:
+            return {}
+        db_ids = {
+            str(i)
+            for i in (
+                await session.execute(
+                    select(Decision.id).where(
+                        Decision.workspace_id == uuid.UUID(workspace_id),
+                        Decision.status == "active",
+                    )
+                )
+            ).scalars()
+        }
+        missing = db_ids - index.decision_ids()
+        extra = index.decision_ids() - db_ids
+        if missing or extra:
+            log.warning(
+                "lexical_index_drift",
+                workspace_id=workspace_id,
+                missing=len(missing),
+                extra=len(extra),
+            )
+            await self.refresh_decisions(session, workspace_id, sorted(missing | extra))
+        return {"missing": len(missing), "extra": len(extra)}
+
+
+lexical_indexes = LexicalIndexRegistry()
@@ -0,0 +1,269 @@
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Decision, DecisionLink, MonitoredChannel, Workspace
+from app.integrations.artifacts import jira_artifact_key, normalize_artifact_ref
+from app.integrations.github.references import extract_github_references
+from app.integrations.jira.references import extract_jira_references
+from app.search.engine import _parse_timestamp
+from app.search.hydration import HYDRATE_COLUMNS, hydrate_results
+
+# Structured /decision queries ("PROJ-1234", "#812", "decisions by @alice",
+# "what did we decide in #infra last week") are answered with direct indexed
+# lookups. Anything with leftover free text goes to hybrid search.
+
+_USER_MENTION = re.compile(r"<@([UW][A-Z0-9]+)(?:\|[^>]*)?>")
+_CHANNEL_MENTION = re.compile(r"<#(C[A-Z0-9]+)(?:\|([^>]*))?>")
+_PLAIN_USER = re.compile(r"(?<!\w)@([\w.\-]+)")
+_PLAIN_CHANNEL = re.compile(r"(?<![\w&])#(?!\d+\b)([\w\-]+)")
+_PR_URL = re.compile(r"https?://github\.com/[^/\s]+/[^/\s]+/pull/\d+")
+_SHORT_PR = re.compile(r"(?<!\w)#\d+\b")
+_JIRA_KEY = re.compile(r"\b[A-Z][A-Z0-9]+-\d+\b")
+
+_RELATIVE_DAYS = re.compile(r"\b(?:last|past)\s+(\d+)\s+(day|week)s?\b", re.IGNORECASE)
+_SINCE_DATE = re.compile(r"\bsince\s+(\d{4}-\d{2}-\d{2})\b", re.IGNORECASE)
+_ON_DATE = re.compile(r"\bon\s+(\d{4}-\d{2}-\d{2})\b", re.IGNORECASE)
+_NAMED_PERIOD = re.compile(r"\b(today|yesterday|(?:this|last)\s+(?:week|month))\b", re.IGNORECASE)
+
+FILLER_WORDS = frozenset(
+    """
+    a about all any anything are by decide decided decision decisions did do does
+    for from in is made me of on or our pr prs related show that the ticket tickets
+    to us was we were what when which with
+    """.split()
+)
+
+
+def _utc_date(value: str) -> datetime | None:
+    # The grammar only checks the shape; 2026-02-30 is left to hybrid search
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def _period(name: str, now: datetime) -> tuple[datetime, datetime | None]:
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    name = " ".join(name.lower().split())
+    if name == "today":
+        return today, None
+    if name == "yesterday":
+        return today - timedelta(days=1), today
+    week_start = today - timedelta(days=today.weekday())
+    if name == "this week":
+        return week_start, None
+    if name == "last week":
+        return week_start - timedelta(days=7), week_start
+    month_start = today.replace(day=1)
+    if name == "this month":
+        return month_start, None
+    previous_month = (month_start - timedelta(days=1)).replace(day=1)
+    return previous_month, month_start
+
+
+def parse_lookup(query: str, now: datetime | None = None) -> dict | None:
+    """Recognise a structured lookup, or return None for free-text queries."""
+    now = now or datetime.now(timezone.utc)
+    rest = query.strip().rstrip("?.! ")
+    intent: dict = {
+        "jira_keys": [],
+        "pr_numbers": [],
+        "pr_urls": [],
+        "owner_slack_id": None,
+        "owner_name": None,
+        "channel_id": None,
+        "channel_name": None,
+        "date_from": None,
+        "date_to": None,
+        "described": [],
+    }
+
+    def take(pattern: re.Pattern) -> list[re.Match]:
+        nonlocal rest
+        matches = list(pattern.finditer(rest))
+        rest = pattern.sub(" ", rest)
+        return matches
+
+    for ref in extract_github_references(query):
+        if ref["url"]:
+            intent["pr_urls"].append(ref["url"])
+        else:
+            intent["pr_numbers"].append(ref["number"])
+    take(_PR_URL)
+    take(_SHORT_PR)
+
+    intent["jira_keys"] = extract_jira_references(rest)
+    take(_JIRA_KEY)
+
+    if match := next(iter(take(_USER_MENTION)), None):
+        intent["owner_slack_id"] = match.group(1)
+        intent["described"].append(f"by {match.group(0)}")
+    elif match := next(iter(take(_PLAIN_USER)), None):
+        intent["owner_name"] = match.group(1)
+        intent["described"].append(f"by @{match.group(1)}")
+
+    if match := next(iter(take(_CHANNEL_MENTION)), None):
+        intent["channel_id"] = match.group(1)
+        intent["described"].append(f"in {match.group(0)}")
+    elif match := next(iter(take(_PLAIN_CHANNEL)), None):
+        intent["channel_name"] = match.group(1).lower()
+        intent["described"].append(f"in #{intent['channel_name']}")
+
+    if match := next(iter(take(_RELATIVE_DAYS)), None):
+        days = int(match.group(1)) * (7 if match.group(2).lower() == "week" else 1)
+        intent["date_from"] = now - timedelta(days=days)
+        intent["described"].append(match.group(0).lower())
+    elif match := next(iter(take(_SINCE_DATE)), None):
+        if (since := _utc_date(match.group(1))) is None:
+            return None
+        intent["date_from"] = since
+        intent["described"].append(match.group(0).lower())
+    elif match := next(iter(take(_ON_DATE)), None):
+        if (day := _utc_date(match.group(1))) is None:
+            return None
+        intent["date_from"], intent["date_to"] = day, day + timedelta(days=1)
+        intent["described"].append(match.group(0).lower())
+    elif match := next(iter(take(_NAMED_PERIOD)), None):
+        intent["date_from"], intent["date_to"] = _period(match.group(1), now)
+        intent["described"].append(" ".join(match.group(1).lower().split()))
+
+    leftover = [w for w in re.findall(r"[\w']+", rest.lower()) if w not in FILLER_WORDS]
+    structured = any(
+        intent[key]
+        for key in (
+            "jira_keys", "pr_numbers", "pr_urls", "owner_slack_id", "owner_name",
+            "channel_id", "channel_name", "date_from",
+        )
+    )
+    if leftover or not structured:
+        return None
+
+    artifacts = intent["jira_keys"] + [f"#{n}" for n in intent["pr_numbers"]] + intent["pr_urls"]
+    if artifacts:
+        intent["described"].insert(0, "referencing " + ", ".join(artifacts))
+    return intent
+
+
+def _artifact_condition(workspace_id: uuid.UUID, intent: dict):
+    keys = [jira_artifact_key(key) for key in intent["jira_keys"]]
+    keys += [normalize_artifact_ref(url) for url in intent["pr_urls"]]
+    key_conditions = [DecisionLink.artifact_key.in_(keys)] if keys else []
+    for number in intent["pr_numbers"]:
+        # Bare PR numbers resolve against the workspace's default repository
+        key_conditions.append(
+            DecisionLink.artifact_key
+            == select(
+                func.lower(Workspace.github_org)
+                + "/"
+                + func.lower(Workspace.github_repo)
+                + f"#{number}"
+            )
+            .where(Workspace.id == workspace_id)
+            .scalar_subquery()
+        )
+    if not key_conditions:
+        return None
+
+    linked = Decision.id.in_(
+        select(DecisionLink.decision_id).where(
+            DecisionLink.workspace_id == workspace_id, or_(*key_conditions)
+        )
+    )
+    # Jira keys are also matched in decision text when no integration linked them
+    mentioned = [
+        Decision.search_vector.op("@@")(func.phraseto_tsquery("english", key))
+        for key in intent["jira_keys"]
+    ]
+    return or_(linked, *mentioned)
+
+
+def build_lookup_query(workspace_id: str, intent: dict, filters: dict | None = None):
+    filters = filters or {}
+    conditions = [
+        Decision.workspace_id == uuid.UUID(workspace_id),
+        Decision.status == "active",
+    ]
+    if (artifacts := _artifact_condition(uuid.UUID(workspace_id), intent)) is not None:
+        conditions.append(artifacts)
+
+    owner_slack_id = intent["owner_slack_id"] or filters.get("owner_slack_id")
+    if owner_slack_id:
+        conditions.append(Decision.owner_slack_id == owner_slack_id)
+    if intent["owner_name"]:
+        conditions.append(Decision.owner_name.ilike(f"{intent['owner_name']}%"))
+    if intent["channel_id"]:
+        conditions.append(Decision.source_channel_id == intent["channel_id"])
+    if intent["channel_name"]:
+        # Resolve the name through monitored_channels so both forms use the
+        # (workspace_id, source_channel_id, created_at) index
+        conditions.append(
+            Decision.source_channel_id.in_(
+                select(MonitoredChannel.channel_id).where(
+                    MonitoredChannel.workspace_id == uuid.UUID(workspace_id),
+                    MonitoredChannel.channel_name == intent["channel_name"],
+                )
+            )
+        )
+
+    date_from = intent["date_from"] or _parse_timestamp(filters.get("date_from"))
+    date_to = intent["date_to"] or _parse_timestamp(filters.get("date_to"))
+    if date_from:
+        conditions.append(Decision.created_at >= date_from)
+    if date_to:
+        conditions.append(Decision.created_at < date_to)
+    if filters.get("categories"):
+        conditions.append(Decision.category.in_(filters["categories"]))
+    if filters.get("tags"):
+        conditions.append(Decision.tags.overlap(filters["tags"]))
+
+    return select(Decision.id, func.count().over().label("total")).where(*conditions)
+
+
+def describe_lookup(intent: dict, total: int) -> str:
+    described = " ".join(intent["described"])
+    if total == 0:
+        return f"No decisions found {described}."
+    noun = "decision" if total == 1 else "decisions"
+    return f"Found {total} {noun} {described}."
+
+
+async def run_lookup(
+    db_session: AsyncSession,
+    workspace_id: str,
+    intent: dict,
+    filters: dict | None = None,
+    limit: int = 5,
+    offset: int = 0,
+    columns: tuple[str, ...] = HYDRATE_COLUMNS,
+) -> dict:
+    rows = (
+        await db_session.execute(
+            build_lookup_query(workspace_id, intent, filters)
+            .order_by(Decision.created_at.desc(), Decision.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+    ).all()
+    total = rows[0].total if rows else 0
+    if not rows and offset:
+        total = (
+            await db_session.execute(
+                select(func.count()).select_from(
+                    build_lookup_query(workspace_id, intent, filters).subquery()
+                )
+            )
+        ).scalar_one()
+
+    decisions = await hydrate_results(
+        db_session, [(str(row.id), 1.0) for row in rows], columns
+    )
+    return {
+        "decisions": decisions,
+        "total_count": total,
+        "degraded": False,
+        "answer": describe_lookup(intent, total),
+    }
@@ -1,16 +1,18 @@
 import time
-import uuid
 
 import structlog
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.ai.synthesizer import synthesize_answer
-from app.db.models import DecisionLink, QueryLog
-from app.search.engine import hybrid_search
+from app.search.engine import hybrid_search, load_search_settings
+from app.search.hydration import HYDRATE_COLUMNS, attach_links
+from app.search.lookup import parse_lookup, run_lookup
+from app.search.query_log import query_log_buffer
 
 log = structlog.get_logger()
 
+SYNTHESIS_COLUMNS = ("title", "summary", "rationale", "owner_name", "decision_made_at", "source_url")
+
 
 async def handle_decision_query(
     db_session: AsyncSession,
@@ -18,56 +20,76 @@ async def handle_decision_query(
     query_text: str,
     user_slack_id: str,
     source: str = "slack",
+    filters: dict | None = None,
+    limit: int = 5,
+    offset: int = 0,
+    ef_search: int | None = None,
+    columns: tuple[str, ...] = HYDRATE_COLUMNS,
 ) -> dict:
     start = time.monotonic()
 
-    results = await hybrid_search(db_session, workspace_id, query_text)
+    # Structured lookups skip the embedding, hybrid SQL and synthesis entirely
+    intent = parse_lookup(query_text)
+    if intent is not None:
+        route = "lookup"
+        search = await run_lookup(
+            db_session, workspace_id, intent, filters, limit, offset, columns
+        )
+        timings = {"lookup_ms": round((time.monotonic() - start) * 1000, 2)}
+    else:
+        route = "hybrid"
+        search_settings = await load_search_settings(db_session, workspace_id)
+        if ef_search is None:
+            ef_search = search_settings.get("ef_search")
 
-    for result in results:
-        links = (
-            await db_session.execute(
-                select(DecisionLink).where(
-                    DecisionLink.decision_id == uuid.UUID(result["id"])
-                )
-            )
-        ).scalars().all()
+        search = await hybrid_search(
+            db_session,
+            workspace_id,
+            query_text,
+            filters=filters,
+            limit=limit,
+            offset=offset,
+            ef_search=ef_search,
+            fusion_mode=search_settings.get("fusion_mode"),
+            fusion_weights=search_settings.get("fusion_weights"),
+            # Synthesis reads these whatever the caller projected
+            columns=tuple(c for c in HYDRATE_COLUMNS if c in columns or c in SYNTHESIS_COLUMNS),
+        )
+        timings = dict(search["timings"])
+    results = search["decisions"]
 
-        result["referenced_tickets"] = []
-        result["referenced_prs"] = []
-        result["referenced_urls"] = []
-        for link in links:
-            if link.link_type == "jira":
-                result["referenced_tickets"].append(link.link_title or link.link_url)
-            elif link.link_type == "github_pr":
-                result["referenced_prs"].append(link.link_title or link.link_url)
-            else:
-                result["referenced_urls"].append(link.link_url)
+    links_start = time.monotonic()
+    await attach_links(db_session, results)
+    timings["links_ms"] = round((time.monotonic() - links_start) * 1000, 2)
 
-    answer = await synthesize_answer(query_text, results)
+    if route == "lookup":
+        answer = search["answer"]
+    else:
+        synthesis_start = time.monotonic()
+        answer = await synthesize_answer(query_text, results)
+        timings["synthesis_ms"] = round((time.monotonic() - synthesis_start) * 1000, 2)
 
+    # Stop the clock before logging; the row is written by a background flush
     elapsed_ms = int((time.monotonic() - start) * 1000)
-
-    query_log = QueryLog(
-        id=uuid.uuid4(),
-        workspace_id=uuid.UUID(workspace_id),
-        user_slack_id=user_slack_id,
-        query_text=query_text,
-        results_count=len(results),
-        response_time_ms=elapsed_ms,
-        source=source,
+    query_log_buffer.record(
+        workspace_id, user_slack_id, query_text, len(results), elapsed_ms, source
     )
-    db_session.add(query_log)
-    await db_session.commit()
 
     log.info(
         "query_handled",
         workspace_id=workspace_id,
+        route=route,
         results=len(results),
         elapsed_ms=elapsed_ms,
+        **timings,
     )
 
     return {
         "answer": answer,
         "decisions": results,
+        "total_count": search["total_count"],
+        "degraded": search["degraded"],
+        "route": route,
         "response_time_ms": elapsed_ms,
+        "timings": timings,
     }
@@ -0,0 +1,114 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import structlog
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.db.models import QueryLog
+
+log = structlog.get_logger()
+
+
+class QueryLogBuffer:
+    """Bounded in-memory buffer of query_logs rows, flushed in bulk inserts.
+
+    Searches only enqueue a row; a background task inserts them whenever a
+    batch of ``query_log_batch_size`` is waiting or every
+    ``query_log_flush_interval_s``. When the buffer is full new rows are
+    dropped and counted rather than blocking a search.
+    """
+
+    def __init__(self, max_size: int | None = None):
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(
+            maxsize=max_size or settings.query_log_buffer_size
+        )
+        self._task: asyncio.Task | None = None
+        self._session_factory: async_sessionmaker | None = None
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    def record(
+        self,
+        workspace_id: str,
+        user_slack_id: str,
+        query_text: str,
+        results_count: int,
+        response_time_ms: int,
+        source: str,
+    ) -> None:
+        row = {
+            "id": uuid.uuid4(),
+            "workspace_id": uuid.UUID(workspace_id),
+            "user_slack_id": user_slack_id,
+            "query_text": query_text,
+            "results_count": results_count,
+            "response_time_ms": response_time_ms,
+            "source": source,
+            # Stamped now: the row may reach the table a few seconds later
+            "created_at": datetime.now(timezone.utc),
+        }
+        try:
+            self._queue.put_nowait(row)
+            if self._queue.qsize() >= settings.query_log_batch_size:
+                self._wake.set()
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                log.warning("query_log_buffer_full", dropped=self.dropped)
+
+    def _drain(self, limit: int) -> list[dict]:
+        rows = []
+        while len(rows) < limit and not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        return rows
+
+    async def _insert(self, rows: list[dict]) -> None:
+        if not rows:
+            return
+        try:
+            async with self._session_factory() as session:
+                await session.execute(insert(QueryLog), rows)
+                await session.commit()
+        except Exception as exc:
+            log.error("query_log_flush_error", rows=len(rows), error=str(exc))
+
+    async def flush(self) -> None:
+        while rows := self._drain(settings.query_log_batch_size):
+            await self._insert(rows)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(
+                    self._wake.wait(), timeout=settings.query_log_flush_interval_s
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    def start(self, session_factory: async_sessionmaker) -> None:
+        self._session_factory = session_factory
+        self._stopping = False
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher and write out everything still buffered."""
+        self._stopping = True
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        if self._session_factory is not None:
+            await self.flush()
+
+
+query_log_buffer = QueryLogBuffer()
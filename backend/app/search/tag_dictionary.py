@@ -0,0 +1,125 @@
+import re
+import time
+import uuid
+from collections import deque
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.models import Decision
+
+# Hyphens, underscores and whitespace are interchangeable, so "event sourcing"
+# in a query matches the "event-sourcing" tag.
+_SEPARATORS = re.compile(r"[\s\-_]+")
+
+
+def _normalize(text: str) -> str:
+    return _SEPARATORS.sub(" ", text.lower()).strip()
+
+
+class TagMatcher:
+    """Aho-Corasick automaton over a workspace's tags and impact areas.
+
+    ``match`` scans the query once and returns only whole-word occurrences of
+    known values, so noise words never reach the ``&&`` overlap checks.
+    """
+
+    KINDS = ("tags", "impact_areas")
+
+    def __init__(self, tags: list[str], impact_areas: list[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+        self._patterns: list[tuple[int, str, str]] = []
+
+        for kind, values in zip(self.KINDS, (tags, impact_areas)):
+            for value in set(values):
+                key = _normalize(value)
+                if key:
+                    self._add(key, kind, value)
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def _add(self, key: str, kind: str, value: str) -> None:
+        node = 0
+        for char in key:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(len(self._patterns))
+        self._patterns.append((len(key), kind, value))
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def match(self, query: str) -> dict[str, list[str]]:
+        text = _normalize(query)
+        found: dict[str, dict[str, None]] = {kind: {} for kind in self.KINDS}
+        node = 0
+        for end, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for pattern in self._out[node]:
+                length, kind, value = self._patterns[pattern]
+                start = end - length + 1
+                before_ok = start == 0 or not text[start - 1].isalnum()
+                after_ok = end + 1 == len(text) or not text[end + 1].isalnum()
+                if before_ok and after_ok:
+                    found[kind][value] = None
+        return {kind: list(values) for kind, values in found.items()}
+
+
+_cache: dict[str, tuple[float, TagMatcher]] = {}
+
+
+async def _load(db_session: AsyncSession, workspace_id: str) -> TagMatcher:
+    ws = uuid.UUID(workspace_id)
+    active = (Decision.workspace_id == ws, Decision.status == "active")
+    tags = (
+        await db_session.execute(select(func.unnest(Decision.tags)).where(*active).distinct())
+    ).scalars().all()
+    impact_areas = (
+        await db_session.execute(
+            select(func.unnest(Decision.impact_area)).where(*active).distinct()
+        )
+    ).scalars().all()
+    return TagMatcher(tags, impact_areas)
+
+
+async def get_tag_matcher(db_session: AsyncSession, workspace_id: str) -> TagMatcher:
+    """Cached per workspace for ``tag_dictionary_ttl_s``.
+
+    New tags reach queries once the entry expires; until then they only miss
+    the tag bonus, never the keyword or vector legs.
+    """
+    cached = _cache.get(workspace_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    matcher = await _load(db_session, workspace_id)
+    _cache[workspace_id] = (time.monotonic() + settings.tag_dictionary_ttl_s, matcher)
+    return matcher
+
+
+def invalidate(workspace_id: str | None = None) -> None:
+    if workspace_id is None:
+        _cache.clear()
+    else:
+        _cache.pop(workspace_id, None)
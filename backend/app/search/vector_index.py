@@ -0,0 +1,309 @@
+import asyncio
+import json
+import uuid
+from pathlib import Path
+
+import structlog
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.models import Decision, DecisionChunk
+
+try:
+    import numpy as np
+except ImportError:  # optional: pip install "decision-ledger[vector-index]"
+    np = None
+
+log = structlog.get_logger()
+
+
+class WorkspaceVectorIndex:
+    """Exact cosine search over one workspace's active decision and chunk vectors.
+
+    Rows live in a contiguous float32 matrix of unit vectors; each row belongs
+    to a decision, and search aggregates rows back to decisions by max-sim.
+    Removed rows are tombstoned and compacted once they make up a quarter of
+    the matrix.
+    """
+
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+        self._matrix = np.zeros((0, dim), dtype=np.float32)
+        self._size = 0
+        self._alive = np.zeros(0, dtype=bool)
+        self._owners: list[str] = []
+        self._rows: dict[str, list[int]] = {}
+        self._tags: dict[str, frozenset[str]] = {}
+        self.fingerprint: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def decision_ids(self) -> set[str]:
+        return set(self._rows)
+
+    def tags(self, decision_id: str) -> frozenset[str]:
+        return self._tags.get(decision_id, frozenset())
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        if needed <= self._matrix.shape[0] and self._matrix.flags.writeable:
+            return
+        capacity = max(needed, int(self._matrix.shape[0] * 1.5), 64)
+        matrix = np.zeros((capacity, self.dim), dtype=np.float32)
+        matrix[: self._size] = self._matrix[: self._size]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self._size] = self._alive[: self._size]
+        self._matrix, self._alive = matrix, alive
+
+    def upsert(self, decision_id: str, vectors: list, tags: list[str] | None = None) -> None:
+        self.remove(decision_id)
+        block = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        norms = np.linalg.norm(block, axis=1, keepdims=True)
+        block = block / np.where(norms == 0, 1, norms)
+
+        self._reserve(len(block))
+        start = self._size
+        self._matrix[start : start + len(block)] = block
+        self._alive[start : start + len(block)] = True
+        self._size += len(block)
+        self._owners.extend([decision_id] * len(block))
+        self._rows[decision_id] = list(range(start, start + len(block)))
+        self._tags[decision_id] = frozenset(t.lower() for t in tags or [])
+
+    def remove(self, decision_id: str) -> None:
+        rows = self._rows.pop(decision_id, None)
+        self._tags.pop(decision_id, None)
+        if not rows:
+            return
+        if not self._alive.flags.writeable:
+            self._alive = self._alive.copy()
+        self._alive[rows] = False
+        dead = self._size - int(self._alive[: self._size].sum())
+        if dead * 4 > self._size:
+            self._compact()
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self._alive[: self._size])
+        self._matrix = np.ascontiguousarray(self._matrix[keep])
+        self._owners = [self._owners[i] for i in keep]
+        self._size = len(keep)
+        self._alive = np.ones(self._size, dtype=bool)
+        self._rows = {}
+        for row, decision_id in enumerate(self._owners):
+            self._rows.setdefault(decision_id, []).append(row)
+
+    def search(self, query: list[float], k: int) -> list[tuple[str, float]]:
+        if self._size == 0 or not self._rows:
+            return []
+        q = np.asarray(query, dtype=np.float32)
+        q = q / (np.linalg.norm(q) or 1.0)
+
+        scores = self._matrix[: self._size] @ q
+        scores[~self._alive[: self._size]] = -np.inf
+
+        # Over-fetch rows so that k distinct decisions survive max-sim grouping
+        fetch = min(self._size, k * settings.max_chunks_per_decision)
+        top = np.argpartition(-scores, fetch - 1)[:fetch]
+        best: dict[str, float] = {}
+        for row in top[np.argsort(-scores[top])]:
+            if not np.isfinite(scores[row]):
+                break
+            decision_id = self._owners[row]
+            if decision_id not in best:
+                best[decision_id] = float(scores[row])
+                if len(best) == k:
+                    break
+        return list(best.items())
+
+    def save(self, path: Path) -> None:
+        self._compact()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.npy")
+        np.save(tmp, self._matrix[: self._size])
+        tmp.replace(path.with_suffix(".npy"))
+        path.with_suffix(".json").write_text(
+            json.dumps(
+                {
+                    "dim": self.dim,
+                    "owners": self._owners,
+                    "tags": {d: sorted(t) for d, t in self._tags.items()},
+                    "fingerprint": self.fingerprint,
+                }
+            )
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "WorkspaceVectorIndex":
+        meta = json.loads(path.with_suffix(".json").read_text())
+        index = cls(meta["dim"])
+        # Memory-mapped read-only; the first write copies it into RAM
+        index._matrix = np.load(path.with_suffix(".npy"), mmap_mode="r")
+        index._size = index._matrix.shape[0]
+        index._alive = np.ones(index._size, dtype=bool)
+        index._owners = meta["owners"]
+        for row, decision_id in enumerate(index._owners):
+            index._rows.setdefault(decision_id, []).append(row)
+        index._tags = {d: frozenset(t) for d, t in meta["tags"].items()}
+        index.fingerprint = meta["fingerprint"]
+        return index
+
+
+async def _fingerprint(session: AsyncSession, workspace_id: uuid.UUID) -> dict:
+    count, last_update = (
+        await session.execute(
+            select(func.count(Decision.id), func.max(Decision.updated_at)).where(
+                Decision.workspace_id == workspace_id,
+                Decision.status == "active",
+                Decision.embedding.is_not(None),
+            )
+        )
+    ).one()
+    return {"count": count, "updated_at": last_update.isoformat() if last_update else None}
+
+
+async def _load_vectors(session: AsyncSession, workspace_id: uuid.UUID, decision_ids=None):
+    decision_q = select(
+        Decision.id, Decision.tags, Decision.impact_area, Decision.embedding
+    ).where(
+        Decision.workspace_id == workspace_id,
+        Decision.status == "active",
+        Decision.embedding.is_not(None),
+    )
+    chunk_q = (
+        select(DecisionChunk.decision_id, DecisionChunk.embedding)
+        .join(Decision, Decision.id == DecisionChunk.decision_id)
+        .where(
+            DecisionChunk.workspace_id == workspace_id,
+            Decision.status == "active",
+            Decision.embedding.is_not(None),
+        )
+        .order_by(DecisionChunk.decision_id, DecisionChunk.chunk_index)
+    )
+    if decision_ids is not None:
+        decision_q = decision_q.where(Decision.id.in_(decision_ids))
+        chunk_q = chunk_q.where(DecisionChunk.decision_id.in_(decision_ids))
+
+    vectors: dict[str, list] = {}
+    tags: dict[str, list[str]] = {}
+    for decision_id, decision_tags, impact_area, embedding in (
+        await session.execute(decision_q)
+    ).all():
+        vectors[str(decision_id)] = [embedding]
+        # Impact areas share the tag bonus, so they match like tags here
+        tags[str(decision_id)] = (decision_tags or []) + (impact_area or [])
+    for decision_id, embedding in (await session.execute(chunk_q)).all():
+        vectors.setdefault(str(decision_id), []).append(embedding)
+    return vectors, tags
+
+
+class VectorIndexRegistry:
+    def __init__(self):
+        self._indexes: dict[str, WorkspaceVectorIndex] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> bool:
+        return settings.vector_index_enabled and np is not None
+
+    def get(self, workspace_id: str) -> WorkspaceVectorIndex | None:
+        return self._indexes.get(workspace_id) if self.available else None
+
+    def workspace_ids(self) -> list[str]:
+        return list(self._indexes)
+
+    def _snapshot_path(self, workspace_id: str) -> Path | None:
+        if not settings.vector_index_snapshot_dir:
+            return None
+        return Path(settings.vector_index_snapshot_dir) / workspace_id
+
+    async def build(self, session: AsyncSession, workspace_id: str) -> WorkspaceVectorIndex:
+        ws = uuid.UUID(workspace_id)
+        index = WorkspaceVectorIndex()
+        vectors, tags = await _load_vectors(session, ws)
+        for decision_id, rows in vectors.items():
+            index.upsert(decision_id, rows, tags.get(decision_id))
+        index.fingerprint = await _fingerprint(session, ws)
+        return index
+
+    async def warm(self, session_factory: async_sessionmaker) -> None:
+        if not self.available:
+            return
+        async with session_factory() as session:
+            workspace_ids = (
+                await session.execute(select(Decision.workspace_id).distinct())
+            ).scalars().all()
+            for ws in workspace_ids:
+                workspace_id = str(ws)
+                index = None
+                path = self._snapshot_path(workspace_id)
+                if path and path.with_suffix(".json").exists():
+                    index = WorkspaceVectorIndex.load(path)
+                    if index.fingerprint != await _fingerprint(session, ws):
+                        log.info("vector_index_snapshot_stale", workspace_id=workspace_id)
+                        index = None
+                if index is None:
+                    index = await self.build(session, workspace_id)
+                async with self._lock:
+                    self._indexes[workspace_id] = index
+        log.info("vector_index_warmed", workspaces=len(self._indexes))
+
+    async def refresh_decisions(
+        self, session: AsyncSession, workspace_id: str, decision_ids: list[str]
+    ) -> None:
+        if not self.available:
+            return
+        ws = uuid.UUID(workspace_id)
+        vectors, tags = await _load_vectors(
+            session, ws, [uuid.UUID(d) for d in decision_ids]
+        )
+        fingerprint = await _fingerprint(session, ws)
+        async with self._lock:
+            index = self._indexes.setdefault(workspace_id, WorkspaceVectorIndex())
+            for decision_id in decision_ids:
+                if decision_id in vectors:
+                    index.upsert(decision_id, vectors[decision_id], tags.get(decision_id))
+                else:
+                    index.remove(decision_id)
+            index.fingerprint = fingerprint
+
+    async def check_consistency(self, session: AsyncSession, workspace_id: str) -> dict:
+        """Compare the index with the decisions table and repair any drift."""
+        index = self.get(workspace_id)
+        if index is None:
+            return {}
+        ws = uuid.UUID(workspace_id)
+        db_ids = {
+            str(i)
+            for i in (
+                await session.execute(
+                    select(Decision.id).where(
+                        Decision.workspace_id == ws,
+                        Decision.status == "active",
+                        Decision.embedding.is_not(None),
+                    )
+                )
+            ).scalars()
+        }
+        missing = db_ids - index.decision_ids()
+        extra = index.decision_ids() - db_ids
+        if missing or extra:
+            log.warning(
+                "vector_index_drift",
+                workspace_id=workspace_id,
+                missing=len(missing),
+                extra=len(extra),
+            )
+            await self.refresh_decisions(session, workspace_id, sorted(missing | extra))
+        return {"missing": len(missing), "extra": len(extra)}
+
+    def snapshot(self) -> None:
+        for workspace_id, index in self._indexes.items():
+            path = self._snapshot_path(workspace_id)
+            if path:
+                index.save(path)
+
+
+vector_indexes = VectorIndexRegistry()
+
@@ -10,8 +10,10 @@ from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.config import settings
+from app.db.changes import bump_decisions_version
 from app.db.models import Decision, PendingConfirmation
 from app.db.session import async_session_factory
+from app.search.index_sync import publish_decision_change
 from app.slack import router
 from app.slack import client as slack_client
 from app.slack.messages import build_confirmed_blocks, build_ignored_blocks
@@ -86,6 +88,7 @@ async def _handle_confirm(
         decision.status = "active"
         decision.confirmed_at = datetime.now(timezone.utc)
         decision.confirmed_by = user_id
+        await bump_decisions_version(session, decision.workspace_id)
         await session.commit()
         await session.refresh(decision)
 
@@ -102,6 +105,7 @@ async def _handle_confirm(
 
         await arq_pool.enqueue_job("enrich_decision", decision_id)
         await arq_pool.enqueue_job("generate_embedding_task", decision_id)
+        await publish_decision_change(arq_pool, decision.workspace_id, decision_id)
 
 
 async def _handle_edit(decision_id: str, payload: dict) -> None:
@@ -207,6 +211,7 @@ async def _handle_ignore(
 
         workspace = decision.workspace
         decision.status = "ignored"
+        await bump_decisions_version(session, decision.workspace_id)
         await session.commit()
         await session.refresh(decision)
 
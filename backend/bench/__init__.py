@@ -0,0 +1 @@
+"""Benchmark suite for hybrid search; see ``python -m bench --help``."""
@@ -0,0 +1,111 @@
+"""Hybrid search benchmark suite.
+
+    python -m bench generate --decisions 100000 --workspaces 2 --clean
+    python -m bench workload --queries 500 --out workload.json
+    python -m bench run --workload workload.json --concurrency 8 --k 10 --out results.json
+
+Run from backend/ against a scratch database: ``generate --clean`` removes
+every earlier benchmark workspace. Index and search settings come from the
+usual environment variables (HNSW_EF_SEARCH, VECTOR_INDEX_ENABLED, ...), and
+the settings in effect are recorded in each result file.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from app.db.session import async_session_factory, engine
+from bench import corpus, runner, workload
+
+
+def _write(result: dict, out: str | None) -> None:
+    payload = json.dumps(result, indent=2)
+    if out:
+        Path(out).write_text(payload + "\n")
+        print(f"wrote {out}")
+    else:
+        print(payload)
+
+
+async def _main(args: argparse.Namespace) -> int:
+    try:
+        if args.command == "generate":
+            result = await corpus.generate(
+                engine,
+                args.decisions,
+                workspaces=args.workspaces,
+                seed=args.seed,
+                noise=args.noise,
+                batch_size=args.batch_size,
+                clean=args.clean,
+                rebuild_index=not args.keep_index,
+            )
+            _write(result, args.out)
+        elif args.command == "workload":
+            workspaces = await workload.bench_workspaces(engine)
+            _write(
+                workload.build_workload(
+                    workspaces,
+                    args.queries,
+                    seed=args.seed,
+                    filter_ratio=args.filter_ratio,
+                    lookup_ratio=args.lookup_ratio,
+                ),
+                args.out,
+            )
+        else:
+            result = await runner.run(
+                async_session_factory,
+                json.loads(Path(args.workload).read_text()),
+                k=args.k,
+                concurrency=args.concurrency,
+                warmup=args.warmup,
+                ef_search=args.ef_search,
+                recall_queries=args.recall_queries,
+            )
+            _write(result, args.out)
+    finally:
+        await engine.dispose()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m bench", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gen = commands.add_parser("generate", help="bulk-load a synthetic corpus with COPY")
+    gen.add_argument("--decisions", type=int, default=10_000)
+    gen.add_argument("--workspaces", type=int, default=1)
+    gen.add_argument("--seed", type=int, default=42)
+    gen.add_argument("--noise", type=float, default=1.0, help="embedding spread around topic centroids")
+    gen.add_argument("--batch-size", type=int, default=10_000, help="rows per COPY")
+    gen.add_argument("--clean", action="store_true", help="delete earlier benchmark workspaces first")
+    gen.add_argument(
+        "--keep-index", action="store_true",
+        help="insert through the live HNSW index instead of dropping and rebuilding it",
+    )
+    gen.add_argument("--out")
+
+    wl = commands.add_parser("workload", help="generate queries for the benchmark workspaces")
+    wl.add_argument("--queries", type=int, default=500)
+    wl.add_argument("--seed", type=int, default=7)
+    wl.add_argument("--filter-ratio", type=float, default=0.2)
+    wl.add_argument("--lookup-ratio", type=float, default=0.0)
+    wl.add_argument("--out")
+
+    run = commands.add_parser("run", help="replay a workload and report latency and recall")
+    run.add_argument("--workload", required=True)
+    run.add_argument("--k", type=int, default=10)
+    run.add_argument("--concurrency", type=int, default=8)
+    run.add_argument("--warmup", type=int, default=20)
+    run.add_argument("--ef-search", type=int)
+    run.add_argument("--recall-queries", type=int, default=100)
+    run.add_argument("--out")
+
+    return asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
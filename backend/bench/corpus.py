@@ -0,0 +1,239 @@
+"""Synthetic decision corpus, bulk-loaded with COPY.
+
+Decisions are drawn from a fixed set of topics. Each topic has a seeded
+centroid, and a decision's embedding is its topics' centroid plus Gaussian
+noise, normalized to unit length. That clusters the vectors the way real
+embeddings cluster, so ANN recall numbers mean something. The workload
+generator rebuilds the same centroids from the seed stored on the
+workspace.
+"""
+
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from pgvector.asyncpg import register_vector
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+
+DIM = 1024
+BENCH_TEAM_PREFIX = "T_BENCH_"
+
+CATEGORIES = (
+    "architecture", "schema", "api", "infrastructure", "deprecation", "dependency",
+    "naming", "process", "security", "performance", "tooling",
+)
+# Skewed like a real ledger: a few categories dominate
+CATEGORY_WEIGHTS = (18, 14, 14, 16, 4, 8, 3, 7, 6, 7, 3)
+
+TOPICS: dict[str, list[str]] = {
+    "postgres": ["postgres", "database", "index", "vacuum", "replica", "migration"],
+    "redis": ["redis", "cache", "eviction", "ttl", "session"],
+    "kafka": ["kafka", "queue", "consumer", "partition", "event-sourcing"],
+    "auth": ["auth", "oauth", "jwt", "sso", "permissions"],
+    "billing": ["billing", "stripe", "invoice", "pricing", "tax"],
+    "frontend": ["frontend", "react", "nextjs", "design-system", "accessibility"],
+    "api": ["api", "graphql", "rest", "versioning", "rate-limit"],
+    "infra": ["kubernetes", "terraform", "aws", "autoscaling", "networking"],
+    "observability": ["observability", "tracing", "metrics", "alerts", "logging"],
+    "search": ["search", "embeddings", "ranking", "relevance", "pgvector"],
+    "mobile": ["mobile", "ios", "android", "push-notifications", "offline"],
+    "testing": ["testing", "ci", "flaky-tests", "fixtures", "coverage"],
+    "security": ["security", "secrets", "encryption", "audit", "compliance"],
+    "data": ["data", "warehouse", "etl", "dbt", "analytics"],
+    "ml": ["ml", "training", "inference", "feature-store", "evaluation"],
+    "deploy": ["deploy", "release", "feature-flags", "rollback", "canary"],
+}
+
+VERBS = ["Adopt", "Migrate to", "Deprecate", "Standardize on", "Replace", "Introduce", "Drop", "Split"]
+COMPONENTS = ["the API gateway", "checkout", "the worker fleet", "search", "onboarding", "reporting", "the admin panel", "notifications"]
+REASONS = [
+    "it cuts p99 latency", "the current setup does not scale past peak load",
+    "operational cost kept growing", "the team already knows it well",
+    "it removes a single point of failure", "vendor support ends next year",
+    "it simplifies on-call", "compliance requires it",
+]
+OWNERS = [(f"U{n:08d}", name) for n, name in enumerate(
+    ["alice", "bob", "carol", "dave", "erin", "frank", "grace", "heidi", "ivan", "judy"]
+)]
+CHANNELS = [(f"C{n:08d}", name) for n, name in enumerate(
+    ["engineering", "infra", "backend", "frontend", "data", "security", "platform", "general"]
+)]
+
+COPY_COLUMNS = (
+    "id", "workspace_id", "title", "summary", "rationale", "owner_slack_id", "owner_name",
+    "source_type", "source_channel_id", "source_channel_name", "tags", "impact_area",
+    "category", "confidence", "embedding", "status", "decision_made_at", "created_at",
+    "updated_at",
+)
+
+
+def topic_centroids(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centroids = rng.standard_normal((len(TOPICS), DIM)).astype(np.float32)
+    return centroids / np.linalg.norm(centroids, axis=1, keepdims=True)
+
+
+def embed_near(centroids: np.ndarray, topics: np.ndarray, rng: np.random.Generator, noise: float) -> np.ndarray:
+    """Unit vectors near the mean of each row's topic centroids."""
+    base = centroids[topics].mean(axis=1)
+    noise_vectors = rng.standard_normal((len(topics), DIM), dtype=np.float32)
+    vectors = base + noise_vectors * np.float32(noise / np.sqrt(DIM))
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _batches(
+    workspace_id: uuid.UUID, n: int, centroids: np.ndarray, seed: int, noise: float, batch_size: int
+):
+    """COPY-ready row batches; embeddings are drawn per batch as float32.
+
+    Only one batch of vectors is ever in memory, which keeps the multi-million
+    row tiers within a few hundred MB.
+    """
+    rng = np.random.default_rng(seed)
+    pick = random.Random(seed)
+    topic_names = list(TOPICS)
+    now = datetime.now(timezone.utc)
+
+    for offset in range(0, n, batch_size):
+        size = min(batch_size, n - offset)
+        topics = rng.integers(0, len(topic_names), size=(size, 2))
+        # Roughly a third of decisions span two topics
+        topics[:, 1] = np.where(rng.random(size) < 0.35, topics[:, 1], topics[:, 0])
+        embeddings = embed_near(centroids, topics, rng, noise)
+        yield [
+            _record(workspace_id, pick, now, topic_names[t0], topic_names[t1], embedding)
+            for (t0, t1), embedding in zip(topics, embeddings)
+        ]
+
+
+def _record(
+    workspace_id: uuid.UUID,
+    pick: random.Random,
+    now: datetime,
+    topic: str,
+    second_topic: str,
+    embedding: np.ndarray,
+) -> tuple:
+    words = TOPICS[topic] + TOPICS[second_topic]
+    tags = sorted(set(pick.sample(words, k=min(len(words), pick.randint(2, 4)))))
+    subject, component = pick.choice(words), pick.choice(COMPONENTS)
+    owner, channel = pick.choice(OWNERS), pick.choice(CHANNELS)
+    created = now - timedelta(minutes=pick.randint(0, 60 * 24 * 730))
+    return (
+        uuid.uuid4(),
+        workspace_id,
+        f"{pick.choice(VERBS)} {subject} for {component}",
+        f"We will {pick.choice(VERBS).lower()} {subject} in {component} "
+        f"alongside {pick.choice(words)}.",
+        f"Chosen because {pick.choice(REASONS)}; {pick.choice(words)} and "
+        f"{pick.choice(words)} were considered and rejected.",
+        owner[0],
+        owner[1],
+        "slack",
+        channel[0],
+        channel[1],
+        tags,
+        [component.removeprefix("the ").replace(" ", "-")],
+        pick.choices(CATEGORIES, weights=CATEGORY_WEIGHTS)[0],
+        round(pick.uniform(0.6, 0.99), 2),
+        embedding,
+        "active" if pick.random() < 0.9 else pick.choice(["pending", "ignored", "expired"]),
+        created,
+        created,
+        created,
+    )
+
+
+# HNSW inserts dominate load time; building the index once afterwards is far faster
+DROP_HNSW_SQL = "DROP INDEX IF EXISTS ix_decisions_embedding"
+CREATE_HNSW_SQL = (
+    "CREATE INDEX ix_decisions_embedding ON decisions "
+    "USING hnsw (embedding vector_cosine_ops) WITH (m = {m}, ef_construction = {ef_construction})"
+)
+
+
+async def _clean(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        bench = f"SELECT id FROM workspaces WHERE slack_team_id LIKE '{BENCH_TEAM_PREFIX}%'"
+        for table in ("decision_chunks", "decision_links"):
+            await conn.execute(text(
+                f"DELETE FROM {table} WHERE decision_id IN "
+                f"(SELECT id FROM decisions WHERE workspace_id IN ({bench}))"
+            ))
+        # Rollup rows cascade with the workspace
+        for table in ("decision_threads", "decisions", "query_logs", "monitored_channels"):
+            await conn.execute(text(f"DELETE FROM {table} WHERE workspace_id IN ({bench})"))
+        await conn.execute(text(f"DELETE FROM workspaces WHERE id IN ({bench})"))
+
+
+async def generate(
+    engine: AsyncEngine,
+    decisions: int,
+    workspaces: int = 1,
+    seed: int = 42,
+    noise: float = 1.0,
+    batch_size: int = 10_000,
+    clean: bool = False,
+    rebuild_index: bool = True,
+) -> dict:
+    if clean:
+        await _clean(engine)
+
+    centroids = topic_centroids(seed)
+    per_workspace = [decisions // workspaces + (i < decisions % workspaces) for i in range(workspaces)]
+    start = time.perf_counter()
+    created = []
+
+    async with engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        await register_vector(raw)
+        if rebuild_index:
+            await raw.execute(DROP_HNSW_SQL)
+
+        for w, count in enumerate(per_workspace):
+            workspace_id = uuid.uuid4()
+            await raw.execute(
+                "INSERT INTO workspaces (id, slack_team_id, team_name, onboarding_complete, settings) "
+                "VALUES ($1, $2, $3, true, $4::jsonb)",
+                workspace_id,
+                f"{BENCH_TEAM_PREFIX}{seed}_{w}_{workspace_id.hex[:6]}",
+                f"Bench {w}",
+                f'{{"bench": {{"seed": {seed}, "decisions": {count}, "noise": {noise}}}}}',
+            )
+            await raw.executemany(
+                "INSERT INTO monitored_channels (id, workspace_id, channel_id, channel_name, enabled) "
+                "VALUES ($1, $2, $3, $4, true)",
+                [(uuid.uuid4(), workspace_id, cid, name) for cid, name in CHANNELS],
+            )
+
+            loaded = 0
+            for batch in _batches(workspace_id, count, centroids, seed + w, noise, batch_size):
+                async with raw.transaction():
+                    await raw.copy_records_to_table("decisions", records=batch, columns=COPY_COLUMNS)
+                loaded += len(batch)
+                print(f"  workspace {w}: {loaded}/{count} decisions", flush=True)
+            created.append({"workspace_id": str(workspace_id), "decisions": count})
+
+        load_elapsed = time.perf_counter() - start
+        index_elapsed = None
+        if rebuild_index:
+            index_start = time.perf_counter()
+            await raw.execute(
+                CREATE_HNSW_SQL.format(m=settings.hnsw_m, ef_construction=settings.hnsw_ef_construction)
+            )
+            index_elapsed = round(time.perf_counter() - index_start, 2)
+        await raw.execute("ANALYZE decisions")
+
+    return {
+        "seed": seed,
+        "decisions": decisions,
+        "load_s": round(load_elapsed, 2),
+        "rows_per_s": round(decisions / load_elapsed, 1) if load_elapsed else None,
+        "index_build_s": index_elapsed,
+        "workspaces": created,
+    }
@@ -0,0 +1,183 @@
+"""Replay a workload against hybrid search and report latency, throughput and recall."""
+
+import asyncio
+import statistics
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.search.engine import _candidate_params, fetch_vector_candidates, hybrid_search
+from app.search.index_sync import indexes_enabled, warm_indexes
+from app.search.lookup import parse_lookup, run_lookup
+
+# Exact max-sim over decision and chunk vectors: the same candidates as
+# VECTOR_CANDIDATES_SQL, scored without the HNSW index.
+EXACT_VECTOR_SQL = text("""\
+SELECT decision_id
+FROM (
+    SELECT d.id AS decision_id, 1 - (d.embedding <=> CAST(:query_embedding AS vector)) AS score
+    FROM decisions d
+    WHERE d.workspace_id = CAST(:workspace_id AS uuid)
+      AND d.status = 'active'
+      AND d.embedding IS NOT NULL
+    UNION ALL
+    SELECT c.decision_id, 1 - (c.embedding <=> CAST(:query_embedding AS vector))
+    FROM decision_chunks c
+    JOIN decisions d ON d.id = c.decision_id
+    WHERE c.workspace_id = CAST(:workspace_id AS uuid)
+      AND d.status = 'active'
+) c
+GROUP BY decision_id
+ORDER BY max(score) DESC
+LIMIT :k
+""")
+
+DISABLE_INDEX_SCANS_SQL = (
+    text("SET LOCAL enable_indexscan = off"),
+    text("SET LOCAL enable_bitmapscan = off"),
+)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def _run_query(db_session: AsyncSession, item: dict, k: int, ef_search: int | None) -> dict:
+    if item["embedding"] is None:
+        intent = parse_lookup(item["query"])
+        if intent is not None:
+            result = await run_lookup(db_session, item["workspace_id"], intent, item["filters"], k)
+            return {"lookup_ms": None, **result}
+    return await hybrid_search(
+        db_session,
+        item["workspace_id"],
+        item["query"],
+        filters=item["filters"],
+        limit=k,
+        ef_search=ef_search,
+        query_embedding=item["embedding"],
+    )
+
+
+async def measure_latency(
+    session_factory: async_sessionmaker,
+    queries: list[dict],
+    k: int,
+    concurrency: int,
+    ef_search: int | None,
+) -> dict:
+    latencies: list[float] = []
+    phases: dict[str, list[float]] = {}
+    errors = 0
+    pending = iter(queries)
+
+    async def worker() -> None:
+        nonlocal errors
+        for item in pending:
+            start = time.perf_counter()
+            try:
+                async with session_factory() as session:
+                    result = await _run_query(session, item, k, ef_search)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - start) * 1000)
+            for phase, ms in (result.get("timings") or {}).items():
+                phases.setdefault(phase, []).append(ms)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+
+    return {
+        "queries": len(latencies),
+        "errors": errors,
+        "wall_s": round(wall, 3),
+        "throughput_qps": round(len(latencies) / wall, 2) if wall else None,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2),
+            "mean": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+        },
+        "phase_mean_ms": {
+            phase: round(statistics.fmean(values), 3) for phase, values in sorted(phases.items())
+        },
+    }
+
+
+async def measure_recall(
+    session_factory: async_sessionmaker, queries: list[dict], k: int, ef_search: int | None
+) -> dict:
+    recalls = []
+    for item in queries:
+        if item["embedding"] is None:
+            continue
+        params = {**_candidate_params(item["workspace_id"], item["query"], None), "candidate_limit": k}
+        async with session_factory() as session:
+            approximate, _ = await fetch_vector_candidates(session, params, item["embedding"], ef_search)
+        async with session_factory() as session, session.begin():
+            for statement in DISABLE_INDEX_SCANS_SQL:
+                await session.execute(statement)
+            exact = (
+                await session.execute(
+                    EXACT_VECTOR_SQL,
+                    {
+                        "workspace_id": item["workspace_id"],
+                        "query_embedding": str(item["embedding"]),
+                        "k": k,
+                    },
+                )
+            ).scalars().all()
+        if exact:
+            found = {decision_id for decision_id, _ in approximate[:k]}
+            recalls.append(len(found & {str(d) for d in exact}) / len(exact))
+    return {
+        "queries": len(recalls),
+        f"recall_at_{k}": round(statistics.fmean(recalls), 4) if recalls else None,
+        "min": round(min(recalls), 4) if recalls else None,
+    }
+
+
+async def run(
+    session_factory: async_sessionmaker,
+    workload: dict,
+    k: int = 10,
+    concurrency: int = 8,
+    warmup: int = 20,
+    ef_search: int | None = None,
+    recall_queries: int = 100,
+) -> dict:
+    queries = workload["queries"]
+    if indexes_enabled():
+        await warm_indexes(session_factory)
+
+    await measure_latency(session_factory, queries[:warmup], k, concurrency, ef_search)
+    latency = await measure_latency(session_factory, queries, k, concurrency, ef_search)
+    recall = await measure_recall(session_factory, queries[:recall_queries], k, ef_search)
+
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "k": k,
+            "concurrency": concurrency,
+            "ef_search": ef_search or settings.hnsw_ef_search,
+            "hnsw_m": settings.hnsw_m,
+            "hnsw_ef_construction": settings.hnsw_ef_construction,
+            "candidate_limit": settings.search_candidate_limit,
+            "fusion_mode": settings.search_fusion_mode,
+            "keyword_engine": settings.search_keyword_engine,
+            "vector_index_enabled": settings.vector_index_enabled,
+            "workload_seed": workload.get("seed"),
+            "workload_queries": len(queries),
+        },
+        "latency": latency,
+        "recall": recall,
+    }
@@ -0,0 +1,89 @@
+"""Query workload for benchmark runs.
+
+Queries are written against the topics of a generated corpus: text built
+from topic vocabulary and an embedding near the same topic centroids, so
+keyword and vector legs both have real matches. A share of queries carry
+filters, and a share are exact lookups that the router answers directly.
+"""
+
+import random
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from bench.corpus import BENCH_TEAM_PREFIX, CATEGORIES, OWNERS, TOPICS, embed_near, topic_centroids
+
+QUESTION_TEMPLATES = [
+    "why did we choose {a}",
+    "what did we decide about {a} and {b}",
+    "{a} {b} decision",
+    "should we keep using {a}",
+    "how do we handle {a} in {b}",
+]
+
+
+async def bench_workspaces(engine: AsyncEngine) -> list[dict]:
+    async with engine.connect() as conn:
+        rows = (
+            await conn.execute(
+                text(
+                    "SELECT id, settings FROM workspaces "
+                    "WHERE slack_team_id LIKE :prefix ORDER BY created_at"
+                ),
+                {"prefix": f"{BENCH_TEAM_PREFIX}%"},
+            )
+        ).all()
+    return [{"workspace_id": str(ws), **(settings or {}).get("bench", {})} for ws, settings in rows]
+
+
+def build_workload(
+    workspaces: list[dict],
+    queries: int,
+    seed: int = 7,
+    filter_ratio: float = 0.2,
+    lookup_ratio: float = 0.0,
+) -> dict:
+    if not workspaces:
+        raise ValueError("no benchmark workspaces; run `python -m bench generate` first")
+
+    pick = random.Random(seed)
+    rng = np.random.default_rng(seed)
+    topic_names = list(TOPICS)
+    centroids = {w["seed"]: topic_centroids(w["seed"]) for w in workspaces}
+
+    items = []
+    for _ in range(queries):
+        workspace = pick.choice(workspaces)
+        topics = np.array([[pick.randrange(len(topic_names))] * 2])
+        if pick.random() < 0.35:
+            topics[0, 1] = pick.randrange(len(topic_names))
+        words = TOPICS[topic_names[topics[0, 0]]] + TOPICS[topic_names[topics[0, 1]]]
+
+        if pick.random() < lookup_ratio:
+            owner = pick.choice(OWNERS)
+            items.append({
+                "workspace_id": workspace["workspace_id"],
+                "query": f"decisions by <@{owner[0]}|{owner[1]}> last month",
+                "embedding": None,
+                "filters": None,
+            })
+            continue
+
+        query = pick.choice(QUESTION_TEMPLATES).format(a=pick.choice(words), b=pick.choice(words))
+        embedding = embed_near(centroids[workspace["seed"]], topics, rng, workspace.get("noise", 1.0))[0]
+        filters = None
+        if pick.random() < filter_ratio:
+            filters = pick.choice([
+                {"categories": [pick.choice(CATEGORIES)]},
+                {"owner_slack_id": pick.choice(OWNERS)[0]},
+                {"tags": [pick.choice(words)]},
+            ])
+        items.append({
+            "workspace_id": workspace["workspace_id"],
+            "query": query,
+            "embedding": [round(float(x), 6) for x in embedding],
+            "filters": filters,
+        })
+
+    return {"seed": seed, "filter_ratio": filter_ratio, "lookup_ratio": lookup_ratio, "queries": items}
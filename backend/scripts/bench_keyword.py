@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Benchmark the keyword leg: Postgres ts_rank against the in-process BM25 index.
+
+Replays distinct queries from query_logs (or --query values) against both
+engines for each workspace and reports latency percentiles, candidate
+counts and the top-k overlap between the two rankings.
+
+    python scripts/bench_keyword.py --queries 200 --k 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import func, select
+
+from app.config import settings
+from app.db.models import QueryLog
+from app.db.session import async_session_factory, engine
+from app.search.engine import KEYWORD_CANDIDATES_SQL, _candidate_params, _run_leg
+from app.search.lexical_index import LexicalIndexRegistry
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def _load_queries(limit: int) -> list[tuple[str, str]]:
+    async with async_session_factory() as session:
+        rows = (
+            await session.execute(
+                select(QueryLog.workspace_id, QueryLog.query_text)
+                .where(QueryLog.query_text.is_not(None))
+                .group_by(QueryLog.workspace_id, QueryLog.query_text)
+                .order_by(func.max(QueryLog.created_at).desc())
+                .limit(limit)
+            )
+        ).all()
+    return [(str(ws), text) for ws, text in rows]
+
+
+async def benchmark(query_limit: int, k: int, extra_queries: list[str]) -> int:
+    settings.search_keyword_engine = "bm25"
+    registry = LexicalIndexRegistry()
+    start = time.perf_counter()
+    await registry.warm(async_session_factory)
+    warm_ms = (time.perf_counter() - start) * 1000
+
+    queries = await _load_queries(query_limit)
+    queries += [(ws, q) for ws in registry.workspace_ids() for q in extra_queries]
+    if not queries:
+        print("No queries to replay.")
+        return 1
+
+    sql_ms: list[float] = []
+    bm25_ms: list[float] = []
+    sql_hits: list[int] = []
+    bm25_hits: list[int] = []
+    overlaps: list[float] = []
+
+    async with async_session_factory() as session:
+        for ws, query_text in queries:
+            index = registry.get(ws)
+            if index is None:
+                continue
+            params = _candidate_params(ws, query_text, None)
+
+            start = time.perf_counter()
+            sql, _ = await _run_leg(session, KEYWORD_CANDIDATES_SQL, params)
+            sql_ms.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            bm25 = index.search(query_text, params["candidate_limit"])
+            bm25_ms.append((time.perf_counter() - start) * 1000)
+
+            sql_hits.append(len(sql))
+            bm25_hits.append(len(bm25))
+            top_sql = {d for d, _ in sql[:k]}
+            top_bm25 = {d for d, _ in bm25[:k]}
+            union = top_sql | top_bm25
+            overlaps.append(len(top_sql & top_bm25) / len(union) if union else 1.0)
+
+    docs = sum(len(registry.get(ws)) for ws in registry.workspace_ids())
+    print(f"Indexed {docs} decisions in {warm_ms:.0f} ms; replayed {len(sql_ms)} queries\n")
+    print(f"{'engine':<12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'mean hits':>12}")
+    for name, values, hits in (("ts_rank", sql_ms, sql_hits), ("bm25", bm25_ms, bm25_hits)):
+        print(
+            f"{name:<12}{_percentile(values, 50):>10.2f}{_percentile(values, 95):>10.2f}"
+            f"{_percentile(values, 99):>10.2f}{statistics.fmean(hits or [0]):>12.1f}"
+        )
+    print(f"\nmean jaccard@{k}: {statistics.fmean(overlaps or [0.0]):.3f}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=200, help="distinct logged queries to replay")
+    parser.add_argument("--k", type=int, default=10, help="top-k cut for overlap")
+    parser.add_argument(
+        "--query", action="append", default=[], help="extra query to run in every workspace"
+    )
+    args = parser.parse_args()
+
+    async def run() -> int:
+        try:
+            return await benchmark(args.queries, args.k, args.query)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
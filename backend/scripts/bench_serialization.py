@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Microbenchmark: cost of serializing a page of decisions.
+
+Compares the old per-row ``DecisionOut.model_validate`` path, FastAPI's
+response_model re-validation included, with batch validation through the
+cached TypeAdapter plus orjson, for full rows and for a dashboard-style
+projection. Rows are synthetic and built in memory, so no database is needed.
+
+    python scripts/bench_serialization.py --rows 100 --repeat 200
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.api.schemas import DecisionOut, PaginatedDecisions
+from app.api.serialization import ORJSONResponse, parse_fields, validate_rows
+
+DASHBOARD_FIELDS = "title,status,category,owner_name,tags"
+
+
+def _rows(n: int) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "title": f"Adopt postgres logical replication for reporting {i}",
+            "summary": "We will stream changes into the warehouse instead of nightly dumps. " * 3,
+            "rationale": "Nightly dumps are a day stale and lock the primary for minutes. " * 6,
+            "owner_slack_id": "U00000001",
+            "owner_name": "alice",
+            "source_type": "slack_thread",
+            "source_url": None,
+            "source_channel_id": "C00000001",
+            "source_channel_name": "data",
+            "participants": ["U00000001", "U00000002", "U00000003"],
+            "tags": ["postgres", "replication", "warehouse"],
+            "impact_area": ["reporting"],
+            "category": "architecture",
+            "confidence": 0.91,
+            "status": "active",
+            "confirmed_at": now,
+            "confirmed_by": "U00000002",
+            "decision_made_at": now - timedelta(days=i),
+            "created_at": now - timedelta(days=i),
+            "updated_at": now,
+        }
+        for i in range(n)
+    ]
+
+
+def _per_row(rows: list[dict]) -> bytes:
+    # What list_decisions did before: one model per ORM row, then FastAPI
+    # validated the response model again before writing JSON.
+    objects = [SimpleNamespace(**row) for row in rows]
+    page = PaginatedDecisions(
+        items=[DecisionOut.model_validate(o, from_attributes=True) for o in objects],
+        total=len(rows),
+        page=1,
+        per_page=len(rows),
+    )
+    return PaginatedDecisions.model_validate(page.model_dump()).model_dump_json().encode()
+
+
+def _batched(rows: list[dict], columns: tuple[str, ...]) -> bytes:
+    projected = [{c: row[c] for c in columns} for row in rows]
+    return ORJSONResponse(
+        {
+            "items": validate_rows(DecisionOut, columns, projected),
+            "total": len(rows),
+            "page": 1,
+            "per_page": len(rows),
+            "next_cursor": None,
+        }
+    ).body
+
+
+def _measure(fn, repeat: int) -> dict:
+    fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p50_ms": round(statistics.median(samples), 3),
+        "bytes": len(body),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    full = parse_fields(None, DecisionOut)
+    dashboard = parse_fields(DASHBOARD_FIELDS, DecisionOut, always=("id", "created_at"))
+
+    results = {
+        "per-row model_validate": _measure(lambda: _per_row(rows), args.repeat),
+        "TypeAdapter + orjson": _measure(lambda: _batched(rows, full), args.repeat),
+        f"projected ({DASHBOARD_FIELDS})": _measure(
+            lambda: _batched(rows, dashboard), args.repeat
+        ),
+    }
+
+    print(f"{args.rows} rows, {args.repeat} runs each")
+    baseline = results["per-row model_validate"]["mean_ms"]
+    for name, stats in results.items():
+        print(
+            f"  {name:<60} {stats['mean_ms']:>8.3f} ms mean  {stats['p50_ms']:>8.3f} ms p50  "
+            f"{stats['bytes']:>7} bytes  x{baseline / stats['mean_ms']:.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
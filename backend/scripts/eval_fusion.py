@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Compare hybrid search fusion modes offline over logged queries.
+
+Replays distinct queries from query_logs, generates candidates once per
+query, then fuses and hydrates the top-k under every fusion mode. Reports
+per-mode latency percentiles and the mean top-k overlap between modes.
+
+    python scripts/eval_fusion.py --queries 200 --k 5
+"""
+
+import argparse
+import asyncio
+import itertools
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import func, select
+
+from app.ai.embeddings import generate_query_embedding
+from app.config import settings
+from app.db.models import QueryLog
+from app.db.session import async_session_factory, engine
+from app.search.engine import fetch_candidates
+from app.search.fusion import FUSION_MODES, fuse
+from app.search.hydration import hydrate_results
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def _load_queries(workspace_id: str | None, limit: int) -> list[tuple[str, str]]:
+    async with async_session_factory() as session:
+        q = (
+            select(QueryLog.workspace_id, QueryLog.query_text)
+            .where(QueryLog.query_text.is_not(None))
+            .group_by(QueryLog.workspace_id, QueryLog.query_text)
+            .order_by(func.max(QueryLog.created_at).desc())
+            .limit(limit)
+        )
+        if workspace_id:
+            q = q.where(QueryLog.workspace_id == uuid.UUID(workspace_id))
+        rows = (await session.execute(q)).all()
+    return [(str(ws), text) for ws, text in rows]
+
+
+async def evaluate(workspace_id: str | None, query_limit: int, k: int) -> int:
+    queries = await _load_queries(workspace_id, query_limit)
+    if not queries:
+        print("No logged queries to replay.")
+        return 1
+
+    candidate_ms: list[float] = []
+    mode_ms: dict[str, list[float]] = {mode: [] for mode in FUSION_MODES}
+    overlaps: dict[tuple[str, str], list[float]] = {
+        pair: [] for pair in itertools.combinations(FUSION_MODES, 2)
+    }
+
+    for ws, query_text in queries:
+        embedding = await generate_query_embedding(query_text)
+        if not embedding:
+            continue
+
+        async with async_session_factory() as session:
+            start = time.perf_counter()
+            vector, keyword, tag_matches = await fetch_candidates(
+                session, ws, query_text, embedding
+            )
+            candidate_ms.append((time.perf_counter() - start) * 1000)
+
+            top_ids: dict[str, set[str]] = {}
+            for mode in FUSION_MODES:
+                start = time.perf_counter()
+                fused = fuse(vector, keyword, tag_matches, mode=mode, rrf_k=settings.search_rrf_k)
+                await hydrate_results(session, fused[:k])
+                mode_ms[mode].append((time.perf_counter() - start) * 1000)
+                top_ids[mode] = {decision_id for decision_id, _ in fused[:k]}
+
+        for a, b in overlaps:
+            union = top_ids[a] | top_ids[b]
+            overlaps[(a, b)].append(len(top_ids[a] & top_ids[b]) / len(union) if union else 1.0)
+
+    print(f"Replayed {len(candidate_ms)} queries (top-{k})\n")
+    print(f"{'phase':<24}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    rows = [("candidates", candidate_ms)] + [(f"fuse+hydrate:{m}", mode_ms[m]) for m in FUSION_MODES]
+    for name, values in rows:
+        print(
+            f"{name:<24}{_percentile(values, 50):>10.2f}"
+            f"{_percentile(values, 95):>10.2f}{_percentile(values, 99):>10.2f}"
+        )
+
+    print(f"\n{'modes':<24}{'mean jaccard@k':>16}")
+    for (a, b), values in overlaps.items():
+        mean = statistics.fmean(values) if values else 0.0
+        print(f"{a + ' vs ' + b:<24}{mean:>16.3f}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workspace-id", help="restrict to one workspace")
+    parser.add_argument("--queries", type=int, default=200, help="distinct queries to replay")
+    parser.add_argument("--k", type=int, default=5, help="top-k cut for overlap")
+    args = parser.parse_args()
+
+    async def run() -> int:
+        try:
+            return await evaluate(args.workspace_id, args.queries, args.k)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
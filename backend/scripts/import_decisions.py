@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Import decisions from an NDJSON or CSV file into a workspace.
+
+Same loader as POST /api/decisions/import: COPY into a staging table, one
+upsert per batch, embedding jobs enqueued per batch. Re-running a file
+updates the decisions it created (matched on ``external_id``, else title).
+
+    python scripts/import_decisions.py adrs.ndjson --workspace T0123ABCD
+    python scripts/import_decisions.py decisions.csv --workspace <uuid> --no-embed
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from arq.connections import RedisSettings, create_pool
+from sqlalchemy import select
+
+from app.config import settings
+from app.db.models import Workspace
+from app.db.session import async_session_factory, engine
+from app.jobs.importer import import_decisions, read_records
+
+
+async def _workspace_id(ref: str) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(ref)
+    except ValueError:
+        pass
+    async with async_session_factory() as session:
+        return (
+            await session.execute(select(Workspace.id).where(Workspace.slack_team_id == ref))
+        ).scalar_one_or_none()
+
+
+async def _main(args: argparse.Namespace) -> int:
+    path = Path(args.path)
+    fmt = args.format or ("csv" if path.suffix.lower() == ".csv" else "ndjson")
+    try:
+        workspace_id = await _workspace_id(args.workspace)
+        if workspace_id is None:
+            print(f"unknown workspace: {args.workspace}", file=sys.stderr)
+            return 1
+        redis = None if args.no_embed else await create_pool(RedisSettings.from_dsn(settings.redis_url))
+        try:
+            with path.open(encoding="utf-8-sig", newline="") as f:
+                result = await import_decisions(
+                    async_session_factory,
+                    redis,
+                    workspace_id,
+                    read_records(f, fmt),
+                    batch_size=args.batch_size,
+                )
+        finally:
+            if redis is not None:
+                await redis.close()
+    finally:
+        await engine.dispose()
+
+    for error in result["errors"][: args.max_errors]:
+        print(f"  line {error['line']}: {error['error']}", file=sys.stderr)
+    summary = {k: v for k, v in result.items() if k != "errors"}
+    print(json.dumps(summary, indent=2))
+    return 1 if result["failed"] else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="NDJSON or CSV file")
+    parser.add_argument("--workspace", required=True, help="Workspace id or Slack team id")
+    parser.add_argument("--format", choices=["ndjson", "csv"], help="Default: from the file extension")
+    parser.add_argument("--batch-size", type=int, default=settings.import_batch_size)
+    parser.add_argument("--no-embed", action="store_true", help="Do not enqueue embedding jobs")
+    parser.add_argument("--max-errors", type=int, default=50, help="Row errors to print")
+    return asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""Fixtures for tests that run against the development database.
+
+Each test gets one connection inside an outer transaction that is rolled
+back afterwards. Sessions from ``db.factory`` join it through savepoints, so
+endpoint and job commits never persist. Tests are skipped when no database
+is reachable.
+"""
+
+import uuid
+from typing import NamedTuple
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncConnection, async_sessionmaker, create_async_engine
+
+from app.auth.middleware import get_current_user
+from app.config import settings
+from app.db.session import get_db
+from app.main import app
+
+CREATE_WORKSPACE_SQL = text(
+    "INSERT INTO workspaces (id, slack_team_id, team_name) VALUES (:id, :team, :name)"
+)
+
+
+class Database(NamedTuple):
+    conn: AsyncConnection
+    factory: async_sessionmaker
+    # Every SQL statement sent since the workspace was created
+    statements: list[str]
+    workspace_id: uuid.UUID
+
+
+async def create_workspace(conn: AsyncConnection, name: str = "Test") -> uuid.UUID:
+    workspace_id = uuid.uuid4()
+    await conn.execute(
+        CREATE_WORKSPACE_SQL,
+        {"id": workspace_id, "team": f"T_TEST_{workspace_id.hex[:12]}", "name": name},
+    )
+    return workspace_id
+
+
+@pytest_asyncio.fixture
+async def db():
+    engine = create_async_engine(settings.database_url)
+    try:
+        conn = await engine.connect()
+    except (OSError, OperationalError, DBAPIError):
+        await engine.dispose()
+        pytest.skip("database not available")
+
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *args: statements.append(statement),
+    )
+    trans = await conn.begin()
+    factory = async_sessionmaker(
+        bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+    )
+    try:
+        workspace_id = await create_workspace(conn)
+        statements.clear()
+        yield Database(conn, factory, statements, workspace_id)
+    finally:
+        await trans.rollback()
+        await conn.close()
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def api(db: Database):
+    """Client for the app as user U1 of ``db.workspace_id``, on ``db``'s transaction."""
+
+    async def override_db():
+        async with db.factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_user] = lambda: {
+        "workspace_id": str(db.workspace_id), "slack_user_id": "U1",
+    }
+    app.state.arq_pool = MagicMock(enqueue_job=AsyncMock(), publish=AsyncMock())
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
+            yield http
+    finally:
+        app.dependency_overrides.clear()
+
+
+class FakePipeline:
+    """Records what app.jobs.queue.enqueue_jobs sends through a Redis pipeline."""
+
+    def __init__(self):
+        self.commands: list[tuple[str, str]] = []
+        self.executed = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def psetex(self, key, ms, value):
+        self.commands.append(("psetex", key))
+
+    def zadd(self, queue, mapping):
+        self.commands.append(("zadd", queue))
+
+    async def execute(self):
+        self.executed += 1
+
+    @property
+    def jobs(self) -> list[str]:
+        return [key for command, key in self.commands if command == "psetex"]
+
+
+@pytest.fixture
+def pipeline() -> FakePipeline:
+    return FakePipeline()
+
+
+@pytest.fixture
+def fake_redis(pipeline: FakePipeline) -> MagicMock:
+    """Stand-in for the arq pool, enough for enqueue_jobs and change publishing."""
+    return MagicMock(
+        pipeline=MagicMock(return_value=pipeline), publish=AsyncMock(), enqueue_job=AsyncMock(),
+        job_serializer=None, expires_extra_ms=86_400_000, default_queue_name="arq:queue",
+    )
@@ -0,0 +1,80 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.api import analytics
+
+SEED_DECISIONS_SQL = """\
+INSERT INTO decisions (id, workspace_id, title, status, category, owner_name, owner_slack_id)
+SELECT gen_random_uuid(), :ws, 'Decision ' || i,
+       (ARRAY['active', 'active', 'active', 'ignored', 'pending'])[1 + i % 5],
+       (ARRAY['architecture', 'api'])[1 + i % 2],
+       (ARRAY['alice', 'bob', 'carol'])[1 + i % 3],
+       (ARRAY['U1', 'U2', 'U3'])[1 + i % 3]
+FROM generate_series(0, 19) AS i
+"""
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def seeded(db):
+    await db.conn.execute(text(SEED_DECISIONS_SQL), {"ws": db.workspace_id})
+    await db.conn.execute(
+        text(
+            "INSERT INTO query_logs (id, workspace_id, query_text) "
+            "SELECT gen_random_uuid(), :ws, 'q' FROM generate_series(1, 3)"
+        ),
+        {"ws": db.workspace_id},
+    )
+    analytics._overview_cache.clear()
+    db.statements.clear()
+    yield
+    analytics._overview_cache.clear()
+
+
+def _decision_queries(statements: list[str]) -> list[str]:
+    return [s for s in statements if "FROM decisions" in s]
+
+
+@pytest.mark.asyncio
+async def test_overview_is_two_queries(db, api):
+    response = await api.get("/api/analytics/overview")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_decisions"] == 12
+    assert body["decisions_this_week"] == 20
+    assert body["queries_this_week"] == 3
+    assert body["confirmation_rate"] == 0.75
+    assert {(c["category"], c["count"]) for c in body["decisions_by_category"]} == {
+        ("architecture", 6),
+        ("api", 6),
+    }
+    assert sorted(o["count"] for o in body["top_owners"]) == [4, 4, 4]
+    assert len(_decision_queries(db.statements)) == 2
+
+
+@pytest.mark.asyncio
+async def test_overview_is_cached_until_a_status_change(db, api):
+    await api.get("/api/analytics/overview")
+    db.statements.clear()
+
+    cached = await api.get("/api/analytics/overview")
+
+    assert cached.json()["total_decisions"] == 12
+    assert _decision_queries(db.statements) == []
+
+    pending_id = (
+        await db.conn.execute(
+            text(
+                "SELECT id FROM decisions WHERE workspace_id = :ws AND status = 'pending' LIMIT 1"
+            ),
+            {"ws": db.workspace_id},
+        )
+    ).scalar_one()
+    assert (await api.post(f"/api/decisions/{pending_id}/confirm")).status_code == 200
+    db.statements.clear()
+
+    refreshed = await api.get("/api/analytics/overview")
+
+    assert refreshed.json()["total_decisions"] == 13
+    assert len(_decision_queries(db.statements)) == 2
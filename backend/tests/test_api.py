@@ -1,6 +1,17 @@
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+from fastapi import Request, Response
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
 
+from app.api import decisions
+from app.api.decisions import _count, _decode_cursor, _encode_cursor, _not_modified
+from app.auth.middleware import get_current_user
+from app.config import settings
+from app.db.models import Decision
 from app.main import app
 
 
@@ -21,3 +32,159 @@ async def test_decisions_returns_401_without_auth():
     ) as client:
         response = await client.get("/api/decisions")
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_artifact_lookup_returns_401_without_auth():
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/api/artifacts/decisions", params={"ref": "PROJ-1"})
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_decisions_rejects_malformed_cursor():
+    app.dependency_overrides[get_current_user] = lambda: {"workspace_id": str(uuid.uuid4())}
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/api/decisions", params={"cursor": "not-a-cursor"})
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_malformed_date_filter():
+    app.dependency_overrides[get_current_user] = lambda: {
+        "workspace_id": str(uuid.uuid4()), "slack_user_id": "U1",
+    }
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/search", json={"query": "postgres", "filters": {"date_from": "last tuesday"}}
+            )
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_offset_past_ranked_results():
+    app.dependency_overrides[get_current_user] = lambda: {
+        "workspace_id": str(uuid.uuid4()), "slack_user_id": "U1",
+    }
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            with patch.object(settings, "search_candidate_limit", 50):
+                response = await client.post("/api/search", json={"query": "postgres", "offset": 100})
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 422
+    assert response.json()["detail"] == "offset must be below 100"
+
+
+def test_cursor_round_trips_created_at_and_id():
+    decision = Decision(
+        id=uuid.uuid4(), created_at=datetime(2026, 3, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+    )
+    assert _decode_cursor(_encode_cursor(decision)) == (decision.created_at, decision.id)
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        (None, False),
+        ('W/"abc-1"', True),
+        ('"abc-1"', True),
+        ('W/"abc-0", W/"abc-1"', True),
+        ("*", True),
+        ('W/"abc-2"', False),
+    ],
+)
+def test_weak_etag_comparison(if_none_match, expected):
+    headers = {"if-none-match": if_none_match} if if_none_match else {}
+    request = Request(
+        {"type": "http", "headers": [(k.encode(), v.encode()) for k, v in headers.items()]}
+    )
+    response = Response()
+    assert _not_modified(request, response, 'W/"abc-1"') is expected
+    assert response.headers["etag"] == 'W/"abc-1"'
+
+
+@pytest.mark.asyncio
+async def test_count_cache_is_bounded_and_versioned():
+    db = MagicMock(execute=AsyncMock(return_value=MagicMock(scalar_one=MagicMock(return_value=7))))
+    q = decisions.select(Decision.id)
+    ws, other = uuid.uuid4(), uuid.uuid4()
+    with (
+        patch.object(decisions, "_count_cache", decisions.OrderedDict()) as cache,
+        patch.object(settings, "decision_count_cache_size", 3),
+    ):
+        await _count(db, q, "exact", (ws, "active"), 1)
+        assert not cache
+
+        for key in [(ws, "active"), (ws, "ignored"), (other, "active"), (other, "ignored")]:
+            assert await _count(db, q, "cached", key, 1) == 7
+        # Least recently used goes first
+        assert list(cache) == [(ws, "ignored"), (other, "active"), (other, "ignored")]
+
+        assert await _count(db, q, "cached", (other, "active"), 1) == 7
+        assert db.execute.await_count == 5
+
+        # A write bumps the version; the workspace's older counts are dropped
+        await _count(db, q, "cached", (ws, "active"), 2)
+        assert list(cache) == [(other, "ignored"), (other, "active"), (ws, "active")]
+
+
+SEED_SAME_INSTANT_SQL = text("""\
+INSERT INTO decisions (id, workspace_id, title, status, created_at)
+SELECT gen_random_uuid(), :ws, 'Decision ' || i, 'active', '2026-03-01T12:00:00Z'
+FROM generate_series(1, 25) AS i
+""")
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_cover_equal_timestamps_exactly_once(db, api):
+    await db.conn.execute(SEED_SAME_INSTANT_SQL, {"ws": db.workspace_id})
+
+    seen, cursor = [], None
+    while True:
+        params = {"per_page": 7, **({"cursor": cursor} if cursor else {})}
+        body = (await api.get("/api/decisions", params=params)).json()
+        seen += [item["id"] for item in body["items"]]
+        if cursor:
+            # Cursor requests skip the count by default
+            assert body["total"] is None and body["page"] is None
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen)) == 25
+    assert seen == sorted(seen, reverse=True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("total", ["exact", "estimate", "none"])
+async def test_list_total_modes(db, api, total):
+    await db.conn.execute(SEED_SAME_INSTANT_SQL, {"ws": db.workspace_id})
+    await db.conn.execute(text("ANALYZE decisions"))
+
+    response = await api.get("/api/decisions", params={"per_page": 10, "total": total})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["items"]) == 10 and body["next_cursor"]
+    if total == "exact":
+        assert body["total"] == 25
+    elif total == "estimate":
+        # The planner's guess from table statistics, not a scan
+        assert isinstance(body["total"], int) and body["total"] > 0
+    else:
+        assert body["total"] is None
@@ -0,0 +1,120 @@
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.main import app
+from tests.conftest import create_workspace
+
+
+@pytest_asyncio.fixture
+async def ids(db, api, fake_redis):
+    """Three pending decisions in the caller's workspace and one in another."""
+    other_workspace_id = await create_workspace(db.conn, "Other")
+    ids = [uuid.uuid4() for _ in range(4)]
+    for decision_id, ws in zip(ids, (db.workspace_id,) * 3 + (other_workspace_id,)):
+        await db.conn.execute(
+            text(
+                "INSERT INTO decisions (id, workspace_id, title, status) "
+                "VALUES (:id, :ws, 'Bulk decision', 'pending')"
+            ),
+            {"id": decision_id, "ws": ws},
+        )
+    app.state.arq_pool = fake_redis
+    db.statements.clear()
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_bulk_confirm_is_one_update_and_one_pipeline(db, api, pipeline, ids):
+    missing = uuid.uuid4()
+
+    response = await api.post(
+        "/api/decisions/bulk",
+        json={"ids": [str(i) for i in ids + [missing, ids[0]]], "action": "confirm"},
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["updated"] == 3
+    # Duplicates collapse; the other workspace's id is indistinguishable from a missing one
+    assert [(r["id"], r["result"], r["status"]) for r in body["results"]] == [
+        (str(ids[0]), "updated", "active"),
+        (str(ids[1]), "updated", "active"),
+        (str(ids[2]), "updated", "active"),
+        (str(ids[3]), "not_found", None),
+        (str(missing), "not_found", None),
+    ]
+    assert len([s for s in db.statements if s.lstrip().startswith("UPDATE decisions")]) == 1
+    assert pipeline.executed == 1
+    assert len(pipeline.commands) == 3 * 2 * 2
+    app.state.arq_pool.enqueue_job.assert_not_called()
+
+    rows = (
+        await db.conn.execute(
+            text("SELECT status, confirmed_by FROM decisions WHERE id = ANY(:ids)"),
+            {"ids": ids[:3]},
+        )
+    ).all()
+    assert rows == [("active", "U1")] * 3
+    version = (
+        await db.conn.execute(
+            text("SELECT decisions_version FROM workspaces WHERE id = :id"), {"id": db.workspace_id}
+        )
+    ).scalar_one()
+    assert version == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_patch_sets_only_given_fields(db, api, pipeline, ids):
+    response = await api.post(
+        "/api/decisions/bulk",
+        json={"ids": [str(ids[0]), str(ids[1])], "action": "patch", "category": "process"},
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["updated"] == 2
+    assert pipeline.executed == 0
+    rows = (
+        await db.conn.execute(
+            text("SELECT category, status FROM decisions WHERE id = ANY(:ids)"), {"ids": ids[:2]}
+        )
+    ).all()
+    assert rows == [("process", "pending")] * 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_patch_requires_a_field(db, api, ids):
+    response = await api.post(
+        "/api/decisions/bulk", json={"ids": [str(ids[0])], "action": "patch"}
+    )
+
+    assert response.status_code == 422
+    assert db.statements == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_drops_chunk_embeddings(db, api, ids):
+    await db.conn.execute(
+        text(
+            "INSERT INTO decision_chunks (id, decision_id, workspace_id, chunk_index, chunk_type, "
+            "content, embedding) "
+            "SELECT gen_random_uuid(), id, workspace_id, 0, 'title', title, :embedding "
+            "FROM decisions WHERE id = ANY(:ids)"
+        ),
+        {"ids": ids[:2], "embedding": str([0.1] * 1024)},
+    )
+
+    response = await api.post(
+        "/api/decisions/bulk", json={"ids": [str(ids[0])], "action": "delete"}
+    )
+
+    assert response.status_code == 200, response.text
+    remaining = (
+        await db.conn.execute(
+            text("SELECT decision_id FROM decision_chunks WHERE decision_id = ANY(:ids)"),
+            {"ids": ids[:2]},
+        )
+    ).scalars().all()
+    assert remaining == [ids[1]]
@@ -0,0 +1,38 @@
+from app.ai.chunker import build_decision_chunks
+
+
+class TestDecisionChunks:
+    def test_title_chunk_first(self):
+        chunks = build_decision_chunks("Use Postgres", "For the event store", None, None)
+        assert chunks == [
+            {"chunk_type": "title", "content": "Use Postgres For the event store", "chunk_index": 0}
+        ]
+
+    def test_rationale_split_into_paragraphs(self):
+        chunks = build_decision_chunks(
+            "Use Postgres", None, "We know it well.\n\npgvector covers search.", None
+        )
+        assert [c["chunk_type"] for c in chunks] == ["title", "rationale", "rationale"]
+        assert chunks[2]["content"] == "pgvector covers search."
+
+    def test_long_paragraph_is_split(self):
+        rationale = "This is a sentence. " * 20
+        chunks = build_decision_chunks("T", None, rationale, None, max_chars=100)
+        assert all(len(c["content"]) <= 100 for c in chunks)
+        assert len(chunks) > 3
+
+    def test_thread_windows_fill_remaining_budget(self):
+        raw_context = {"messages": ["short", "a much longer message " * 10, "", "mid sized message"]}
+        chunks = build_decision_chunks("T", None, "R", raw_context, max_chunks=3, max_chars=150)
+        assert [c["chunk_type"] for c in chunks] == ["title", "rationale", "thread"]
+        assert "longer message" in chunks[2]["content"]
+
+    def test_chunk_count_is_bounded(self):
+        rationale = "\n\n".join(f"Paragraph {i}." for i in range(20))
+        raw_context = {"messages": [f"message {i}" for i in range(50)]}
+        chunks = build_decision_chunks("T", "S", rationale, raw_context, max_chunks=5)
+        assert len(chunks) == 5
+        assert [c["chunk_index"] for c in chunks] == list(range(5))
+
+    def test_empty_decision(self):
+        assert build_decision_chunks(None, None, None, None) == []
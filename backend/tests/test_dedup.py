@@ -0,0 +1,51 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.jobs import dedup
+
+MESSAGES = [{"text": "Let's move the job queue to Redis streams"}, {"text": "agreed"}]
+
+
+def _session(row):
+    result = MagicMock()
+    result.first.return_value = row
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_similar_decision_above_threshold_is_duplicate():
+    decision_id = uuid.uuid4()
+    session = _session(MagicMock(id=decision_id, similarity=0.95))
+    with patch.object(dedup, "generate_embedding", AsyncMock(return_value=[0.1] * 1024)) as embed:
+        assert await dedup.find_duplicate_decision(session, uuid.uuid4(), MESSAGES) == (
+            decision_id, 0.95,
+        )
+    embed.assert_awaited_once_with("Let's move the job queue to Redis streams\nagreed")
+
+
+@pytest.mark.asyncio
+async def test_below_threshold_or_no_embedding_is_not_duplicate():
+    session = _session(MagicMock(id=uuid.uuid4(), similarity=0.8))
+    with patch.object(dedup, "generate_embedding", AsyncMock(return_value=[0.1] * 1024)):
+        assert await dedup.find_duplicate_decision(session, uuid.uuid4(), MESSAGES) is None
+
+    session = _session(None)
+    with patch.object(dedup, "generate_embedding", AsyncMock(return_value=[])):
+        assert await dedup.find_duplicate_decision(session, uuid.uuid4(), MESSAGES) is None
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_threshold_above_one_disables_check():
+    session = _session(None)
+    embed = AsyncMock()
+    with (
+        patch.object(dedup, "generate_embedding", embed),
+        patch.object(dedup.settings, "duplicate_similarity_threshold", 1.1),
+    ):
+        assert await dedup.find_duplicate_decision(session, uuid.uuid4(), MESSAGES) is None
+    embed.assert_not_awaited()
@@ -0,0 +1,94 @@
+import re
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.jobs import tasks
+from app.slack import interactive
+
+HEAVY_COLUMNS = ("decisions.embedding", "decisions.raw_context", "decisions.search_vector")
+
+
+def _decision_selects(statements: list[str]) -> list[str]:
+    """SELECT lists of every statement that reads rows from decisions."""
+    return [
+        re.split(r"\bFROM\b", stmt, maxsplit=1)[0]
+        for stmt in statements
+        if stmt.lstrip().startswith("SELECT") and re.search(r"\bFROM decisions\b", stmt)
+    ]
+
+
+@pytest_asyncio.fixture
+async def decision_id(db):
+    decision_id = uuid.uuid4()
+    await db.conn.execute(
+        text(
+            "INSERT INTO decisions (id, workspace_id, title, summary, status, raw_context) "
+            "VALUES (:id, :ws, 'Adopt pgvector', 'Embeddings live in postgres', 'pending', "
+            "CAST(:raw AS json))"
+        ),
+        {"id": decision_id, "ws": db.workspace_id, "raw": '{"messages": ["lets use pgvector"]}'},
+    )
+    db.statements.clear()
+    return decision_id
+
+
+@pytest.mark.asyncio
+async def test_decision_endpoints_never_select_heavy_columns(db, api, decision_id):
+    requests = [
+        api.get("/api/decisions"),
+        api.get(f"/api/decisions/{decision_id}"),
+        api.patch(f"/api/decisions/{decision_id}", json={"title": "Adopt pgvector 0.8"}),
+        api.post(f"/api/decisions/{decision_id}/confirm"),
+        api.post(f"/api/decisions/{decision_id}/ignore"),
+        api.delete(f"/api/decisions/{decision_id}"),
+    ]
+    for request in requests:
+        response = await request
+        assert response.status_code < 400, response.text
+
+    selects = _decision_selects(db.statements)
+    assert len(selects) >= 6
+    for select_list in selects:
+        assert not any(column in select_list for column in HEAVY_COLUMNS), select_list
+
+
+@pytest.mark.asyncio
+async def test_interactive_handlers_never_select_heavy_columns(db, decision_id):
+    arq_pool = MagicMock(enqueue_job=AsyncMock(), publish=AsyncMock())
+
+    with patch.object(interactive, "async_session_factory", db.factory):
+        await interactive._handle_confirm(str(decision_id), "U1", "C1", "1.0", arq_pool)
+        await interactive._handle_ignore(str(decision_id), "U1", "C1", "1.0")
+
+    selects = _decision_selects(db.statements)
+    assert selects
+    for select_list in selects:
+        assert not any(column in select_list for column in HEAVY_COLUMNS), select_list
+
+
+@pytest.mark.asyncio
+async def test_jobs_undefer_only_raw_context(db, decision_id):
+    ctx = {"redis": MagicMock(publish=AsyncMock())}
+
+    embed = AsyncMock(side_effect=lambda t: [[0.1] * 1024] * len(t))
+
+    with (
+        patch.object(tasks, "async_session_factory", db.factory),
+        patch.object(tasks, "generate_embeddings", embed),
+    ):
+        await tasks.enrich_decision(ctx, str(decision_id))
+        await tasks.generate_embedding_task(ctx, str(decision_id))
+
+    # The decision text and its chunks share one batch
+    assert embed.await_count == 1
+
+    selects = _decision_selects(db.statements)
+    assert len(selects) == 2
+    for select_list in selects:
+        assert "decisions.raw_context" in select_list
+        assert "decisions.embedding" not in select_list
+        assert "decisions.search_vector" not in select_list
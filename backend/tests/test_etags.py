@@ -0,0 +1,61 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.jobs import tasks
+
+
+@pytest_asyncio.fixture
+async def decision_id(db):
+    decision_id = uuid.uuid4()
+    # Backdated, since every write in the test transaction sees the same now()
+    await db.conn.execute(
+        text(
+            "INSERT INTO decisions (id, workspace_id, title, summary, status, updated_at) "
+            "VALUES (:id, :ws, 'Adopt pgvector', 'Embeddings live in postgres', 'pending', "
+            "now() - interval '1 day')"
+        ),
+        {"id": decision_id, "ws": db.workspace_id},
+    )
+    return decision_id
+
+
+async def _write(db, api, decision_id, write):
+    if write == "confirm":
+        response = await api.post(f"/api/decisions/{decision_id}/confirm")
+        assert response.status_code == 200, response.text
+        return
+
+    embed = AsyncMock(side_effect=lambda t: [[0.1] * 1024] * len(t))
+    with (
+        patch.object(tasks, "async_session_factory", db.factory),
+        patch.object(tasks, "generate_embeddings", embed),
+    ):
+        await getattr(tasks, write)({"redis": MagicMock(publish=AsyncMock())}, str(decision_id))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write", ["confirm", "enrich_decision", "generate_embedding_task"])
+async def test_writes_invalidate_list_and_detail_etags(db, api, decision_id, write):
+    paths = ["/api/decisions", f"/api/decisions/{decision_id}"]
+
+    etags = {}
+    for path in paths:
+        first = await api.get(path)
+        assert first.status_code == 200
+        etags[path] = first.headers["etag"]
+
+        repeat = await api.get(path, headers={"If-None-Match": etags[path]})
+        assert repeat.status_code == 304
+        assert repeat.content == b""
+        assert repeat.headers["etag"] == etags[path]
+
+    await _write(db, api, decision_id, write)
+
+    for path in paths:
+        response = await api.get(path, headers={"If-None-Match": etags[path]})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etags[path]
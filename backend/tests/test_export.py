@@ -0,0 +1,124 @@
+import csv
+import io
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import orjson
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.api import export
+from app.config import settings
+
+DECISIONS = 5
+
+SEED_DECISIONS_SQL = """\
+INSERT INTO decisions (id, workspace_id, title, status, tags, embedding, created_at)
+SELECT gen_random_uuid(), :ws, 'Decision ' || i, 'active', ARRAY['infra', 'tag ' || i],
+       array_fill(i::real / 10, ARRAY[1024])::vector, now() - make_interval(mins => 10 - i)
+FROM generate_series(1, :n) AS i
+"""
+
+# Two links on the oldest decision, none on the rest
+SEED_LINKS_SQL = """\
+INSERT INTO decision_links (id, decision_id, workspace_id, link_type, link_url, artifact_key,
+                            link_metadata)
+SELECT gen_random_uuid(), id, workspace_id, 'jira', 'https://jira.example/browse/OPS-' || n,
+       'OPS-' || n, '{"status": "Done"}'::json
+FROM decisions, generate_series(1, 2) AS n
+WHERE workspace_id = :ws AND title = 'Decision 1'
+"""
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def corpus(db):
+    await db.conn.execute(text(SEED_DECISIONS_SQL), {"ws": db.workspace_id, "n": DECISIONS})
+    await db.conn.execute(text(SEED_LINKS_SQL), {"ws": db.workspace_id})
+    db.statements.clear()
+    with (
+        patch.object(export, "async_session_factory", db.factory),
+        patch.object(settings, "export_batch_size", 2),
+    ):
+        yield
+
+
+def _decision_queries(statements: list[str]) -> list[str]:
+    return [s for s in statements if "FROM decisions" in s]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_joins_links_and_embeddings_in_one_query(db, api):
+    response = await api.get(
+        "/api/decisions/export", params={"include_links": "true", "include_embeddings": "true"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [orjson.loads(line) for line in response.content.splitlines()]
+    assert [row["title"] for row in rows] == [f"Decision {i}" for i in range(1, DECISIONS + 1)]
+    assert [link["artifact_key"] for link in rows[0]["links"]] == ["OPS-1", "OPS-2"]
+    assert rows[0]["links"][0]["link_metadata"] == {"status": "Done"}
+    assert all(row["links"] == [] for row in rows[1:])
+    assert len(rows[2]["embedding"]) == 1024
+    assert rows[2]["embedding"][0] == pytest.approx(0.3)
+    assert rows[0]["created_at"].endswith("Z")
+    assert len(_decision_queries(db.statements)) == 1
+
+
+@pytest.mark.asyncio
+async def test_csv_export_writes_header_and_json_lists(api):
+    response = await api.get("/api/decisions/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert "attachment" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == DECISIONS
+    assert "embedding" not in rows[0] and "links" not in rows[0]
+    assert orjson.loads(rows[0]["tags"]) == ["infra", "tag 1"]
+    assert rows[0]["summary"] == ""
+
+
+@pytest.mark.asyncio
+async def test_export_filters_on_created_at(api):
+    since = datetime.now(timezone.utc) - timedelta(minutes=7, seconds=30)
+
+    response = await api.get("/api/decisions/export", params={"date_from": since.isoformat()})
+
+    assert response.status_code == 200
+    rows = [orjson.loads(line) for line in response.content.splitlines()]
+    assert [row["title"] for row in rows] == ["Decision 3", "Decision 4", "Decision 5"]
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_malformed_date_before_streaming(db, api):
+    response = await api.get("/api/decisions/export", params={"date_to": "yesterday"})
+
+    assert response.status_code == 422
+    assert _decision_queries(db.statements) == []
+
+
+@pytest.mark.asyncio
+async def test_parquet_export_writes_one_row_group_per_batch(api):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    response = await api.get(
+        "/api/decisions/export", params={"format": "parquet", "include_links": "true"}
+    )
+
+    assert response.status_code == 200
+    parquet = pq.ParquetFile(io.BytesIO(response.content))
+    assert parquet.metadata.num_rows == DECISIONS
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.column("tags").to_pylist()[0] == ["infra", "tag 1"]
+    assert table.column("links").to_pylist()[0][0]["link_metadata"] == '{"status":"Done"}'
+
+
+@pytest.mark.asyncio
+async def test_parquet_export_without_pyarrow_is_rejected(db, api):
+    with patch.object(export, "pa", None):
+        response = await api.get("/api/decisions/export", params={"format": "parquet"})
+
+    assert response.status_code == 400
+    assert db.statements == []
@@ -0,0 +1,57 @@
+import pytest
+
+from app.search.fusion import fuse
+
+
+class TestFusion:
+    def test_weighted_matches_legacy_formula(self):
+        fused = fuse([("a", 0.9), ("b", 0.5)], [("b", 0.2)], {"a"}, mode="weighted")
+        scores = dict(fused)
+        assert scores["a"] == pytest.approx(0.6 * 0.9 + 0.1)
+        assert scores["b"] == pytest.approx(0.6 * 0.5 + 0.3 * 0.2)
+
+    def test_results_sorted_best_first(self):
+        fused = fuse([("a", 0.1), ("b", 0.9), ("c", 0.5)], [], mode="weighted")
+        assert [d for d, _ in fused] == ["b", "c", "a"]
+
+    def test_minmax_bounds_unbounded_keyword_scores(self):
+        # A huge ts_rank must not swamp the vector leg after normalization
+        fused = fuse(
+            [("a", 0.95), ("b", 0.10)],
+            [("b", 40.0), ("a", 39.0)],
+            mode="minmax",
+            weights={"vector": 0.5, "keyword": 0.5, "tag": 0.0},
+        )
+        scores = dict(fused)
+        assert scores["a"] == pytest.approx(0.5)
+        assert scores["b"] == pytest.approx(0.5)
+
+    def test_minmax_single_candidate(self):
+        fused = fuse([("a", 0.3)], [], mode="minmax")
+        assert fused == [("a", pytest.approx(0.6))]
+
+    def test_rrf_rewards_agreement_between_legs(self):
+        fused = fuse(
+            [("a", 0.9), ("b", 0.8), ("c", 0.7)],
+            [("c", 5.0), ("d", 4.0)],
+            mode="rrf",
+            weights={"vector": 1.0, "keyword": 1.0, "tag": 0.0},
+        )
+        assert fused[0][0] == "c"
+
+    @pytest.mark.parametrize("mode", ["rrf", "minmax", "weighted"])
+    def test_tag_only_matches_leave_keyword_scores_alone(self, mode):
+        keyword = [("k1", 0.4), ("k2", 0.2)]
+        without = dict(fuse([], keyword, mode=mode))
+        fused = dict(fuse([], keyword, {"t"}, mode=mode, weights={"tag": 0.1}))
+        assert fused["k1"] == pytest.approx(without["k1"])
+        assert fused["k2"] == pytest.approx(without["k2"])
+        assert fused["t"] > 0
+
+    def test_custom_weights_override_defaults(self):
+        fused = fuse([("a", 1.0)], [("b", 1.0)], mode="weighted", weights={"keyword": 0.9})
+        assert [d for d, _ in fused] == ["b", "a"]
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            fuse([], [], mode="bogus")
@@ -0,0 +1,43 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.search.hydration import attach_links
+
+
+def _link(decision_id, link_type, url, title=None):
+    return SimpleNamespace(
+        decision_id=uuid.UUID(decision_id), link_type=link_type, link_url=url, link_title=title
+    )
+
+
+@pytest.mark.asyncio
+async def test_attach_links_uses_one_query_and_groups_by_decision():
+    a, b = str(uuid.uuid4()), str(uuid.uuid4())
+    result = MagicMock()
+    result.all.return_value = [
+        _link(a, "jira", "https://jira/PROJ-1", "PROJ-1: Migrate"),
+        _link(b, "github_pr", "https://github/pr/812"),
+        _link(a, "doc", "https://docs/adr-7"),
+    ]
+    db_session = MagicMock()
+    db_session.execute = AsyncMock(return_value=result)
+
+    results = await attach_links(db_session, [{"id": a}, {"id": b}])
+
+    assert db_session.execute.await_count == 1
+    assert results[0]["referenced_tickets"] == ["PROJ-1: Migrate"]
+    assert results[0]["referenced_urls"] == ["https://docs/adr-7"]
+    assert results[1]["referenced_prs"] == ["https://github/pr/812"]
+    assert results[1]["referenced_tickets"] == []
+
+
+@pytest.mark.asyncio
+async def test_attach_links_skips_query_for_empty_results():
+    db_session = MagicMock()
+    db_session.execute = AsyncMock()
+
+    assert await attach_links(db_session, []) == []
+    db_session.execute.assert_not_awaited()
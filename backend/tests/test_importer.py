@@ -0,0 +1,159 @@
+import io
+from unittest.mock import patch
+
+import orjson
+import pytest
+from sqlalchemy import text
+
+from app.api import imports
+from app.jobs.importer import DecisionImportRow, import_decisions, read_records
+from app.main import app
+
+
+def _ndjson(*records) -> list[str]:
+    return [r if isinstance(r, str) else orjson.dumps(r).decode() for r in records]
+
+
+def test_csv_cells_become_lists_and_links():
+    source = io.StringIO(
+        "external_id,title,tags,links,summary\n"
+        'ADR-1,Use Postgres,"postgres, storage",https://github.com/acme/api/pull/812 '
+        "https://acme.atlassian.net/browse/OPS-7,\n"
+        'ADR-2,Use Redis,"[""cache""]",,Queues too\n'
+    )
+
+    records = list(read_records(source, "csv"))
+
+    assert [line for line, _, _ in records] == [2, 3]
+    first = DecisionImportRow.model_validate(records[0][1])
+    assert first.tags == ["postgres", "storage"]
+    assert [link.link_url for link in first.links] == [
+        "https://github.com/acme/api/pull/812",
+        "https://acme.atlassian.net/browse/OPS-7",
+    ]
+    assert first.summary is None
+    assert DecisionImportRow.model_validate(records[1][1]).tags == ["cache"]
+
+
+@pytest.mark.asyncio
+async def test_import_upserts_batches_and_reports_row_errors(db, fake_redis, pipeline):
+    lines = _ndjson(
+        {
+            "external_id": "ADR-1", "title": "Use Postgres", "tags": ["postgres"],
+            "links": [{"link_url": "https://acme.atlassian.net/browse/OPS-7"}],
+        },
+        "{not json",
+        {"external_id": "ADR-2", "summary": "no title"},
+        {"external_id": "ADR-3", "title": "Adopt arq", "status": "pending"},
+        {"external_id": "ADR-1", "title": "Use Postgres again"},
+        {"title": "Keyless decision", "decision_made_at": "2024-03-01T12:00:00Z"},
+    )
+
+    result = await import_decisions(
+        db.factory, fake_redis, db.workspace_id, read_records(lines, "ndjson"), batch_size=2
+    )
+
+    assert (result["rows"], result["inserted"], result["updated"]) == (6, 3, 0)
+    assert result["links"] == 1
+    assert [(e["line"], e["error"].split(":")[0]) for e in result["errors"]] == [
+        (2, "invalid JSON"),
+        (3, "title"),
+        (5, "duplicate of line 1"),
+    ]
+    assert result["failed"] == 3
+    # Pending decisions are embedded on confirmation, not on import
+    assert result["embedding_jobs"] == 2
+    assert len(pipeline.jobs) == 2
+    # Parse errors do not count towards a batch: lines 1+3, 4+5 and 6
+    assert len([s for s in db.statements if s.startswith("WITH upserted")]) == 3
+
+    rows = (
+        await db.conn.execute(
+            text(
+                "SELECT import_key, status, confirmed_at IS NOT NULL, source_type "
+                "FROM decisions WHERE workspace_id = :ws ORDER BY created_at"
+            ),
+            {"ws": db.workspace_id},
+        )
+    ).all()
+    assert {(r[0].split(":")[0], r[1], r[2], r[3]) for r in rows} == {
+        ("ADR-1", "active", True, "import"),
+        ("ADR-3", "pending", False, "import"),
+        ("title", "active", True, "import"),
+    }
+    link = (
+        await db.conn.execute(
+            text("SELECT artifact_key FROM decision_links WHERE workspace_id = :ws"),
+            {"ws": db.workspace_id},
+        )
+    ).scalar_one()
+    assert link == "OPS-7"
+
+
+@pytest.mark.asyncio
+async def test_reimport_updates_in_place_and_keeps_status(db, fake_redis):
+    first = _ndjson(
+        {
+            "external_id": "ADR-1", "title": "Use Postgres",
+            "links": [{"link_url": "https://example.com/adr/1"}],
+        },
+        {"external_id": "ADR-2", "title": "Use Redis"},
+    )
+    await import_decisions(db.factory, None, db.workspace_id, read_records(first, "ndjson"))
+    await db.conn.execute(
+        text("UPDATE decisions SET status = 'ignored' WHERE import_key = 'ADR-1'")
+    )
+    await db.conn.execute(
+        text("UPDATE decisions SET status = 'deleted' WHERE import_key = 'ADR-2'")
+    )
+
+    second = _ndjson(
+        {
+            "external_id": "ADR-1", "title": "Use Postgres 16",
+            "links": [
+                {"link_url": "https://example.com/adr/1"},
+                {"link_url": "https://example.com/adr/1-rev"},
+            ],
+        },
+        {"external_id": "ADR-2", "title": "Use Redis 7"},
+    )
+    result = await import_decisions(
+        db.factory, fake_redis, db.workspace_id, read_records(second, "ndjson")
+    )
+
+    assert (result["inserted"], result["updated"], result["links"]) == (0, 1, 1)
+    assert result["errors"] == [{"line": 2, "error": "existing decision is deleted"}]
+    assert result["embedding_jobs"] == 0
+    rows = (
+        await db.conn.execute(
+            text(
+                "SELECT import_key, title, status, "
+                "(SELECT count(*) FROM decision_links l WHERE l.decision_id = d.id) "
+                "FROM decisions d WHERE workspace_id = :ws ORDER BY import_key"
+            ),
+            {"ws": db.workspace_id},
+        )
+    ).all()
+    assert rows == [
+        ("ADR-1", "Use Postgres 16", "ignored", 2),
+        ("ADR-2", "Use Redis", "deleted", 0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_endpoint_reads_csv_body(db, api, fake_redis, pipeline):
+    app.state.arq_pool = fake_redis
+    body = "﻿external_id,title,category\nADR-9,Use zstd,architecture\n,,\n"
+    with patch.object(imports, "async_session_factory", db.factory):
+        response = await api.post(
+            "/api/decisions/import",
+            content=body.encode(),
+            headers={"Content-Type": "text/csv"},
+        )
+
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert (result["rows"], result["inserted"], result["failed"]) == (2, 1, 1)
+    assert result["errors"][0]["line"] == 3
+    assert result["rows_per_s"] > 0
+    assert pipeline.executed == 1
@@ -0,0 +1,57 @@
+import math
+import random
+
+import pytest
+
+from app.search.lexical_index import WorkspaceLexicalIndex, tokenize
+
+WORDS = "postgres redis kafka migrate cache queue shard index replica billing auth deploy".split()
+
+
+def _brute_force(index: WorkspaceLexicalIndex, docs: dict[str, str], query: str, k: int):
+    n = len(docs)
+    tokenized = {d: tokenize(text) for d, text in docs.items()}
+    avgdl = sum(len(t) for t in tokenized.values()) / n
+    scores = {}
+    for term in set(tokenize(query)):
+        df = sum(1 for t in tokenized.values() if term in t)
+        if not df:
+            continue
+        idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        for d, tokens in tokenized.items():
+            tf = tokens.count(term)
+            if tf:
+                norm = index.k1 * (1 - index.b + index.b * len(tokens) / avgdl)
+                scores[d] = scores.get(d, 0.0) + idf * tf * (index.k1 + 1) / (tf + norm)
+    return sorted(scores.values(), reverse=True)[:k]
+
+
+def test_tokenize_drops_stopwords_and_strips_suffixes():
+    assert tokenize("We are migrating the billing queues") == ["migrat", "bill", "queu"]
+
+
+def test_maxscore_matches_exhaustive_bm25():
+    rng = random.Random(7)
+    docs = {
+        f"d{i}": " ".join(rng.choices(WORDS, k=rng.randint(3, 30))) for i in range(400)
+    }
+    index = WorkspaceLexicalIndex()
+    for decision_id, text in docs.items():
+        index.upsert(decision_id, text)
+
+    for query in ("postgres replica", "kafka queue billing auth", "deploy"):
+        results = index.search(query, k=10)
+        assert [s for _, s in results] == pytest.approx(_brute_force(index, docs, query, 10))
+
+
+def test_upsert_and_remove_update_postings():
+    index = WorkspaceLexicalIndex()
+    index.upsert("a", "move sessions to redis", ["cache"])
+    index.upsert("b", "redis cluster for queues")
+    index.upsert("a", "keep sessions in postgres", ["Database"])
+    index.remove("b")
+
+    assert index.search("redis", k=5) == []
+    assert [d for d, _ in index.search("postgres sessions", k=5)] == ["a"]
+    assert index.tags("a") == {"database"}
+    assert len(index) == 1
@@ -0,0 +1,58 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from app.search.lookup import build_lookup_query, describe_lookup, parse_lookup
+
+NOW = datetime(2026, 10, 14, 15, 30, tzinfo=timezone.utc)  # a Wednesday
+
+
+def test_jira_key_and_pr_are_lookups():
+    intent = parse_lookup("PROJ-1234", now=NOW)
+    assert intent["jira_keys"] == ["PROJ-1234"]
+
+    intent = parse_lookup("what did we decide about #812?", now=NOW)
+    assert intent["pr_numbers"] == [812]
+    assert intent["channel_name"] is None
+
+
+def test_owner_channel_and_date_grammar():
+    intent = parse_lookup("decisions by <@U024BE7LH|alice>", now=NOW)
+    assert intent["owner_slack_id"] == "U024BE7LH"
+
+    intent = parse_lookup("what did we decide in #infra last week", now=NOW)
+    assert intent["channel_name"] == "infra"
+    assert intent["date_from"] == datetime(2026, 10, 5, tzinfo=timezone.utc)
+    assert intent["date_to"] == datetime(2026, 10, 12, tzinfo=timezone.utc)
+    assert describe_lookup(intent, 2) == "Found 2 decisions in #infra last week."
+
+    intent = parse_lookup("decisions by @alice in <#C123ABC|infra> past 3 days", now=NOW)
+    assert intent["owner_name"] == "alice"
+    assert intent["channel_id"] == "C123ABC"
+    assert intent["date_from"] == datetime(2026, 10, 11, 15, 30, tzinfo=timezone.utc)
+
+
+def test_free_text_falls_back_to_hybrid():
+    assert parse_lookup("why did we pick postgres over mongo", now=NOW) is None
+    assert parse_lookup("PROJ-1234 rollback plan", now=NOW) is None
+    assert parse_lookup("what did we decide", now=NOW) is None
+
+
+def test_invalid_calendar_date_falls_back_to_hybrid():
+    assert parse_lookup("decisions since 2026-02-30", now=NOW) is None
+    assert parse_lookup("decisions on 2026-13-01", now=NOW) is None
+    assert parse_lookup("decisions since 2026-02-28", now=NOW)["date_from"] == datetime(
+        2026, 2, 28, tzinfo=timezone.utc
+    )
+
+
+def test_lookup_query_uses_direct_predicates():
+    intent = parse_lookup("PROJ-7 by <@U1>", now=NOW)
+    sql = str(
+        build_lookup_query(str(uuid.uuid4()), intent).compile(dialect=postgresql.dialect())
+    )
+    assert "decision_links.artifact_key IN" in sql
+    assert "phraseto_tsquery" in sql
+    assert "decisions.owner_slack_id =" in sql
+    assert "embedding" not in sql
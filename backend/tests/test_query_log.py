@@ -0,0 +1,51 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.search import query_log
+from app.search.query_log import QueryLogBuffer
+
+
+def _session_factory(inserted: list):
+    session = MagicMock()
+
+    async def execute(statement, rows):
+        inserted.append(list(rows))
+
+    session.execute = AsyncMock(side_effect=execute)
+    session.commit = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory
+
+
+def _record(buffer: QueryLogBuffer, n: int) -> None:
+    for i in range(n):
+        buffer.record(str(uuid.uuid4()), "U1", f"query {i}", 3, 120, "api")
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_buffered_rows_in_batches():
+    inserted: list = []
+    buffer = QueryLogBuffer(max_size=100)
+    with (
+        patch.object(query_log.settings, "query_log_batch_size", 4),
+        patch.object(query_log.settings, "query_log_flush_interval_s", 60),
+    ):
+        buffer.start(_session_factory(inserted))
+        _record(buffer, 3)
+        await buffer.stop()
+
+    assert [len(batch) for batch in inserted] == [3]
+    assert inserted[0][0]["response_time_ms"] == 120
+    assert len(buffer) == 0
+
+
+def test_full_buffer_drops_instead_of_blocking():
+    buffer = QueryLogBuffer(max_size=2)
+    _record(buffer, 5)
+
+    assert len(buffer) == 2
+    assert buffer.dropped == 3
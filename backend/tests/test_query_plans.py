@@ -0,0 +1,210 @@
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.analytics import breakdowns_query, overview_counts_query
+from app.api.decisions import (
+    _Explain,
+    decision_count_query,
+    decision_list_query,
+    decision_page_query,
+)
+from app.api.schemas import DecisionOut
+from app.api.serialization import parse_fields
+from app.config import settings
+from app.db.models import Decision, PendingConfirmation
+from app.jobs.dedup import SIMILAR_DECISION_SQL
+from app.search.engine import (
+    FILTERED_VECTOR_CANDIDATES_SQL,
+    KEYWORD_CANDIDATES_SQL,
+    TAG_CANDIDATES_SQL,
+    VECTOR_CANDIDATES_SQL,
+)
+
+WORKSPACES = 200
+DECISIONS_PER_WORKSPACE = 500
+WATCHED_TABLES = ["decisions", "pending_confirmations", "query_logs", "decision_chunks"]
+# A seq scan is the right plan for a table this small, so only larger ones count
+LARGE_TABLE_ROWS = 10_000
+
+
+SEED_SQL = [
+    """
+    INSERT INTO workspaces (id, slack_team_id, team_name)
+    SELECT gen_random_uuid(), 'T_PLAN_' || n, 'Plan ' || n
+    FROM generate_series(1, :workspaces) AS n
+    """,
+    """
+    INSERT INTO decisions (id, workspace_id, title, summary, rationale, status, category, tags, created_at)
+    SELECT
+        gen_random_uuid(),
+        w.id,
+        'Decision ' || n || ' about ' || (ARRAY['postgres', 'redis', 'kafka', 'graphql', 'pricing'])[1 + n % 5],
+        'Summary for decision ' || n,
+        'Rationale mentioning ' || (ARRAY['latency', 'cost', 'hiring', 'security'])[1 + n % 4],
+        (ARRAY['active', 'active', 'active', 'pending', 'ignored', 'expired', 'deleted'])[1 + n % 7],
+        (ARRAY['architecture', 'api', 'infrastructure', 'schema'])[1 + n % 4],
+        ARRAY[(ARRAY['database', 'backend', 'frontend', 'infra'])[1 + n % 4]],
+        now() - (n % 365) * interval '1 day'
+    FROM workspaces w
+    CROSS JOIN generate_series(1, :per_workspace) AS n
+    WHERE w.slack_team_id LIKE 'T_PLAN_%'
+    """,
+    """
+    INSERT INTO pending_confirmations (id, workspace_id, decision_id, status, expires_at)
+    SELECT
+        gen_random_uuid(),
+        d.workspace_id,
+        d.id,
+        CASE WHEN random() < 0.02 THEN 'pending' ELSE 'expired' END,
+        now() - interval '1 hour' + random() * interval '96 hours'
+    FROM decisions d
+    JOIN workspaces w ON w.id = d.workspace_id
+    WHERE w.slack_team_id LIKE 'T_PLAN_%'
+    """,
+    """
+    INSERT INTO query_logs (id, workspace_id, query_text, created_at)
+    SELECT gen_random_uuid(), d.workspace_id, d.title, d.created_at
+    FROM decisions d
+    JOIN workspaces w ON w.id = d.workspace_id
+    WHERE w.slack_team_id LIKE 'T_PLAN_%'
+    """,
+    "ANALYZE workspaces",
+    "ANALYZE decisions",
+    "ANALYZE pending_confirmations",
+    "ANALYZE query_logs",
+    "ANALYZE decision_chunks",
+]
+
+
+def _seq_scans(plan: dict, tables: set[str]) -> list[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in tables:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child, tables))
+    return found
+
+
+@pytest_asyncio.fixture
+async def seeded_conn():
+    engine = create_async_engine(settings.database_url)
+    try:
+        conn = await engine.connect()
+    except (OSError, OperationalError, DBAPIError):
+        await engine.dispose()
+        pytest.skip("database not available")
+
+    trans = await conn.begin()
+    try:
+        for stmt in SEED_SQL:
+            await conn.execute(
+                text(stmt),
+                {"workspaces": WORKSPACES, "per_workspace": DECISIONS_PER_WORKSPACE},
+            )
+        workspace_id = (
+            await conn.execute(
+                text("SELECT id FROM workspaces WHERE slack_team_id = 'T_PLAN_1'")
+            )
+        ).scalar_one()
+        yield conn, workspace_id
+    finally:
+        await trans.rollback()
+        await conn.close()
+        await engine.dispose()
+
+
+def _hot_queries(workspace_id: uuid.UUID) -> dict:
+    now = datetime.now(timezone.utc)
+    week_ago = now - timedelta(days=7)
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    # What GET /api/decisions runs for a request without ?fields=
+    columns = parse_fields(None, DecisionOut, always=("id", "created_at"))
+    list_query = decision_list_query(workspace_id, columns)
+    search_params = {
+        "query_embedding": str([0.01] * 1024),
+        "embedding": str([0.01] * 1024),
+        "workspace_id": str(workspace_id),
+        "query": "postgres latency",
+        "query_tags": ["postgres"],
+        "query_impact_areas": [],
+        "date_from": None,
+        "date_to": None,
+        "owner_filter": None,
+        "categories": None,
+        "filter_tags": None,
+        "candidate_limit": 50,
+        "chunk_limit": 400,
+    }
+
+    return {
+        "list_decisions": (decision_page_query(list_query, 20), {}),
+        "list_decisions_keyset": (
+            decision_page_query(
+                list_query, 20, after=(now - timedelta(days=200), uuid.uuid4())
+            ),
+            {},
+        ),
+        "list_decisions_by_status": (
+            decision_page_query(decision_list_query(workspace_id, columns, status="pending"), 20),
+            {},
+        ),
+        "list_decisions_count": (decision_count_query(list_query), {}),
+        "analytics_overview_counts": (overview_counts_query(workspace_id, week_ago), {}),
+        "analytics_breakdowns": (breakdowns_query(workspace_id), {}),
+        "process_message_daily_count": (
+            select(func.count(Decision.id)).where(
+                Decision.workspace_id == workspace_id, Decision.created_at >= today_start
+            ),
+            {},
+        ),
+        "expire_confirmations": (
+            select(PendingConfirmation).where(
+                PendingConfirmation.expires_at < now,
+                PendingConfirmation.status == "pending",
+            ),
+            {},
+        ),
+        "process_message_similar_decision": (SIMILAR_DECISION_SQL, search_params),
+        "search_keyword_leg": (KEYWORD_CANDIDATES_SQL, search_params),
+        "search_vector_leg": (VECTOR_CANDIDATES_SQL, search_params),
+        "search_filtered_vector_leg": (
+            FILTERED_VECTOR_CANDIDATES_SQL,
+            {**search_params, "categories": ["schema"]},
+        ),
+        "search_tag_leg": (TAG_CANDIDATES_SQL, search_params),
+    }
+
+
+@pytest.mark.asyncio
+async def test_hot_queries_avoid_sequential_scans(seeded_conn):
+    conn, workspace_id = seeded_conn
+
+    large_tables = set(
+        (
+            await conn.execute(
+                text(
+                    "SELECT relname FROM pg_class "
+                    "WHERE relname = ANY(:tables) AND reltuples >= :min_rows"
+                ),
+                {"tables": WATCHED_TABLES, "min_rows": LARGE_TABLE_ROWS},
+            )
+        ).scalars()
+    )
+    assert {"decisions", "pending_confirmations", "query_logs"} <= large_tables
+
+    offenders = {}
+    for name, (stmt, params) in _hot_queries(workspace_id).items():
+        raw = (await conn.execute(_Explain(stmt), params)).scalar_one()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+        scans = _seq_scans(plan, large_tables)
+        if scans:
+            offenders[name] = scans
+
+    assert offenders == {}
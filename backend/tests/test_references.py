@@ -1,5 +1,6 @@
 from app.integrations.jira.references import extract_jira_references
 from app.integrations.github.references import extract_github_references
+from app.integrations.artifacts import github_artifact_key, normalize_artifact_ref
 
 
 class TestJiraReferences:
@@ -64,3 +65,18 @@ class TestGitHubReferences:
         text = "https://github.com/a/b/pull/1 and https://github.com/a/b/pull/1"
         refs = extract_github_references(text)
         assert len(refs) == 1
+
+
+class TestArtifactKeys:
+    def test_jira_keys_normalize_to_uppercase(self):
+        assert normalize_artifact_ref("proj-1234") == "PROJ-1234"
+        assert normalize_artifact_ref("https://acme.atlassian.net/browse/PROJ-7") == "PROJ-7"
+
+    def test_pull_requests_normalize_to_owner_repo_number(self):
+        assert normalize_artifact_ref("https://github.com/Acme/API/pull/812") == "acme/api#812"
+        assert normalize_artifact_ref("Acme/API#812") == "acme/api#812"
+        assert normalize_artifact_ref("#812", "Acme", "API") == github_artifact_key("acme", "api", 812)
+
+    def test_bare_number_needs_default_repo(self):
+        assert normalize_artifact_ref("#812") is None
+        assert normalize_artifact_ref("not a ref") is None
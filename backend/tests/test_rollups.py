@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+
+SEED_DECISIONS_SQL = """\
+INSERT INTO decisions (id, workspace_id, title, status, created_at)
+SELECT gen_random_uuid(), :ws, 'Decision ' || i,
+       (ARRAY['pending', 'pending', 'active', 'ignored'])[1 + i % 4],
+       now() - make_interval(days => i % 2)
+FROM generate_series(0, 7) AS i
+"""
+
+SEED_QUERIES_SQL = """\
+INSERT INTO query_logs (id, workspace_id, query_text, response_time_ms)
+SELECT gen_random_uuid(), :ws, 'q', ms
+FROM unnest(ARRAY[100, 200, 400, 1500, 5000, NULL]::int[]) AS ms
+"""
+
+
+async def _decision_stats(db) -> dict:
+    rows = await db.conn.execute(
+        text(
+            "SELECT day, created, confirmed, ignored, expired "
+            "FROM decision_daily_stats WHERE workspace_id = :ws"
+        ),
+        {"ws": db.workspace_id},
+    )
+    return {r.day: tuple(r[1:]) for r in rows}
+
+
+@pytest.mark.asyncio
+async def test_triggers_count_inserts_and_status_changes(db):
+    today = datetime.now(timezone.utc).date()
+    yesterday = today - timedelta(days=1)
+
+    await db.conn.execute(text(SEED_DECISIONS_SQL), {"ws": db.workspace_id})
+
+    assert await _decision_stats(db) == {
+        today: (4, 2, 0, 0),
+        yesterday: (4, 0, 2, 0),
+    }
+
+    await db.conn.execute(
+        text(
+            "UPDATE decisions SET status = CASE WHEN title = 'Decision 0' THEN 'ignored' "
+            "ELSE 'active' END WHERE workspace_id = :ws AND status = 'pending'"
+        ),
+        {"ws": db.workspace_id},
+    )
+    # Rewriting a status to the same value is not a transition
+    await db.conn.execute(
+        text("UPDATE decisions SET status = status, title = title || '!' WHERE workspace_id = :ws"),
+        {"ws": db.workspace_id},
+    )
+
+    assert await _decision_stats(db) == {
+        today: (4, 5, 1, 0),
+        yesterday: (4, 0, 2, 0),
+    }
+
+
+@pytest.mark.asyncio
+async def test_daily_endpoints_read_only_the_rollups(db, api):
+    await db.conn.execute(text(SEED_DECISIONS_SQL), {"ws": db.workspace_id})
+    await db.conn.execute(text(SEED_QUERIES_SQL), {"ws": db.workspace_id})
+    db.statements.clear()
+
+    decisions = await api.get("/api/analytics/decisions/daily", params={"days": 7})
+    queries = await api.get("/api/analytics/queries/daily", params={"days": 7})
+
+    assert decisions.status_code == 200
+    series = decisions.json()
+    assert len(series) == 7
+    assert series[0] == {
+        "day": (datetime.now(timezone.utc).date() - timedelta(days=6)).isoformat(),
+        "created": 0, "confirmed": 0, "ignored": 0, "expired": 0,
+    }
+    assert [p["created"] for p in series[-2:]] == [4, 4]
+
+    assert queries.status_code == 200
+    assert queries.json()[-1] == {
+        "day": datetime.now(timezone.utc).date().isoformat(),
+        "queries": 6,
+        "latency_lt_250ms": 2,
+        "latency_lt_1s": 1,
+        "latency_lt_3s": 1,
+        "latency_ge_3s": 1,
+        "mean_response_ms": 1440.0,
+    }
+    assert queries.json()[0]["mean_response_ms"] is None
+
+    assert not [s for s in db.statements if "FROM decisions" in s or "FROM query_logs" in s]
+    assert (await api.get("/api/analytics/queries/daily", params={"days": 0})).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_rollups_are_deleted_with_their_workspace(db):
+    await db.conn.execute(text(SEED_DECISIONS_SQL), {"ws": db.workspace_id})
+    await db.conn.execute(text(SEED_QUERIES_SQL), {"ws": db.workspace_id})
+
+    for table in ("decisions", "query_logs"):
+        await db.conn.execute(
+            text(f"DELETE FROM {table} WHERE workspace_id = :ws"), {"ws": db.workspace_id}
+        )
+    await db.conn.execute(text("DELETE FROM workspaces WHERE id = :ws"), {"ws": db.workspace_id})
+
+    assert await _decision_stats(db) == {}
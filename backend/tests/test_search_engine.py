@@ -0,0 +1,181 @@
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import text
+
+from app.search import engine
+from app.search.engine import hybrid_search
+from app.search.hydration import HYDRATE_COLUMNS
+
+KEYWORD_ID = uuid.uuid4()
+TAG_ID = uuid.uuid4()
+VECTOR_ID = uuid.uuid4()
+
+
+def _result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def _fake_session():
+    executed = []
+
+    async def execute(statement, params=None):
+        executed.append(statement)
+        if statement is engine.KEYWORD_CANDIDATES_SQL:
+            return _result([("keyword", KEYWORD_ID, 0.4, False)])
+        if statement is engine.TAG_CANDIDATES_SQL:
+            return _result([("tag", TAG_ID, 0.0, True)])
+        if statement is engine.VECTOR_CANDIDATES_SQL:
+            return _result([("vector", VECTOR_ID, 0.9, False)])
+        return _result([])
+
+    db_session = MagicMock()
+    db_session.execute = AsyncMock(side_effect=execute)
+    return db_session, executed
+
+
+async def _hydrate(db_session, page, columns=()):
+    return [{"id": decision_id, "combined_score": score} for decision_id, score in page]
+
+
+@pytest.mark.asyncio
+async def test_slow_embedding_degrades_to_keyword_and_tags():
+    async def slow_embedding(query):
+        await asyncio.sleep(5)
+        return [0.1] * 1024
+
+    db_session, executed = _fake_session()
+    with (
+        patch.object(engine, "generate_query_embedding", slow_embedding),
+        patch.object(engine, "hydrate_results", _hydrate),
+        patch.object(engine.settings, "search_embedding_deadline_ms", 50),
+    ):
+        result = await hybrid_search(db_session, str(uuid.uuid4()), "postgres tags")
+
+    assert result["degraded"] is True
+    assert engine.VECTOR_CANDIDATES_SQL not in executed
+    assert [d["id"] for d in result["decisions"]] == [str(KEYWORD_ID), str(TAG_ID)]
+
+
+@pytest.mark.asyncio
+async def test_embedding_within_deadline_joins_vector_leg():
+    db_session, executed = _fake_session()
+    with (
+        patch.object(engine, "generate_query_embedding", AsyncMock(return_value=[0.1] * 1024)),
+        patch.object(engine, "hydrate_results", _hydrate),
+    ):
+        result = await hybrid_search(db_session, str(uuid.uuid4()), "postgres tags")
+
+    assert result["degraded"] is False
+    assert engine.TAG_CANDIDATES_SQL not in executed
+    assert {d["id"] for d in result["decisions"]} == {str(KEYWORD_ID), str(VECTOR_ID)}
+
+
+@pytest.mark.asyncio
+async def test_failed_embedding_degrades_without_waiting_for_deadline():
+    db_session, _ = _fake_session()
+    with (
+        patch.object(engine, "generate_query_embedding", AsyncMock(return_value=[])),
+        patch.object(engine, "hydrate_results", _hydrate),
+    ):
+        result = await hybrid_search(db_session, str(uuid.uuid4()), "postgres")
+
+    assert result["degraded"] is True
+    assert result["total_count"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "requested, expected",
+    [(None, "400"), (40, "400"), (600, "600"), (5000, str(engine.MAX_EF_SEARCH))],
+)
+async def test_ef_search_covers_the_candidate_limits(requested, expected):
+    db_session, _ = _fake_session()
+    with (
+        patch.object(engine.settings, "search_candidate_limit", 50),
+        patch.object(engine.settings, "max_chunks_per_decision", 8),
+    ):
+        params = engine._candidate_params(str(uuid.uuid4()), "postgres", None)
+        await engine.fetch_vector_candidates(db_session, params, [0.1] * 1024, requested)
+
+    statement, sent = db_session.execute.await_args_list[0].args
+    assert statement is engine.SET_EF_SEARCH_SQL
+    assert sent == {"ef_search": expected}
+
+
+@pytest.mark.asyncio
+async def test_embedding_indexes_use_the_configured_hnsw_build(db):
+    rows = await db.conn.execute(
+        text("SELECT indexname, indexdef FROM pg_indexes WHERE indexname = ANY(:names)"),
+        {"names": ["ix_decisions_embedding", "ix_decision_chunks_embedding"]},
+    )
+    indexes = dict(rows.all())
+
+    assert len(indexes) == 2
+    for indexdef in indexes.values():
+        assert "USING hnsw (embedding vector_cosine_ops)" in indexdef
+        assert f"m='{engine.settings.hnsw_m}'" in indexdef
+        assert f"ef_construction='{engine.settings.hnsw_ef_construction}'" in indexdef
+
+
+SEED_EMBEDDED_SQL = text("""\
+INSERT INTO decisions (id, workspace_id, title, status, category, embedding)
+SELECT gen_random_uuid(), :ws, 'Decision ' || i, 'active', :category,
+       CAST(CAST(ARRAY[:x, :y + (i % 10) * 0.01] || array_fill(0.0, ARRAY[1022]) AS real[]) AS vector)
+FROM generate_series(1, :n) AS i
+""")
+
+
+@pytest.mark.asyncio
+async def test_filtered_vector_leg_finds_matches_far_from_the_query(db):
+    # Far more near misses than ef_search, so an HNSW scan would only see those
+    near = {"ws": db.workspace_id, "category": "api", "x": 1.0, "y": 0.0, "n": 1600}
+    far = {"ws": db.workspace_id, "category": "schema", "x": 0.0, "y": 1.0, "n": 3}
+    await db.conn.execute(SEED_EMBEDDED_SQL, near)
+    await db.conn.execute(SEED_EMBEDDED_SQL, far)
+    await db.conn.execute(text("ANALYZE decisions"))
+
+    async with db.factory() as session:
+        # Leave the planner HNSW as its best plan wherever the statement allows it
+        for setting in ("enable_seqscan", "enable_bitmapscan"):
+            await session.execute(text(f"SET LOCAL {setting} = off"))
+        params = engine._candidate_params(
+            str(db.workspace_id), "schema", {"categories": ["schema"]}
+        )
+        candidates, _ = await engine.fetch_vector_candidates(
+            session, params, [1.0] + [0.0] * 1023
+        )
+
+    assert len(candidates) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("columns", [HYDRATE_COLUMNS, ("title",)])
+async def test_search_times_each_phase_and_hydrates_only_display_columns(db, columns):
+    await db.conn.execute(
+        SEED_EMBEDDED_SQL, {"ws": db.workspace_id, "category": "api", "x": 1.0, "y": 0.0, "n": 3}
+    )
+    db.statements.clear()
+
+    async with db.factory() as session:
+        result = await hybrid_search(
+            session,
+            str(db.workspace_id),
+            "decision",
+            query_embedding=[1.0] + [0.0] * 1023,
+            columns=columns,
+        )
+
+    assert set(result["timings"]) == {
+        "keyword_ms", "embedding_wait_ms", "vector_ms", "fusion_ms", "hydration_ms",
+    }
+    assert len(result["decisions"]) == 3
+    assert all(set(d) == {"id", *columns, "combined_score"} for d in result["decisions"])
+
+    hydration = [s for s in db.statements if "WHERE id = ANY" in s]
+    assert len(hydration) == 1
+    assert hydration[0].splitlines()[0] == f"SELECT {', '.join(('id',) + columns)}"
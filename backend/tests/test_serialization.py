@@ -0,0 +1,41 @@
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.schemas import DecisionOut
+from app.api.serialization import ORJSONResponse, parse_fields, rows_adapter, validate_rows
+
+ROW = {
+    "id": uuid.uuid4(),
+    "title": "Adopt pgvector",
+    "summary": "Store embeddings next to decisions",
+    "tags": ["search"],
+    "confidence": 0.9,
+    "status": "active",
+    "created_at": datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+    "updated_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+}
+
+
+def test_parse_fields_keeps_model_order_and_required_fields():
+    assert parse_fields("status, title", DecisionOut) == ("id", "title", "status")
+    assert parse_fields(None, DecisionOut) == tuple(DecisionOut.model_fields)
+    with pytest.raises(HTTPException) as exc:
+        parse_fields("title,embedding", DecisionOut)
+    assert exc.value.status_code == 400
+
+
+def test_batch_output_matches_pydantic_serialization():
+    columns = tuple(DecisionOut.model_fields)
+    full = {column: ROW.get(column) for column in columns}
+    body = ORJSONResponse(validate_rows(DecisionOut, columns, [full])).body
+    assert json.loads(body) == [json.loads(DecisionOut.model_validate(full).model_dump_json())]
+
+
+def test_projection_drops_unrequested_fields_and_caches_adapter():
+    columns = parse_fields("title", DecisionOut)
+    assert validate_rows(DecisionOut, columns, [ROW]) == [{"id": ROW["id"], "title": "Adopt pgvector"}]
+    assert rows_adapter(DecisionOut, columns) is rows_adapter(DecisionOut, columns)
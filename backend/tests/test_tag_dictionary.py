@@ -0,0 +1,56 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.search import tag_dictionary
+from app.search.engine import _candidate_params
+from app.search.tag_dictionary import TagMatcher
+
+
+def test_matches_hyphenated_and_multiword_tags():
+    matcher = TagMatcher(["event-sourcing", "kafka", "rate_limit"], ["checkout"])
+    assert matcher.match("Why event sourcing over Kafka for rate limit handling in checkout?") == {
+        "tags": ["event-sourcing", "kafka", "rate_limit"],
+        "impact_areas": ["checkout"],
+    }
+
+
+def test_ignores_noise_words_and_partial_words():
+    matcher = TagMatcher(["api", "auth", "postgres"], [])
+    assert matcher.match("why did we pick the apis for authentication") == {
+        "tags": [],
+        "impact_areas": [],
+    }
+
+
+def test_overlapping_patterns_all_reported():
+    matcher = TagMatcher(["search", "search-ranking", "ranking"], [])
+    assert sorted(matcher.match("search ranking tweaks")["tags"]) == [
+        "ranking", "search", "search-ranking",
+    ]
+
+
+def test_candidate_params_use_only_known_tags():
+    matcher = TagMatcher(["Event-Sourcing"], ["billing"])
+    params = _candidate_params("ws", "what about event sourcing for billing", None, matcher)
+    assert params["query_tags"] == ["Event-Sourcing"]
+    assert params["query_impact_areas"] == ["billing"]
+    assert _candidate_params("ws", "what about event sourcing", None)["query_tags"] == []
+
+
+@pytest.mark.asyncio
+async def test_matcher_cached_until_ttl_expires():
+    load = AsyncMock(side_effect=lambda db, ws: TagMatcher(["kafka"], []))
+    tag_dictionary.invalidate()
+    with (
+        patch.object(tag_dictionary, "_load", load),
+        patch.object(tag_dictionary.settings, "tag_dictionary_ttl_s", 300),
+    ):
+        first = await tag_dictionary.get_tag_matcher(None, "ws")
+        assert await tag_dictionary.get_tag_matcher(None, "ws") is first
+        assert load.await_count == 1
+
+        tag_dictionary.invalidate("ws")
+        assert await tag_dictionary.get_tag_matcher(None, "ws") is not first
+        assert load.await_count == 2
+    tag_dictionary.invalidate()
@@ -0,0 +1,55 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.search.vector_index import WorkspaceVectorIndex
+
+
+def _unit(*hot: int, dim: int = 8) -> list[float]:
+    vector = [0.0] * dim
+    for i in hot:
+        vector[i] = 1.0
+    return vector
+
+
+def test_search_groups_chunk_rows_by_decision_max_sim():
+    index = WorkspaceVectorIndex(dim=8)
+    index.upsert("a", [_unit(0), _unit(1)], ["postgres"])
+    index.upsert("b", [_unit(0, 2)])
+
+    results = index.search(_unit(1, 2), k=5)
+
+    assert [decision_id for decision_id, _ in results] == ["a", "b"]
+    assert results[0][1] == pytest.approx(0.7071, abs=1e-4)
+    assert results[1][1] == pytest.approx(0.5)
+    assert index.tags("a") == {"postgres"}
+
+
+def test_upsert_replaces_and_remove_compacts():
+    index = WorkspaceVectorIndex(dim=8)
+    for i in range(4):
+        index.upsert(str(i), [_unit(i)])
+    index.upsert("0", [_unit(5)])
+    index.remove("1")
+    index.remove("2")
+
+    assert index.decision_ids() == {"0", "3"}
+    assert [d for d, _ in index.search(_unit(5), k=1)] == ["0"]
+    assert index.search(_unit(1), k=5)[0][1] == pytest.approx(0.0)
+
+
+def test_snapshot_round_trip_is_memory_mapped(tmp_path):
+    index = WorkspaceVectorIndex(dim=8)
+    index.upsert("a", [_unit(0)], ["db"])
+    index.upsert("b", [_unit(3)])
+    index.fingerprint = {"count": 2, "updated_at": None}
+    index.save(tmp_path / "ws")
+
+    loaded = WorkspaceVectorIndex.load(tmp_path / "ws")
+
+    assert isinstance(loaded._matrix, np.memmap)
+    assert loaded.fingerprint == index.fingerprint
+    assert [d for d, _ in loaded.search(_unit(3), k=1)] == ["b"]
+
+    loaded.upsert("c", [_unit(4)])
+    assert [d for d, _ in loaded.search(_unit(4), k=1)] == ["c"]
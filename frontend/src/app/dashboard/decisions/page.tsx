@@ -30,7 +30,8 @@ const STATUS_COLORS: Record<string, string> = {
 
 export default function DecisionsPage() {
   const [decisions, setDecisions] = useState<Decision[]>([]);
-  const [total, setTotal] = useState(0);
+  const [total, setTotal] = useState<number | null>(0);
+  const [hasMore, setHasMore] = useState(false);
   const [page, setPage] = useState(1);
   const [status, setStatus] = useState("");
   const [category, setCategory] = useState("");
@@ -53,6 +54,7 @@ export default function DecisionsPage() {
       );
       setDecisions(data.items);
       setTotal(data.total);
+      setHasMore(data.next_cursor != null);
     } catch (e: unknown) {
       setError((e as Error).message);
     }
@@ -82,7 +84,10 @@ export default function DecisionsPage() {
     fetchDecisions();
   };
 
-  const totalPages = Math.ceil(total / perPage);
+  // Without a total, the next_cursor alone says whether another page exists
+  const totalPages = total === null ? null : Math.ceil(total / perPage);
+  const lastPage = totalPages === null ? !hasMore : page >= totalPages;
+  const showPagination = totalPages === null ? page > 1 || hasMore : totalPages > 1;
 
   return (
     <div>
@@ -262,7 +267,7 @@ export default function DecisionsPage() {
       </div>
 
       {/* Pagination */}
-      {totalPages > 1 && (
+      {showPagination && (
         <div className="mt-6 flex items-center justify-between">
           <button
             onClick={() => setPage((p) => Math.max(1, p - 1))}
@@ -272,11 +277,12 @@ export default function DecisionsPage() {
             Previous
           </button>
           <span className="text-sm text-zinc-500">
-            Page {page} of {totalPages}
+            Page {page}
+            {totalPages !== null && ` of ${totalPages}`}
           </span>
           <button
-            onClick={() => setPage((p) => Math.min(totalPages, p + 1))}
-            disabled={page >= totalPages}
+            onClick={() => setPage((p) => p + 1)}
+            disabled={lastPage}
             className="rounded-lg border border-zinc-700 px-4 py-2 text-sm text-zinc-300 transition hover:bg-zinc-800 disabled:opacity-40"
           >
             Next
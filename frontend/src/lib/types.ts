@@ -34,9 +34,12 @@ export interface DecisionDetail extends Decision {
 
 export interface PaginatedDecisions {
   items: Decision[];
-  total: number;
-  page: number;
+  // total is null for total=none, the default on cursor requests; page is
+  // null on cursor requests
+  total: number | null;
+  page: number | null;
   per_page: number;
+  next_cursor?: string | null;
 }
 
 export interface SearchResult {